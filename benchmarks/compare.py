@@ -0,0 +1,236 @@
+"""
+Compare two benchmark runs made by benchmarks/run.py.
+
+For each benchmark, the change of the median time per operation is
+estimated with a 95% bootstrap confidence interval: the samples of both
+runs are resampled with replacement and the ratio of the medians is
+computed for each resampling.
+
+The machine speed can change between two runs, or during a run. The
+benchmarks are sampled in turn, so each sample is divided by the sample of
+the reference benchmark (pure Python work independent of santorinai)
+taken at the same time, when both runs have it.
+
+A benchmark of a gated module (santorinai.board and santorinai.tester by
+default) is a regression when its median is slower by more than the
+threshold and the whole confidence interval is slower, so noise alone
+does not fail the gate. The exit code is 1 if there is a regression.
+
+Usage, from the root of the project:
+    python -m benchmarks.run --out base.json
+    # ... change the code ...
+    python -m benchmarks.run --out new.json
+    python -m benchmarks.compare base.json new.json --threshold 0.05
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+from typing import List, Tuple
+
+
+def bootstrap_ratio(
+    base_samples: List[float],
+    new_samples: List[float],
+    nb_resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float, float]:
+    """
+    Estimate the ratio of the medians of two sets of samples
+
+    Args:
+        base_samples (list): the samples of the base run
+        new_samples (list): the samples of the new run
+        nb_resamples (int): the number of bootstrap resamples
+        confidence (float): the confidence level of the interval
+        seed (int): the seed of the resampling, for reproducible results
+
+    Returns:
+        float: the ratio new median / base median
+        float: the lower bound of the confidence interval
+        float: the upper bound of the confidence interval
+    """
+    rng = random.Random(seed)
+    ratio = statistics.median(new_samples) / statistics.median(base_samples)
+
+    ratios = sorted(
+        statistics.median(rng.choices(new_samples, k=len(new_samples)))
+        / statistics.median(rng.choices(base_samples, k=len(base_samples)))
+        for _ in range(nb_resamples)
+    )
+    tail = (1 - confidence) / 2
+    lower = ratios[int(tail * (nb_resamples - 1))]
+    upper = ratios[int((1 - tail) * (nb_resamples - 1))]
+    return ratio, lower, upper
+
+
+# The benchmark measuring the speed of the machine
+REFERENCE = "reference.python_loop"
+
+
+def get_normalized_samples(results: dict, name: str, reference: str) -> List[float]:
+    """
+    Get the samples of a benchmark divided by the samples of the reference
+    benchmark taken at the same time, or the raw samples without reference
+
+    Args:
+        results (dict): the results of a run
+        name (str): the benchmark
+        reference (str): the reference benchmark, None to keep the raw samples
+
+    Returns:
+        list: the samples
+    """
+    samples = results["benchmarks"][name]["samples"]
+    if reference is None or reference not in results["benchmarks"]:
+        return samples
+
+    reference_samples = results["benchmarks"][reference]["samples"]
+    return [
+        sample / reference_sample
+        for sample, reference_sample in zip(samples, reference_samples)
+    ]
+
+
+def compare_results(
+    base: dict,
+    new: dict,
+    threshold: float = 0.05,
+    gated_modules: Tuple[str, ...] = ("board", "tester"),
+    nb_resamples: int = 2000,
+    confidence: float = 0.95,
+    reference: str = REFERENCE,
+) -> List[dict]:
+    """
+    Compare the benchmarks present in two runs
+
+    Args:
+        base (dict): the results of the base run
+        new (dict): the results of the new run
+        threshold (float): the relative slowdown allowed, 0.05 for 5%
+        gated_modules (tuple): the modules whose slowdowns are regressions
+        nb_resamples (int): the number of bootstrap resamples
+        confidence (float): the confidence level of the intervals
+        reference (str): the benchmark measuring the speed of the machine,
+            None to compare the raw timings
+
+    Returns:
+        list: a comparison per benchmark, with its name, the relative
+            change of its median and its confidence interval (positive
+            when slower), and whether it is a regression
+    """
+    if reference not in base["benchmarks"] or reference not in new["benchmarks"]:
+        reference = None
+
+    comparisons = []
+    for name, base_result in base["benchmarks"].items():
+        new_result = new["benchmarks"].get(name)
+        if new_result is None or name == reference:
+            continue
+
+        ratio, lower, upper = bootstrap_ratio(
+            get_normalized_samples(base, name, reference),
+            get_normalized_samples(new, name, reference),
+            nb_resamples,
+            confidence,
+        )
+        gated = name.split(".")[0] in gated_modules
+        comparisons.append(
+            {
+                "name": name,
+                "base_median": base_result["median"],
+                "new_median": new_result["median"],
+                "change": ratio - 1,
+                "change_lower": lower - 1,
+                "change_upper": upper - 1,
+                "gated": gated,
+                "regression": gated and ratio - 1 > threshold and lower > 1,
+            }
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: List[dict]) -> str:
+    """
+    Format the comparisons as a table
+    """
+    lines = [f"{'Benchmark':<52} {'change':>8}  {'confidence interval':<20}"]
+    for comparison in comparisons:
+        status = "REGRESSION" if comparison["regression"] else ""
+        if not status and not comparison["gated"]:
+            status = "(not gated)"
+        interval = (
+            f"[{comparison['change_lower']:+.1%}, {comparison['change_upper']:+.1%}]"
+        )
+        lines.append(
+            f"{comparison['name']:<52} {comparison['change']:>+8.1%}  "
+            f"{interval:<20} {status}"
+        )
+    return "\n".join(lines)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("base", help="The JSON results of the base run")
+    parser.add_argument("new", help="The JSON results of the new run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="The relative slowdown allowed, 0.05 for 5%%",
+    )
+    parser.add_argument(
+        "--modules",
+        default="board,tester",
+        help="The modules whose slowdowns fail the comparison, comma separated",
+    )
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Compare the raw timings, without the reference benchmark",
+    )
+    parser.add_argument("--resamples", type=int, default=2000)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--out", help="A JSON file for the comparisons")
+    args = parser.parse_args(args)
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    comparisons = compare_results(
+        base,
+        new,
+        args.threshold,
+        tuple(args.modules.split(",")),
+        args.resamples,
+        args.confidence,
+        None if args.raw else REFERENCE,
+    )
+    print(format_comparisons(comparisons))
+
+    missing = set(base["benchmarks"]) ^ set(new["benchmarks"])
+    if missing:
+        print(f"Benchmarks in a single run: {', '.join(sorted(missing))}")
+
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(comparisons, f, indent=2)
+
+    regressions = [c["name"] for c in comparisons if c["regression"]]
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) above {args.threshold:.0%}: "
+            f"{', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+"""
+Benchmarks of the board primitives and of full games.
+
+Each benchmark times an operation on a fixed set of positions taken from
+seeded random games, so the results of two runs are comparable. A sample
+runs the benchmark for at least min_time seconds with the garbage
+collector disabled, and the benchmarks are sampled in turn repeat times.
+The results are written as JSON:
+
+    {
+        "metadata": {"python": ..., "platform": ..., "commit": ..., ...},
+        "benchmarks": {
+            "board.copy": {
+                "unit": "seconds per operation",
+                "samples": [...],
+                "mean": ..., "median": ..., "stdev": ..., "min": ...,
+                "ops_per_second": ...
+            },
+            ...
+        }
+    }
+
+Usage, from the root of the project:
+    python -m benchmarks.run --out benchmarks.json
+    python -m benchmarks.run --filter board. --repeat 50
+"""
+
+import argparse
+import gc
+import json
+import pickle
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+from santorinai.board import Board
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.tester import Tester
+
+# The benchmarks by name, "<module>.<operation>"
+# A benchmark takes the positions and returns the duration of a sample
+# and its number of operations
+BENCHMARKS: Dict[str, Callable[[List[Board]], Tuple[float, int]]] = {}
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark function under a name
+    """
+
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+def get_positions(nb_games: int = 20, seed: int = 0) -> List[Board]:
+    """
+    Get the positions of the move phase of seeded random games
+
+    Args:
+        nb_games (int): the number of games
+        seed (int): the seed of the games
+
+    Returns:
+        list: the boards, the playing player having a move to play
+    """
+    tester = Tester()
+    tester.verbose_level = 0
+    tester.display_board = False
+    players = [RandomPlayer(1), RandomPlayer(2)]
+
+    positions = []
+    for game_nb in range(nb_games):
+        record = tester.play_game(players, seed=seed + game_nb)
+        board = Board(2)
+        for position in record.placements:
+            board.place_pawn(position)
+        for pawn_order, move, build in record.moves:
+            if board.is_game_over():
+                break
+            positions.append(board.copy())
+            board.play_move(pawn_order, move, build)
+    return positions
+
+
+def get_playing_pawns(positions: List[Board]):
+    return [
+        pawn
+        for board in positions
+        for pawn in board.get_player_pawns(board.player_turn)
+    ]
+
+
+@benchmark("board.get_possible_movement_positions")
+def bench_movement_positions(positions):
+    pawns = get_playing_pawns(positions)
+    start = time.perf_counter()
+    for pawn in pawns:
+        pawn.board.get_possible_movement_positions(pawn)
+    return time.perf_counter() - start, len(pawns)
+
+
+@benchmark("board.get_possible_building_positions")
+def bench_building_positions(positions):
+    pawns = get_playing_pawns(positions)
+    start = time.perf_counter()
+    for pawn in pawns:
+        pawn.board.get_possible_building_positions(pawn)
+    return time.perf_counter() - start, len(pawns)
+
+
+@benchmark("board.get_possible_movement_and_building_positions")
+def bench_movement_and_building_positions(positions):
+    pawns = get_playing_pawns(positions)
+    start = time.perf_counter()
+    for pawn in pawns:
+        pawn.board.get_possible_movement_and_building_positions(pawn)
+    return time.perf_counter() - start, len(pawns)
+
+
+@benchmark("board.play_move")
+def bench_play_move(positions):
+    # The first possible action of each position, on a copy of the board
+    moves = []
+    for board in positions:
+        board = board.copy()
+        for pawn in board.get_player_pawns(board.player_turn):
+            action = next(board.iter_actions(pawn), None)
+            if action is not None:
+                moves.append((board, pawn.order, *action))
+                break
+
+    start = time.perf_counter()
+    for board, pawn_order, move, build in moves:
+        board.play_move(pawn_order, move, build)
+    return time.perf_counter() - start, len(moves)
+
+
+@benchmark("board.copy")
+def bench_copy(positions):
+    start = time.perf_counter()
+    for board in positions:
+        board.copy()
+    return time.perf_counter() - start, len(positions)
+
+
+@benchmark("board.to_text")
+def bench_to_text(positions):
+    start = time.perf_counter()
+    for board in positions:
+        board.to_text()
+    return time.perf_counter() - start, len(positions)
+
+
+@benchmark("board.from_text")
+def bench_from_text(positions):
+    texts = [board.to_text() for board in positions]
+    start = time.perf_counter()
+    for text in texts:
+        Board.from_text(text)
+    return time.perf_counter() - start, len(texts)
+
+
+@benchmark("board.to_bytes")
+def bench_to_bytes(positions):
+    start = time.perf_counter()
+    for board in positions:
+        board.to_bytes()
+    return time.perf_counter() - start, len(positions)
+
+
+@benchmark("board.from_bytes")
+def bench_from_bytes(positions):
+    data = [board.to_bytes() for board in positions]
+    start = time.perf_counter()
+    for board_data in data:
+        Board.from_bytes(board_data)
+    return time.perf_counter() - start, len(data)
+
+
+@benchmark("board.pickle")
+def bench_pickle(positions):
+    # A pickle round trip, as done to send a board to a worker process
+    start = time.perf_counter()
+    for board in positions:
+        pickle.loads(pickle.dumps(board))
+    return time.perf_counter() - start, len(positions)
+
+
+# The board subclasses are pickled with the default pickling of their
+# objects, see Board.is_encodable
+class ObjectGraphBoard(Board):
+    pass
+
+
+@benchmark("pickle.object_graph")
+def bench_pickle_object_graph(positions):
+    boards = []
+    for board in positions:
+        board = board.copy()
+        board.__class__ = ObjectGraphBoard
+        boards.append(board)
+
+    start = time.perf_counter()
+    for board in boards:
+        pickle.loads(pickle.dumps(board))
+    return time.perf_counter() - start, len(boards)
+
+
+@benchmark("board.is_game_over")
+def bench_is_game_over(positions):
+    start = time.perf_counter()
+    for board in positions:
+        board.is_game_over()
+    return time.perf_counter() - start, len(positions)
+
+
+@benchmark("tester.random_games")
+def bench_random_games(positions, nb_games=10):
+    tester = Tester()
+    tester.verbose_level = 0
+    tester.display_board = False
+    players = [RandomPlayer(1), RandomPlayer(2)]
+
+    start = time.perf_counter()
+    for game_nb in range(nb_games):
+        tester.play_game(players, seed=game_nb)
+    return time.perf_counter() - start, nb_games
+
+
+@benchmark("reference.python_loop")
+def bench_reference(positions):
+    # Pure Python work independent of santorinai, measuring the speed of the
+    # machine during the run, see benchmarks/compare.py
+    start = time.perf_counter()
+    for board in positions:
+        squares = {}
+        for x in range(5):
+            for y in range(5):
+                squares[(x, y)] = sorted([x, y, x + y])
+    return time.perf_counter() - start, len(positions)
+
+
+def get_metadata() -> dict:
+    """
+    Get the context of a benchmark run: machine, Python and code versions
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "commit": commit,
+    }
+
+
+def get_sample(function, positions: List[Board], min_time: float) -> float:
+    """
+    Run a benchmark for at least min_time seconds, without garbage collection
+
+    Returns:
+        float: the mean duration of an operation in seconds
+    """
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        total_duration, total_operations = 0.0, 0
+        while total_duration < min_time or total_operations == 0:
+            duration, nb_operations = function(positions)
+            total_duration += duration
+            total_operations += nb_operations
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return total_duration / total_operations
+
+
+def run_benchmarks(
+    names: List[str] = None,
+    repeat: int = 20,
+    warmup: int = 2,
+    nb_games: int = 20,
+    min_time: float = 0.05,
+) -> dict:
+    """
+    Run benchmarks
+
+    Args:
+        names (list): the benchmarks to run, all of them if None
+        repeat (int): the number of samples of each benchmark
+        warmup (int): the number of runs before the samples
+        nb_games (int): the number of games the positions are taken from
+        min_time (float): the minimum duration of a sample in seconds
+
+    Returns:
+        dict: the results, see the module documentation
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+    positions = get_positions(nb_games)
+
+    for name in names:
+        for _ in range(warmup):
+            BENCHMARKS[name](positions)
+
+    # The benchmarks are sampled in turn, so a slow period of the machine
+    # affects all of them instead of a single one
+    samples = {name: [] for name in names}
+    for _ in range(repeat):
+        for name in names:
+            samples[name].append(get_sample(BENCHMARKS[name], positions, min_time))
+
+    results = {}
+    for name in names:
+        results[name] = {
+            "unit": "seconds per operation",
+            "samples": samples[name],
+            "mean": statistics.mean(samples[name]),
+            "median": statistics.median(samples[name]),
+            "stdev": statistics.stdev(samples[name]) if repeat > 1 else 0.0,
+            "min": min(samples[name]),
+            "ops_per_second": 1 / statistics.median(samples[name]),
+        }
+
+    metadata = get_metadata()
+    metadata.update(
+        {
+            "repeat": repeat,
+            "warmup": warmup,
+            "min_time": min_time,
+            "nb_positions": len(positions),
+        }
+    )
+    return {"metadata": metadata, "benchmarks": results}
+
+
+def format_results(results: dict) -> str:
+    """
+    Format the results as a table
+    """
+    lines = [f"{'Benchmark':<52} {'median':>12} {'stdev':>8} {'ops/s':>12}"]
+    for name, result in results["benchmarks"].items():
+        stdev = result["stdev"] / result["median"] * 100
+        lines.append(
+            f"{name:<52} {result['median'] * 1e6:>9.2f} us {stdev:>7.1f}% "
+            f"{result['ops_per_second']:>12.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the SantorinAI benchmarks")
+    parser.add_argument("--out", help="The JSON file of the results")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument(
+        "--filter", default="", help="Only run the benchmarks containing this text"
+    )
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if not names:
+        parser.error(f"No benchmark matches {args.filter!r}")
+
+    results = run_benchmarks(names, args.repeat, args.warmup, args.games, args.min_time)
+    print(format_results(results))
+
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written in {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
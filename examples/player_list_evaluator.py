@@ -1,4 +1,6 @@
 from santorinai.tester import Tester
+from santorinai.sprt import SPRT
+from santorinai.ratings import Ratings
 from santorinai.player_examples.random_player import RandomPlayer
 from santorinai.player_examples.first_choice_player import FirstChoicePlayer
 from santorinai.player_examples.basic_player import BasicPlayer
@@ -22,9 +24,16 @@ tester.verbose_level = 0
 
 # tester.delay_between_moves = 0.5  # Delay between each move in seconds
 # tester.display_board = True  # Display a graphical view of the board in a window
+# tester.checkpoint_dir = "checkpoints"  # Resume the evaluation if interrupted
+# tester.records_path = "records.jsonl"  # Save the record of every game
+# tester.profile_dir = "profiles"  # Profile the games, see profiles/report.txt
+# tester.profile_every = 10  # Profile one game out of 10
 
 nb_games = 1000
+use_sprt = False  # Stop a pairing as soon as one player is clearly stronger
 results = {}  # We will count the number of victories for each player
+nb_games_played = {}  # Number of games played for each pairing
+ratings = Ratings()  # Elo-like ratings of the players, updated after each game
 
 # Initialize global victory type evaluator
 dic_global_win_lose_type = {}
@@ -34,6 +43,7 @@ for i, player1_class in enumerate(players_classes):
     # Get the name of the player
     player1_name = player1_class(i).name()
     results[player1_name] = {}
+    nb_games_played[player1_name] = {}
 
     for j, player2_class in enumerate(players_classes):
         if i == j:
@@ -55,11 +65,20 @@ for i, player1_class in enumerate(players_classes):
         # Play 100 games
         victories_number, dic_global_win_lose_type[f"{p1.name()}vs{p2.name()}"] = (
             tester.play_1v1(
-                p1, p2, nb_games=nb_games, dic_win_lose_type=dic_win_lose_type
+                p1,
+                p2,
+                nb_games=nb_games,
+                dic_win_lose_type=dic_win_lose_type,
+                sprt=SPRT(elo0=-50, elo1=50) if use_sprt else None,
+                on_game_end=ratings.add_record,
             )
         )
 
         results[player1_name][player2_name] = victories_number[player1_name]
+        nb_games_played[player1_name][player2_name] = sum(victories_number.values())
+
+        print("\nCurrent ratings:")
+        print(ratings)
 
 print(f"dic_global_win_lose_type = \n{dic_global_win_lose_type}")
 
@@ -89,9 +108,8 @@ for i in range(num_players):
         if i != j:
             player1 = players[i]
             player2 = players[j]
-            row.append(
-                str(int((results[player1].get(player2, "") / nb_games) * 100)) + "%"
-            )
+            win_rate = results[player1][player2] / nb_games_played[player1][player2]
+            row.append(str(int(win_rate * 100)) + "%")
         else:
             row.append("-")
     rows.append(row)
@@ -109,9 +127,12 @@ winning_rates = {}
 
 for player, opponents in results.items():
     total_wins = sum(opponents.values())
-    winning_rate = total_wins / (nb_games * len(opponents))
+    winning_rate = total_wins / sum(nb_games_played[player].values())
     winning_rates[player] = winning_rate
 
 print("\nGlobal Winning Rates:")
 for player, winning_rate in winning_rates.items():
     print(f" - {player}: {winning_rate:.2%}")
+
+print("\nRatings:")
+print(ratings)
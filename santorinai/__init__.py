@@ -2,6 +2,8 @@ from .board import Board
 from .player import Player
 from .tester import Tester
 from .pawn import Pawn
+from .sprt import SPRT
+from .ratings import Ratings
 from .player_examples.random_player import RandomPlayer
 from .player_examples.first_choice_player import FirstChoicePlayer
 from .player_examples.basic_player import BasicPlayer
@@ -0,0 +1,323 @@
+"""
+Play many games concurrently with players waiting on remote engines.
+
+Usage:
+    server = await serve_player(BasicPlayer(1), port=8765)
+    remote_player = SocketPlayer(1, "127.0.0.1", 8765)
+    await remote_player.fetch_name()
+    tester = AsyncTester()
+    wins, details = await tester.play_match_async(
+        [remote_player, RandomPlayer(2)], nb_games=500, max_concurrent_games=200
+    )
+"""
+
+import asyncio
+import cProfile
+import inspect
+import json
+from typing import List, Optional, Tuple
+
+from santorinai.board import Board
+from santorinai.game_record import GameRecord, to_position
+from santorinai.pawn import Pawn
+from santorinai.player import Player
+from santorinai.profiling import clear_profiles, get_game_profile_path, save_profile
+from santorinai.tester import Tester, get_game_seed
+
+
+class AsyncPlayer(Player):
+    """
+    A player whose choices are coroutines, for players waiting on I/O.
+
+    Several games are played at the same time with the same player object:
+    the player number must be read from the board (board.player_turn)
+    rather than from self.player_number, which changes from game to game.
+    """
+
+    async def place_pawn(self, board: Board, pawn: Pawn) -> Tuple[int, int]:
+        """
+        Place a pawn given a board
+        :param board: the board
+        :param pawn: the pawn that needs to be placed
+        :return: a position of the form (x, y)
+        """
+        pass
+
+    async def play_move(
+        self, board: Board
+    ) -> Tuple[int, Tuple[int, int], Tuple[int, int]]:
+        """
+        Choose a pawn and play a move given a board
+        :param board: the board
+        :return: the pawn order, the move position and the build position
+        """
+        pass
+
+
+class AsyncTester(Tester):
+    """
+    Run games concurrently in an asyncio event loop.
+    Both AsyncPlayer and regular Player objects can play.
+    """
+
+    async def play_match_async(
+        self,
+        players: List[Player],
+        nb_games: int = 1,
+        max_concurrent_games: int = 100,
+        dic_win_lose_type=None,
+        on_game_end=None,
+    ):
+        """
+        Play games between 2 or 3 players, up to max_concurrent_games at a time.
+        The seats are rotated from one game to the next, as in Tester.play_match.
+
+        Args:
+            players (list): the players, 2 or 3 objects of the Player class
+            nb_games (int): the number of games to play
+            max_concurrent_games (int): the maximum number of games in progress
+            dic_win_lose_type (dict): the winning and loosing conditions counters
+            on_game_end (callable): a function called with the GameRecord of
+                each game as soon as it is over
+
+        Returns:
+            dict: the number of victories for each player
+            dict: the different types of winning and loosing conditions
+        """
+        player_names = self.check_players(players)
+
+        nb_victories = {player_name: 0 for player_name in player_names}
+
+        if not dic_win_lose_type:
+            dic_win_lose_type = {player_name: {} for player_name in player_names}
+
+        game_numbers = iter(range(nb_games))
+
+        async def play_games():
+            # Each runner plays games until there is no game left
+            for game_nb in game_numbers:
+                shift = game_nb % len(players)
+                seed = None
+                if self.seed is not None:
+                    seed = get_game_seed(self.seed, game_nb)
+                record = await self.play_game_async(
+                    players[shift:] + players[:shift], seed
+                )
+                self.display_message(f"Game {game_nb + 1}: {record}", 1)
+                self.register_game(record, nb_victories, dic_win_lose_type, on_game_end)
+
+        # The games are played concurrently, the whole match is profiled at once
+        profiler = None
+        if self.profile_dir is not None:
+            clear_profiles(self.profile_dir)
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        player_numbers = [player.player_number for player in players]
+        try:
+            await asyncio.gather(
+                *[play_games() for _ in range(min(max_concurrent_games, nb_games))]
+            )
+        finally:
+            # Give the players their number back
+            for player, player_number in zip(players, player_numbers):
+                player.player_number = player_number
+
+            if profiler is not None:
+                profiler.disable()
+                save_profile(profiler, get_game_profile_path(self.profile_dir, 0))
+
+        self.display_results(nb_victories, nb_games)
+        self.report_profiles(players)
+
+        return nb_victories, dic_win_lose_type
+
+    async def play_game_async(
+        self, players: List[Player], seed: int = None
+    ) -> GameRecord:
+        """
+        Play a single game, waiting for the players without blocking the other
+        games. The turns are run by Tester.iter_game.
+
+        Args:
+            players (list): the players, in playing order
+            seed (int): the seed of the game, the players random generators
+                are seeded from it, None to keep their generators. The games
+                are reproducible when the local players are not AsyncPlayer
+                objects: their games never wait, so they do not interleave.
+
+        Returns:
+            GameRecord: the record of the game
+        """
+        player_numbers = [player.player_number for player in players]
+        game = self.iter_game(players, seed=seed)
+        try:
+            player, method_name, args = next(game)
+            while True:
+                # The player objects are shared by the concurrent games
+                player.player_number = players.index(player) + 1
+                answer = await resolve(getattr(player, method_name)(*args))
+                player, method_name, args = game.send(answer)
+        except StopIteration as game_end:
+            return game_end.value
+        finally:
+            for player, player_number in zip(players, player_numbers):
+                player.player_number = player_number
+
+
+async def resolve(choice):
+    """
+    Wait for the choice of an AsyncPlayer, the choice of a Player is returned as is
+    """
+    if inspect.isawaitable(choice):
+        return await choice
+    return choice
+
+
+def board_to_dict(board: Board) -> dict:
+    """
+    Convert a board into a JSON serializable dictionary
+    """
+    return {
+        "nb_players": board.nb_players,
+        "board": board.board,
+        "pawns": [pawn.pos for pawn in board.pawns],
+        "player_turn": board.player_turn,
+        "turn_number": board.turn_number,
+    }
+
+
+def board_from_dict(board_dict: dict) -> Board:
+    """
+    Create a board from a dictionary made by board_to_dict
+    """
+    board = Board(board_dict["nb_players"])
+    board.board = [list(row) for row in board_dict["board"]]
+    for pawn, position in zip(board.pawns, board_dict["pawns"]):
+        pawn.pos = tuple(position)
+    board.player_turn = board_dict["player_turn"]
+    board.turn_number = board_dict["turn_number"]
+    return board
+
+
+class SocketPlayer(AsyncPlayer):
+    """
+    A player whose choices are made by a player server, see serve_player.
+
+    Every request sends the whole board, so a single server can answer
+    the requests of any number of games.
+    A connection is opened for each concurrent request and kept for
+    the next ones.
+    """
+
+    def __init__(
+        self, player_number: int, host: str, port: int, name: str = None, log_level=0
+    ):
+        super().__init__(player_number, log_level)
+        self.host = host
+        self.port = port
+        self.remote_name = name
+        self.idle_connections: List[
+            Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        ] = []
+        self.nb_connections = 0
+
+    def name(self):
+        if self.remote_name is None:
+            raise ValueError("The name of a SocketPlayer should be fetched first")
+        return self.remote_name
+
+    async def fetch_name(self) -> str:
+        """
+        Ask the server for the name of the player
+        """
+        self.remote_name = (await self.request({"type": "name"}))["name"]
+        return self.remote_name
+
+    async def request(self, request: dict) -> dict:
+        if self.idle_connections:
+            reader, writer = self.idle_connections.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            self.nb_connections += 1
+
+        writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        answer = await reader.readline()
+        if not answer:
+            writer.close()
+            raise ConnectionError(f"The player server {self.host}:{self.port} left")
+
+        self.idle_connections.append((reader, writer))
+        return json.loads(answer)
+
+    async def place_pawn(self, board: Board, pawn: Pawn):
+        answer = await self.request(
+            {"type": "place", "board": board_to_dict(board), "pawn": pawn.number}
+        )
+        return to_position(answer["position"])
+
+    async def play_move(self, board: Board):
+        answer = await self.request({"type": "move", "board": board_to_dict(board)})
+        return answer["pawn"], to_position(answer["move"]), to_position(answer["build"])
+
+    async def close(self):
+        """
+        Close the connections to the server
+        """
+        for _, writer in self.idle_connections:
+            writer.close()
+            await writer.wait_closed()
+        self.idle_connections = []
+
+
+async def serve_player(
+    player: Player,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency: Optional[float] = None,
+) -> asyncio.AbstractServer:
+    """
+    Serve a player to SocketPlayer clients, a stand-in for a remote engine.
+    Requests and answers are JSON objects, one per line.
+
+    Args:
+        player (Player): the player choosing the actions
+        host (str): the address to listen on
+        port (int): the port to listen on, 0 to pick a free one
+        latency (float): a delay in seconds before each answer,
+            to simulate a slow engine
+
+    Returns:
+        asyncio.AbstractServer: the running server,
+        server.sockets[0].getsockname() gives its address
+    """
+
+    async def handle_client(reader, writer):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            request = json.loads(line)
+            if request["type"] == "name":
+                answer = {"name": player.name()}
+            else:
+                board = board_from_dict(request["board"])
+                player.player_number = board.player_turn
+                if request["type"] == "place":
+                    pawn = board.pawns[request["pawn"] - 1]
+                    answer = {"position": player.place_pawn(board, pawn)}
+                else:
+                    pawn_order, move, build = player.play_move(board)
+                    answer = {"pawn": pawn_order, "move": move, "build": build}
+
+            if latency:
+                await asyncio.sleep(latency)
+
+            writer.write((json.dumps(answer) + "\n").encode())
+            await writer.drain()
+
+        writer.close()
+
+    return await asyncio.start_server(handle_client, host, port)
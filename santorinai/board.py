@@ -1,5 +1,84 @@
 from santorinai.pawn import Pawn
-from typing import Tuple, List
+import struct
+from itertools import chain, product
+from typing import Dict, Iterator, Tuple, List
+import random
+
+# Precomputed tables of the 5x5 grid, for the board queries and the players
+BOARD_SIZE = 5
+
+# All the positions, x first
+SQUARES = tuple((x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE))
+
+# The 8 directions around a position
+DIRECTIONS = tuple(
+    (dx, dy) for dx in range(-1, 2) for dy in range(-1, 2) if dx != 0 or dy != 0
+)
+
+# Position -> the position in each direction that is on the board
+DIRECTION_SQUARES = {
+    (x, y): {
+        (dx, dy): (x + dx, y + dy)
+        for dx, dy in DIRECTIONS
+        if 0 <= x + dx < BOARD_SIZE and 0 <= y + dy < BOARD_SIZE
+    }
+    for x, y in SQUARES
+}
+
+# Position -> the adjacent positions, in the order of DIRECTIONS
+NEIGHBOURS = {
+    position: tuple(direction_squares.values())
+    for position, direction_squares in DIRECTION_SQUARES.items()
+}
+
+# Position -> its bit in a 25 bits mask of the board
+SQUARE_BITS = {(x, y): 1 << (x * BOARD_SIZE + y) for x, y in SQUARES}
+
+# Position -> the mask of the adjacent positions
+ADJACENCY_MASKS = {
+    position: sum(SQUARE_BITS[neighbour] for neighbour in neighbours)
+    for position, neighbours in NEIGHBOURS.items()
+}
+
+# Position -> its letter in the text format of the boards, "a" to "y"
+SQUARE_LETTERS = {
+    position: chr(ord("a") + square_nb) for square_nb, position in enumerate(SQUARES)
+}
+LETTER_SQUARES = {letter: position for position, letter in SQUARE_LETTERS.items()}
+
+# Column of levels (x) -> its digits in the text format of the boards, and back
+COLUMN_TEXTS = {
+    levels: "".join(map(str, levels)) for levels in product(range(5), repeat=BOARD_SIZE)
+}
+TEXT_COLUMNS = {text: levels for levels, text in COLUMN_TEXTS.items()}
+
+# The binary format of the boards, see Board.to_bytes
+BOARD_STRUCT = struct.Struct("<25sB6sBHB")
+NOT_PLACED = 255
+
+# The attributes of a board, all restored from its binary format
+BOARD_ATTRIBUTES = frozenset(
+    [
+        "board",
+        "board_size",
+        "nb_pawns",
+        "nb_players",
+        "occupancy",
+        "pawns",
+        "player_pawns",
+        "player_turn",
+        "turn_number",
+        "winner_player_number",
+    ]
+)
+
+# The slices of the encoded levels of each column (x)
+LEVEL_COLUMNS = tuple(
+    slice(x * BOARD_SIZE, (x + 1) * BOARD_SIZE) for x in range(BOARD_SIZE)
+)
+
+# Position -> its index in SQUARES
+SQUARE_INDEXES = {position: square_nb for square_nb, position in enumerate(SQUARES)}
 
 
 class Board:
@@ -53,8 +132,10 @@ class Board:
             pawn_order = (pawn_number - 1) // number_of_players + 1  # 1 or 2
             self.pawns.append(Pawn(pawn_number, pawn_order, player_number))
 
+        self.index_pawns()
+
         # Initialize the board
-        self.board_size = 5
+        self.board_size = BOARD_SIZE
         self.board = [
             [0 for _ in range(self.board_size)] for _ in range(self.board_size)
         ]
@@ -71,6 +152,25 @@ class Board:
         self.turn_number = 1
         self.player_turn = 1
 
+    def index_pawns(self):
+        """
+        Indexes the pawns of the board by player and by position.
+        The pawns then keep the position index up to date when they move,
+        it has to be called again if self.pawns is replaced.
+        """
+        # The pawns of each player, by order
+        self.player_pawns: Dict[int, List[Pawn]] = {
+            player_number: [] for player_number in range(1, self.nb_players + 1)
+        }
+        # Position -> pawn on it
+        self.occupancy: Dict[Tuple[int, int], Pawn] = {}
+
+        for pawn in self.pawns:
+            pawn.board = self
+            self.player_pawns.setdefault(pawn.player_number, []).append(pawn)
+            if pawn.pos[0] is not None and pawn.pos[1] is not None:
+                self.occupancy[pawn.pos] = pawn
+
     def is_move_possible(
         self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]
     ) -> Tuple[bool, str]:
@@ -109,7 +209,7 @@ class Board:
             return False, "It is not possible to move two levels in one move."
 
         # Check if the end position is adjacent to the start position
-        if not self.is_position_adjacent(start_pos, end_pos):
+        if not ADJACENCY_MASKS[start_pos] & SQUARE_BITS[end_pos]:
             return False, "It is not possible to move that far."
 
         # Check if the end position is not occupied by another pawn
@@ -144,9 +244,13 @@ class Board:
         Returns:
             bool: True if the positions are adjacent, False otherwise.
         """
-        x1, y1 = position1
-        x2, y2 = position2
-        return abs(x1 - x2) <= 1 and abs(y1 - y2) <= 1 and (x1 != x2 or y1 != y2)
+        try:
+            return ADJACENCY_MASKS[position1] & SQUARE_BITS[position2] != 0
+        except (KeyError, TypeError):
+            # Not a position of the board
+            x1, y1 = position1
+            x2, y2 = position2
+            return abs(x1 - x2) <= 1 and abs(y1 - y2) <= 1 and (x1 != x2 or y1 != y2)
 
     def is_pawn_on_position(self, position: Tuple[int, int]):
         """
@@ -158,10 +262,28 @@ class Board:
         Returns:
             bool: True if a pawn is on the position, False otherwise.
         """
-        for pawn in self.pawns:
-            if pawn.pos == position:
-                return True
-        return False
+        try:
+            return position in self.occupancy
+        except TypeError:
+            # Not hashable, a list for example
+            return tuple(position) in self.occupancy
+
+    def update_pawn_position(
+        self, pawn: Pawn, old_position: Tuple[int, int], new_position: Tuple[int, int]
+    ):
+        """
+        Updates the occupancy index when a pawn of the board moves,
+        called by the pawn.
+
+        Args:
+            pawn (Pawn): The moving pawn.
+            old_position (tuple): The position [x, y] the pawn leaves.
+            new_position (tuple): The position [x, y] the pawn goes to.
+        """
+        if self.occupancy.get(old_position) is pawn:
+            del self.occupancy[old_position]
+        if new_position[0] is not None and new_position[1] is not None:
+            self.occupancy[tuple(new_position)] = pawn
 
     def is_build_possible(
         self, builder_position: Tuple[int, int], build_position: Tuple[int, int]
@@ -194,7 +316,7 @@ class Board:
             return False, "It is not possible to build on a terminated tower."
 
         # Check if the build position is adjacent to the builder position
-        if not self.is_position_adjacent(builder_position, build_position):
+        if not ADJACENCY_MASKS[builder_position] & SQUARE_BITS[build_position]:
             return False, "It is not possible to build that far."
 
         # Check if the build position is not occupied by another pawn
@@ -213,12 +335,7 @@ class Board:
         Returns:
             Pawn: The pawn of the current player.
         """
-        pawns = []
-        for pawn in self.pawns:
-            if pawn.player_number == player_number:
-                pawns.append(pawn)
-
-        return pawns
+        return list(self.player_pawns.get(player_number, ()))
 
     def get_player_pawn(self, player_number: int, pawn_number: int) -> Pawn:
         """
@@ -263,10 +380,8 @@ class Board:
         Returns:
             Pawn: The first unplaced pawn of the player.
         """
-        for pawn in self.pawns:
-            if pawn.player_number == player_number and (
-                pawn.pos[0] is None or pawn.pos[1] is None
-            ):
+        for pawn in self.player_pawns.get(player_number, ()):
+            if pawn.pos[0] is None or pawn.pos[1] is None:
                 return pawn
 
     def get_possible_movement_positions(self, pawn: Pawn) -> List[Tuple[int, int]]:
@@ -285,25 +400,22 @@ class Board:
         # Every position is possible except the ones occupied by other pawns
         # and the ones where tower are terminated
         if pawn.pos[0] is None or pawn.pos[1] is None:
-            for x in range(self.board_size):
-                for y in range(self.board_size):
-                    if self.board[x][y] != 4 and not self.is_pawn_on_position((x, y)):
-                        possible_moves.append((x, y))
+            for x, y in SQUARES:
+                if self.board[x][y] != 4 and not self.is_pawn_on_position((x, y)):
+                    possible_moves.append((x, y))
             return possible_moves
 
         # Get all the possible moves from the 8 positions around the pawn
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                # We can't move on the same position
-                if x == 0 and y == 0:
-                    continue
-
-                new_pawn_pos = (pawn.pos[0] + x, pawn.pos[1] + y)
-
-                # Check if the move is possible
-                move_possible, _ = self.is_move_possible(pawn.pos, new_pawn_pos)
-                if move_possible:
-                    possible_moves.append((pawn.pos[0] + x, pawn.pos[1] + y))
+        max_level = self.board[pawn.pos[0]][pawn.pos[1]] + 1
+        for new_pawn_pos in NEIGHBOURS[pawn.pos]:
+            # Not on a terminated tower, at most one level up, not on another pawn
+            level = self.board[new_pawn_pos[0]][new_pawn_pos[1]]
+            if (
+                level != 4
+                and level <= max_level
+                and not self.is_pawn_on_position(new_pawn_pos)
+            ):
+                possible_moves.append(new_pawn_pos)
 
         return possible_moves
 
@@ -323,16 +435,12 @@ class Board:
 
         possible_builds = []
 
-        # Get all the possible builds
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                if x == 0 and y == 0:
-                    continue
-                build_possible, _ = self.is_build_possible(
-                    pawn.pos, (pawn.pos[0] + x, pawn.pos[1] + y)
-                )
-                if build_possible:
-                    possible_builds.append((pawn.pos[0] + x, pawn.pos[1] + y))
+        # Get all the possible builds, not on a terminated tower or another pawn
+        for build_pos in NEIGHBOURS[pawn.pos]:
+            if self.board[build_pos[0]][build_pos[1]] != 4 and (
+                not self.is_pawn_on_position(build_pos)
+            ):
+                possible_builds.append(build_pos)
 
         return possible_builds
 
@@ -343,26 +451,129 @@ class Board:
         :return: A list of all the possible moves and builds for the given pawn.
         [(move_position, build_position), ...]
         """
+        return list(self.iter_actions(pawn))
 
+    def iter_actions(self, pawn: Pawn) -> Iterator[Tuple[Tuple[int, int], Tuple]]:
+        """
+        Iterates over the possible moves and builds for a given pawn, in the order
+        of get_possible_movement_and_building_positions.
+        The actions are generated as they are consumed and the pawn is not moved,
+        stopping at the first interesting action saves generating the others.
+
+        Args:
+            pawn (Pawn): The pawn for which to get the possible moves and builds.
+
+        Yields:
+            tuple: (move_position, build_position), the build position is None
+            if the pawn is not placed yet.
+        """
         if pawn.pos[0] is None or pawn.pos[1] is None:
             # Pawn not placed yet
-            possible_spawn_positions = self.get_possible_movement_positions(pawn)
-            return [(position, None) for position in possible_spawn_positions]
+            for position in self.get_possible_movement_positions(pawn):
+                yield position, None
+            return
 
-        possible_moves_and_builds = []
-        original_position = (pawn.pos[0], pawn.pos[1])
-        possible_moves = self.get_possible_movement_positions(pawn)
+        for move in self.get_possible_movement_positions(pawn):
+            for build in self.iter_builds_after_move(pawn, move):
+                yield move, build
+
+    def iter_builds_after_move(
+        self, pawn: Pawn, move_position: Tuple[int, int]
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Iterates over the possible builds of a pawn once moved to a position,
+        without moving it.
+
+        Args:
+            pawn (Pawn): The pawn to move.
+            move_position (tuple): The position [x, y] the pawn moves to.
+
+        Yields:
+            tuple: The possible build positions, in the order of
+            get_possible_building_positions.
+        """
+        origin = pawn.pos
+        for build in NEIGHBOURS[move_position]:
+            # The position the pawn leaves is free
+            if self.board[build[0]][build[1]] != 4 and (
+                build == origin or not self.is_pawn_on_position(build)
+            ):
+                yield build
 
-        for move in possible_moves:
-            pawn.move(move)
-            possible_builds = self.get_possible_building_positions(pawn)
-            for build in possible_builds:
-                possible_moves_and_builds.append((move, build))
+    def get_adjacent_positions(
+        self, position: Tuple[int, int]
+    ) -> Tuple[Tuple[int, int], ...]:
+        """
+        Gets the positions of the board adjacent to a position.
+
+        Args:
+            position (tuple): The position [x, y], on the board.
+
+        Returns:
+            tuple: The up to 8 positions around the given position.
+        """
+        return NEIGHBOURS[position]
 
-        # Move the pawn back to its original position
-        pawn.move(original_position)
+    def sample_random_move(
+        self, rng: random.Random = None
+    ) -> Tuple[int, Tuple[int, int], Tuple[int, int]]:
+        """
+        Draws a random move of the playing player, all the pawns being placed.
+        Every (pawn, move, build) action is equally likely, as when choosing in
+        the actions listed by get_possible_movement_and_building_positions,
+        without listing them: each move is weighted by its number of builds.
+
+        Args:
+            rng (random.Random): The random generator, the random module if None.
 
-        return possible_moves_and_builds
+        Returns:
+            tuple: The pawn order, the move position and the build position,
+            (None, None, None) if the player can't move.
+        """
+        if rng is None:
+            rng = random
+
+        occupied = self.occupancy
+
+        # Count the possible builds after each possible move
+        moves = []
+        nb_actions = 0
+        for pawn in self.player_pawns[self.player_turn]:
+            origin = pawn.pos
+            level = self.board[origin[0]][origin[1]]
+            for move in NEIGHBOURS[origin]:
+                move_level = self.board[move[0]][move[1]]
+                if move_level == 4 or move_level > level + 1 or move in occupied:
+                    continue
+
+                # The pawn can build where it was
+                nb_builds = 0
+                for build in NEIGHBOURS[move]:
+                    if self.board[build[0]][build[1]] != 4 and (
+                        build not in occupied or build == origin
+                    ):
+                        nb_builds += 1
+
+                moves.append((pawn, move, nb_builds))
+                nb_actions += nb_builds
+
+        if nb_actions == 0:
+            return None, None, None
+
+        # Find the move and the build of the drawn action
+        action_nb = rng.randrange(nb_actions)
+        for pawn, move, nb_builds in moves:
+            if action_nb >= nb_builds:
+                action_nb -= nb_builds
+                continue
+
+            for build in NEIGHBOURS[move]:
+                if self.board[build[0]][build[1]] != 4 and (
+                    build not in occupied or build == pawn.pos
+                ):
+                    if action_nb == 0:
+                        return pawn.order, move, build
+                    action_nb -= 1
 
     def place_pawn(self, position: Tuple[int, int]) -> Tuple[bool, str]:
         """
@@ -583,19 +794,22 @@ class Board:
         Returns:
             Board: A copy of the board.
         """
-        # Create a new board
-        board_copy = Board(self.nb_players)
+        # Create a new board, without initializing the copied attributes
+        board_copy = Board.__new__(Board)
+        board_copy.nb_players = self.nb_players
+        board_copy.nb_pawns = self.nb_pawns
+        board_copy.board_size = self.board_size
 
         # Copy the board
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                board_copy.board[x][y] = self.board[x][y]
+        board_copy.board = [row[:] for row in self.board]
 
         # Copy the pawns
         board_copy.pawns = [pawn.copy() for pawn in self.pawns]
+        board_copy.index_pawns()
 
         # Copy the other attributes
         board_copy.turn_number = self.turn_number
+        board_copy.player_turn = self.player_turn
         board_copy.winner_player_number = self.winner_player_number
 
         return board_copy
@@ -612,13 +826,276 @@ class Board:
         for y in range(self.board_size - 1, -1, -1):
             for x in range(self.board_size):
                 # Check if there is a pawn at this position
-                pawn = None
-                for p in self.pawns:
-                    if p.pos == (x, y):
-                        pawn = p
-                        break
+                pawn = self.occupancy.get((x, y))
                 pawn_number = str(pawn.number) if pawn is not None else "_"
                 output += pawn_number + str(self.board[x][y]) + " "
             output += "\n"
 
         return output
+
+    @staticmethod
+    def from_repr(text: str, player_turn: int = 1, nb_players: int = None) -> "Board":
+        """
+        Creates a board from its string representation (see __repr__).
+
+        Args:
+            text (str): The string representation of the board.
+            player_turn (int): The number of the player to move.
+            nb_players (int): The number of players, guessed from the pawn
+                numbers if None.
+
+        Returns:
+            Board: The board.
+        """
+        rows = [line.split() for line in text.strip().splitlines() if line.strip()]
+        if len(rows) != BOARD_SIZE or any(len(row) != BOARD_SIZE for row in rows):
+            raise ValueError(f"A board has {BOARD_SIZE} rows of {BOARD_SIZE} squares")
+
+        levels = {}
+        pawn_positions = {}
+        for row_nb, row in enumerate(rows):
+            y = BOARD_SIZE - 1 - row_nb
+            for x, square in enumerate(row):
+                if len(square) != 2 or square[1] not in "01234":
+                    raise ValueError(f"Invalid square: {square}")
+                if square[0] != "_":
+                    if square[0] not in "123456" or int(square[0]) in pawn_positions:
+                        raise ValueError(f"Invalid pawn: {square}")
+                    pawn_positions[int(square[0])] = (x, y)
+                levels[(x, y)] = int(square[1])
+
+        if nb_players is None:
+            nb_players = 3 if max(pawn_positions, default=0) > 4 else 2
+        if not 1 <= player_turn <= nb_players:
+            raise ValueError(f"Invalid player turn: {player_turn}")
+
+        board = Board(nb_players)
+        for (x, y), level in levels.items():
+            board.board[x][y] = level
+        for pawn_number, position in pawn_positions.items():
+            if pawn_number > board.nb_pawns:
+                raise ValueError(
+                    f"Invalid pawn for {nb_players} players: {pawn_number}"
+                )
+            board.pawns[pawn_number - 1].pos = position
+        board.player_turn = player_turn
+
+        return board
+
+    def to_text(self) -> str:
+        """
+        Creates a compact text of the board, to store it or use it as a key.
+        The text has 5 fields separated by spaces:
+        - the levels, a column of 5 digits per x separated by "/"
+        - the square of each pawn, by pawn number: a letter from "a" for
+          (0, 0) to "y" for (4, 4) in the order of SQUARES, "-" if not placed
+        - the number of the player to move
+        - the turn number
+        - the number of the winner, "-" if none
+
+        Example: "00000/01000/00200/00000/00000 amgs 1 5 -"
+
+        Returns:
+            str: The text of the board.
+        """
+        levels = "/".join([COLUMN_TEXTS[tuple(column)] for column in self.board])
+        pawns = "".join([SQUARE_LETTERS.get(pawn._pos, "-") for pawn in self.pawns])
+        winner = self.winner_player_number
+        return (
+            f"{levels} {pawns} {self.player_turn} {self.turn_number} "
+            f"{'-' if winner is None else winner}"
+        )
+
+    @staticmethod
+    def from_text(text: str) -> "Board":
+        """
+        Creates a board from its compact text (see to_text).
+
+        Args:
+            text (str): The text of the board.
+
+        Returns:
+            Board: The board.
+        """
+        fields = text.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid board text: {text!r}")
+        levels, pawns, player_turn, turn_number, winner = fields
+
+        try:
+            columns = [list(TEXT_COLUMNS[column]) for column in levels.split("/")]
+        except KeyError:
+            raise ValueError(f"Invalid levels: {levels!r}") from None
+        if len(columns) != BOARD_SIZE:
+            raise ValueError(f"Invalid levels: {levels!r}")
+
+        try:
+            positions = [
+                None if letter == "-" else LETTER_SQUARES[letter] for letter in pawns
+            ]
+            player_turn = int(player_turn)
+            turn_number = int(turn_number)
+            winner = None if winner == "-" else int(winner)
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid board text: {text!r}") from None
+
+        return Board.from_state(columns, positions, player_turn, turn_number, winner)
+
+    @staticmethod
+    def from_state(
+        levels: List[List[int]],
+        pawn_positions: List[Tuple[int, int]],
+        player_turn: int,
+        turn_number: int,
+        winner_player_number: int = None,
+    ) -> "Board":
+        """
+        Creates a board from its state, used by from_text and from_bytes.
+
+        Args:
+            levels (list): The levels of the board, board[x][y], not copied.
+            pawn_positions (list): The position of each pawn by pawn number,
+                None if not placed. Its length gives the number of players.
+            player_turn (int): The number of the player to move.
+            turn_number (int): The turn number.
+            winner_player_number (int): The number of the winner, if any.
+
+        Returns:
+            Board: The board.
+        """
+        nb_players = len(pawn_positions) // 2
+        if nb_players not in (2, 3) or len(pawn_positions) != nb_players * 2:
+            raise ValueError(f"Invalid number of pawns: {len(pawn_positions)}")
+        if not 1 <= player_turn <= nb_players:
+            raise ValueError(f"Invalid player turn: {player_turn}")
+        if winner_player_number is not None and not (
+            1 <= winner_player_number <= nb_players
+        ):
+            raise ValueError(f"Invalid winner: {winner_player_number}")
+
+        # Create a new board, without initializing the given attributes
+        board = Board.__new__(Board)
+        board.nb_players = nb_players
+        board.nb_pawns = nb_players * 2
+        board.board_size = BOARD_SIZE
+        board.board = levels
+
+        board.pawns = []
+        nb_placed_pawns = 0
+        for pawn_number, position in enumerate(pawn_positions, 1):
+            pawn = Pawn(
+                pawn_number,
+                (pawn_number - 1) // nb_players + 1,
+                (pawn_number - 1) % nb_players + 1,
+            )
+            if position is not None:
+                pawn._pos = position
+                nb_placed_pawns += 1
+            board.pawns.append(pawn)
+        board.index_pawns()
+        if len(board.occupancy) != nb_placed_pawns:
+            raise ValueError(f"Several pawns on the same square: {pawn_positions}")
+
+        board.turn_number = turn_number
+        board.player_turn = player_turn
+        board.winner_player_number = winner_player_number
+
+        return board
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the board in 36 bytes, to send it to another process or store
+        it, see BOARD_STRUCT:
+        - the 25 levels, in the order of SQUARES
+        - the number of players
+        - the square of each of the 6 pawns, by pawn number: its index in
+          SQUARES, NOT_PLACED if not placed or not in the game
+        - the number of the player to move
+        - the turn number, on 2 bytes
+        - the number of the winner, 0 if none
+
+        Only the games of 2 or 3 players are encoded, and only the state of
+        the game: the class of the board and its other attributes are lost,
+        see is_encodable.
+
+        Returns:
+            bytes: The encoded board.
+
+        Raises:
+            ValueError: If the board has not 2 or 3 players.
+        """
+        if self.nb_players not in (2, 3):
+            raise ValueError(
+                f"Only the boards of 2 or 3 players are encoded, not {self.nb_players}"
+            )
+        pawns = [SQUARE_INDEXES.get(pawn._pos, NOT_PLACED) for pawn in self.pawns]
+        pawns += [NOT_PLACED] * (6 - len(pawns))
+        return BOARD_STRUCT.pack(
+            bytes(chain.from_iterable(self.board)),
+            self.nb_players,
+            bytes(pawns),
+            self.player_turn,
+            self.turn_number,
+            self.winner_player_number or 0,
+        )
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "Board":
+        """
+        Decodes a board encoded by to_bytes.
+
+        Args:
+            data (bytes): The encoded board.
+
+        Returns:
+            Board: The board.
+        """
+        try:
+            (
+                levels,
+                nb_players,
+                pawns,
+                player_turn,
+                turn_number,
+                winner,
+            ) = BOARD_STRUCT.unpack(data)
+            positions = [
+                None if square_nb == NOT_PLACED else SQUARES[square_nb]
+                for square_nb in pawns[: nb_players * 2]
+            ]
+        except (struct.error, IndexError):
+            raise ValueError(f"Invalid encoded board: {data!r}") from None
+        if nb_players not in (2, 3):
+            raise ValueError(f"Invalid number of players: {nb_players}")
+        if max(levels) > 4:
+            raise ValueError(f"Invalid levels: {list(levels)}")
+
+        return Board.from_state(
+            [list(levels[column]) for column in LEVEL_COLUMNS],
+            positions,
+            player_turn,
+            turn_number,
+            winner or None,
+        )
+
+    def is_encodable(self) -> bool:
+        """
+        Checks if the board is restored as it is from its binary format (see
+        to_bytes): a Board of 2 or 3 players, not a subclass, without other
+        attributes.
+
+        Returns:
+            bool: True if the board is fully encoded by to_bytes.
+        """
+        return (
+            type(self) is Board
+            and self.nb_players in (2, 3)
+            and vars(self).keys() <= BOARD_ATTRIBUTES
+        )
+
+    def __reduce_ex__(self, protocol):
+        # Pickle the boards with their compact encoding when it restores them
+        # as they are, and the others with all their attributes
+        if not self.is_encodable():
+            return super().__reduce_ex__(protocol)
+        return Board.from_bytes, (self.to_bytes(),)
@@ -1,5 +1,17 @@
 import PySimpleGUI as sg
 from santorinai.board import Board
+from santorinai.board_displayer.geometry import (
+    BOARD_PLANE,
+    HEIGHT,
+    TILES_ORDER,
+    WIDTH,
+    get_cube_polygons,
+    get_tile_shapes,
+    get_tiles,
+)
+import multiprocessing
+import queue
+import time
 
 # Board display util
 # Used to display a game board live
@@ -18,20 +30,15 @@ from santorinai.board import Board
 # A list of pawns with a number and a pos.
 
 sg.theme("Dark Blue 3")
-SIZE = 5
 
-pawns_colors = {
-    1: "grey",
-    2: "blue",
-    3: "white",
-}
 
-SIZE_X = 800
-SIZE_Y = 300
-TILE_SIZE = SIZE_X / 5
-
-
-def init_window(player_names):
+def init_window(player_names, extra_layout=None):
+    """
+    Open the board window.
+    :param player_names: The names of the players, for the window title.
+    :param extra_layout: Rows of elements added under the board, if any.
+    :return: The window.
+    """
     tile = player_names[0]
     for player_name in player_names[1:]:
         tile += f" VS {player_name} "
@@ -40,14 +47,16 @@ def init_window(player_names):
         [sg.Text(tile, font=("Helvetica", 20), justification="center")],
         [
             sg.Graph(
-                (SIZE_X, SIZE_Y + 100),
+                (WIDTH, HEIGHT),
                 (0, 0),
-                (SIZE_X, SIZE_Y + 100),
+                (WIDTH, HEIGHT),
                 key="-GRAPH-",
                 change_submits=True,
             )
         ],
     ]
+    if extra_layout is not None:
+        layout.extend(extra_layout)
     window = sg.Window("Game Board", layout, finalize=True)
     return window
 
@@ -63,181 +72,68 @@ def draw_isometric_cube(
     :param size: The size of the cube.
     :param color: The fill color of the cube.
     :param line_color: The color of the cube's outline.
+    :return: The ids of the drawn figures.
     """
     graph = window["-GRAPH-"]
 
     if graph is None:
-        return
-
-    ratio = SIZE_X / SIZE_Y
+        return []
 
-    AY = y + size / ratio
-    B2Y = y - size / ratio
-    B1Y = B3Y = y
-    C2Y = B2Y - cube_heigth
-    C1Y = C3Y = B1Y - cube_heigth
-
-    AX = B2X = C2X = x
-    B1X = C1X = x - size
-    B3X = C3X = x + size
-
-    graph.draw_polygon(
-        [
-            (B1X, B1Y),
-            (B2X, B2Y),
-            (C2X, C2Y),
-            (C1X, C1Y),
-        ],
-        line_color=line_color,
-        fill_color=color,
-        line_width=line_width,
-    )
-    graph.draw_polygon(
-        [
-            (B3X, B3Y),
-            (B2X, B2Y),
-            (C2X, C2Y),
-            (C3X, C3Y),
-        ],
-        line_color=line_color,
-        fill_color=color,
-        line_width=line_width,
-    )
-    graph.draw_polygon(
-        [
-            (B1X, B1Y),
-            (B2X, B2Y),
-            (B3X, B3Y),
-            (AX, AY),
-        ],
-        line_color=line_color,
-        fill_color=color,
-        line_width=line_width,
-    )
+    return [
+        graph.draw_polygon(
+            polygon, line_color=line_color, fill_color=color, line_width=line_width
+        )
+        for polygon in get_cube_polygons(x, y, size, cube_heigth)
+    ]
 
 
-def update_board(window: sg.Window, board: Board):
+def draw_shape(graph: sg.Graph, shape):
+    """
+    Draw a shape given by the geometry module
+    :param graph: The graph to draw on.
+    :param shape: The shape, see get_tile_shapes.
+    :return: The id of the drawn figure.
+    """
+    if shape[0] == "polygon":
+        _, points, fill_color, line_color, line_width = shape
+        return graph.draw_polygon(
+            points, line_color=line_color, fill_color=fill_color, line_width=line_width
+        )
+    if shape[0] == "oval":
+        _, top_left, bottom_right, fill_color, line_color, line_width = shape
+        return graph.DrawOval(
+            top_left,
+            bottom_right,
+            fill_color=fill_color,
+            line_color=line_color,
+            line_width=line_width,
+        )
+    _, text, location, color = shape
+    return graph.DrawText(text, location, font="Courier 15", color=color)
+
+
+def draw_tile(window: sg.Window, i, j, level, pawn):
+    """
+    Draw the tower of a tile and its pawn
+    :param window: The PySimpleGUI window object to draw on.
+    :param i: The x position of the tile on the board.
+    :param j: The y position of the tile on the board.
+    :param level: The level of the tile.
+    :param pawn: The (number, player number) of the pawn on the tile, or None.
+    :return: The ids of the drawn figures.
+    """
     graph = window["-GRAPH-"]
-    graph.erase()
-
-    # Draw the board plane
-    graph.draw_polygon(
-        (
-            (-10, SIZE_Y / 2),
-            (SIZE_X / 2, -10),
-            (10 + SIZE_X, SIZE_Y / 2),
-            (SIZE_X / 2, SIZE_Y + 5),
-        ),
-        line_color="black",
-        fill_color="white",
-        line_width=0,
-    )
-
-    # Board
-    for i in range(SIZE - 1, -1, -1):
-        for j in range(SIZE - 1, -1, -1):
-            level = board.board[i][j]
-
-            x = (j - i) * TILE_SIZE / 2 + SIZE_X / 2
-            y = (j + i) * TILE_SIZE / 5.2 + 25
-
-            if level >= 0:
-                color = "light grey"
-                line_width = 2
-                line_color = "black"
-                cube_size = TILE_SIZE / 2 - 10
-                cube_heigth = 0
-
-            draw_isometric_cube(
-                window, x, y, cube_size, cube_heigth, color, line_color, line_width
-            )
+    return [draw_shape(graph, shape) for shape in get_tile_shapes(i, j, level, pawn)]
 
-            if level >= 1:
-                color = "#f0f0f0"
-                line_width = 2
-                # line_color = "dark grey"
-                line_color = "black"
-                cube_size = TILE_SIZE / 2 - 25
-                cube_heigth = TILE_SIZE / 5
-                y += cube_heigth
-
-            draw_isometric_cube(
-                window, x, y, cube_size, cube_heigth, color, line_color, line_width
-            )
-            if level >= 2:
-                color = "#d0d0d0"
-                line_width = 2
-                line_color = "black"
-                cube_size = TILE_SIZE / 2 - 30
-                cube_heigth = TILE_SIZE / 6
-                y += cube_heigth
-
-            draw_isometric_cube(
-                window, x, y, cube_size, cube_heigth, color, line_color, line_width
-            )
-            if level >= 3:
-                color = "#b0b0b0"
-                line_width = 2
-                line_color = "black"
-                cube_size = TILE_SIZE / 2 - 35
-                cube_heigth = TILE_SIZE / 8
-                y += cube_heigth
-
-            draw_isometric_cube(
-                window, x, y, cube_size, cube_heigth, color, line_color, line_width
-            )
-            if level >= 4:
-                color = "blue"
-                line_width = 2
-                line_color = "black"
-                cube_size = TILE_SIZE / 2 - 45
-                cube_heigth = TILE_SIZE / 10
-                y += cube_heigth
-
-            draw_isometric_cube(
-                window, x, y, cube_size, cube_heigth, color, line_color, line_width
-            )
 
-            # Pawns
-            for pawn in board.pawns:
-                x, y = pawn.pos
-                if (x, y) == (None, None):
-                    continue
-
-                if (x, y) != (i, j):
-                    continue
-
-                level = board.board[x][y]
-                PAWN_SIZE = 50
-                x_pos = (y - x) * TILE_SIZE / 2 + SIZE_X / 2
-                y_pos = (y + x) * TILE_SIZE / 5.2 + cube_heigth * level + PAWN_SIZE
-
-                color = pawns_colors[pawn.player_number]
-                line_width = 2
-                line_color = "black"
-
-                # Draw the pawn's shadow
-                graph.DrawOval(
-                    (x_pos - 14, y_pos - PAWN_SIZE / 2 - 2),
-                    (x_pos + 14, y_pos - PAWN_SIZE / 2 + 8),
-                    fill_color="black",
-                )
-                # Draw the pawn
-                graph.DrawOval(
-                    (x_pos - 14, y_pos - PAWN_SIZE / 2),
-                    (x_pos + 14, y_pos + PAWN_SIZE / 2),
-                    line_color=line_color,
-                    fill_color=color,
-                    line_width=line_width,
-                )
-
-                # Draw the pawn's number
-                graph.DrawText(
-                    pawn.number,
-                    (x_pos, y_pos - 3),
-                    font="Courier 15",
-                    color="white",
-                )
+def update_board(window: sg.Window, board: Board):
+    """
+    Display a board and process the window events.
+    :param window: The window made by init_window.
+    :param board: The board to display.
+    :return: True if the window was closed.
+    """
+    draw_board(window, board)
 
     event, values = window.read(timeout=10)
 
@@ -246,10 +142,173 @@ def update_board(window: sg.Window, board: Board):
     return False
 
 
+def draw_board(window: sg.Window, board: Board):
+    """
+    Draw a board, only the tiles that changed since the previous call
+    are drawn again.
+    The figures of each tile and the displayed state are kept in window.metadata.
+    :param window: The window made by init_window.
+    :param board: The board to display.
+    """
+    graph = window["-GRAPH-"]
+
+    # The displayed state of each tile: level and pawn
+    tiles = get_tiles(board)
+
+    displayed = window.metadata
+    if not isinstance(displayed, dict) or "tiles" not in displayed:
+        # First display, draw the board plane
+        graph.erase()
+        draw_shape(graph, BOARD_PLANE)
+        displayed = {"tiles": {}, "figures": {}}
+        window.metadata = displayed
+
+    redrawn = False
+    for tile in TILES_ORDER:
+        if displayed["tiles"].get(tile) == tiles[tile]:
+            if redrawn:
+                # Keep the tile over the tiles behind it that were drawn again
+                for figure in displayed["figures"][tile]:
+                    graph.bring_figure_to_front(figure)
+            continue
+
+        for figure in displayed["figures"].get(tile, []):
+            graph.delete_figure(figure)
+        displayed["figures"][tile] = draw_tile(window, *tile, *tiles[tile])
+        displayed["tiles"][tile] = tiles[tile]
+        redrawn = True
+
+
 def close_window(window):
     window.close()
 
 
+def put_latest(frames, frame):
+    """
+    Put a frame in a bounded queue without waiting,
+    the oldest frame is dropped if the queue is full.
+    :param frames: The queue of frames.
+    :param frame: The frame to add.
+    """
+    while True:
+        try:
+            frames.put_nowait(frame)
+            return
+        except queue.Full:
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def get_latest(frames, timeout):
+    """
+    Wait for a frame and return the most recent one, the older ones are dropped.
+    :param frames: The queue of frames.
+    :param timeout: The maximum time to wait in seconds.
+    :return: The latest frame, None if there is none.
+    """
+    try:
+        frame = frames.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+    while True:
+        try:
+            frame = frames.get_nowait()
+        except queue.Empty:
+            return frame
+
+
+# Sent to the display process to close the window
+CLOSE_FRAME = "close"
+
+
+def run_display(player_names, frames, closed, fps):
+    """
+    Display the boards received in the frames queue until CLOSE_FRAME,
+    at most fps frames per second, the intermediate boards are skipped.
+    :param player_names: The names of the players, for the window title.
+    :param frames: The queue of the encoded boards (see Board.to_bytes).
+    :param closed: An event set when the window is closed.
+    :param fps: The maximum number of frames per second.
+    """
+    window = init_window(player_names)
+    frame_duration = 1 / fps
+
+    while True:
+        frame_start = time.monotonic()
+        frame = get_latest(frames, frame_duration)
+        if frame == CLOSE_FRAME:
+            break
+
+        if frame is not None:
+            window_closed = update_board(window, Board.from_bytes(frame))
+        else:
+            event, _ = window.read(timeout=10)
+            window_closed = event == sg.WIN_CLOSED
+
+        if window_closed:
+            closed.set()
+            break
+
+        # Wait for the next frame
+        time.sleep(max(0, frame_duration - (time.monotonic() - frame_start)))
+
+    close_window(window)
+
+
+class BoardDisplay:
+    """
+    A window displaying boards from a separate process.
+
+    show() never waits for the window: the boards go through a bounded queue
+    and the display process only draws the latest one, at a fixed frame rate,
+    so the games are played at full speed.
+
+    Usage:
+        display = BoardDisplay(["Player 1", "Player 2"])
+        display.show(board)
+        display.close()
+    """
+
+    def __init__(self, player_names, fps=30, queue_size=2):
+        self.frames = multiprocessing.Queue(queue_size)
+        self.closed = multiprocessing.Event()
+        self.process = multiprocessing.Process(
+            target=run_display,
+            args=(list(player_names), self.frames, self.closed, fps),
+            daemon=True,
+        )
+        self.process.start()
+
+    def show(self, board: Board):
+        """
+        Display a board, an older board not displayed yet is dropped.
+        :return: True if the window was closed.
+        """
+        if self.closed.is_set() or not self.process.is_alive():
+            return True
+
+        # The encoded board is a snapshot, the queue pickles it later
+        put_latest(self.frames, board.to_bytes())
+        return False
+
+    def close(self, timeout=5):
+        """
+        Close the window once the last board is displayed.
+        """
+        if self.process.is_alive():
+            try:
+                self.frames.put(CLOSE_FRAME, timeout=timeout)
+            except queue.Full:
+                pass
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.frames.close()
+
+
 if __name__ == "__main__":
     board = Board(2)
     window = init_window()
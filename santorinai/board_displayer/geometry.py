@@ -0,0 +1,145 @@
+from santorinai.board import Board
+
+# Board drawing geometry
+# The isometric projection of the board, shared by the live window
+# (board_displayer.py) and the headless renderer (svg_renderer.py)
+# Coordinates have their origin at the bottom left, y going up
+
+SIZE = 5
+
+pawns_colors = {
+    1: "grey",
+    2: "blue",
+    3: "white",
+}
+
+SIZE_X = 800
+SIZE_Y = 300
+TILE_SIZE = SIZE_X / 5
+PAWN_SIZE = 50
+
+# The size of the drawing area
+WIDTH = SIZE_X
+HEIGHT = SIZE_Y + 100
+
+# The cubes of a tower, from the ground: color, size and height
+CUBES = [
+    ("light grey", TILE_SIZE / 2 - 10, 0),
+    ("#f0f0f0", TILE_SIZE / 2 - 25, TILE_SIZE / 5),
+    ("#d0d0d0", TILE_SIZE / 2 - 30, TILE_SIZE / 6),
+    ("#b0b0b0", TILE_SIZE / 2 - 35, TILE_SIZE / 8),
+    ("blue", TILE_SIZE / 2 - 45, TILE_SIZE / 10),
+]
+
+# The tiles from the back to the front, the front tiles are drawn over
+TILES_ORDER = [(i, j) for i in range(SIZE - 1, -1, -1) for j in range(SIZE - 1, -1, -1)]
+
+# The white plane under the tiles
+BOARD_PLANE = (
+    "polygon",
+    [
+        (-10, SIZE_Y / 2),
+        (SIZE_X / 2, -10),
+        (10 + SIZE_X, SIZE_Y / 2),
+        (SIZE_X / 2, SIZE_Y + 5),
+    ],
+    "white",
+    "black",
+    0,
+)
+
+
+def get_cube_polygons(x, y, size, cube_heigth):
+    """
+    Get the 3 visible faces of an isometric cube.
+    :param x: The x-coordinate of the cube.
+    :param y: The y-coordinate of the cube.
+    :param size: The size of the cube.
+    :param cube_heigth: The height of the cube.
+    :return: The left, right and top faces, as lists of points.
+    """
+    ratio = SIZE_X / SIZE_Y
+
+    AY = y + size / ratio
+    B2Y = y - size / ratio
+    B1Y = B3Y = y
+    C2Y = B2Y - cube_heigth
+    C1Y = C3Y = B1Y - cube_heigth
+
+    AX = B2X = C2X = x
+    B1X = C1X = x - size
+    B3X = C3X = x + size
+
+    return [
+        [(B1X, B1Y), (B2X, B2Y), (C2X, C2Y), (C1X, C1Y)],
+        [(B3X, B3Y), (B2X, B2Y), (C2X, C2Y), (C3X, C3Y)],
+        [(B1X, B1Y), (B2X, B2Y), (B3X, B3Y), (AX, AY)],
+    ]
+
+
+def get_tile_shapes(i, j, level, pawn):
+    """
+    Get the shapes drawing the tower of a tile and its pawn, in drawing order:
+        ("polygon", points, fill_color, line_color, line_width)
+        ("oval", top_left, bottom_right, fill_color, line_color, line_width)
+        ("text", text, location, color)
+    :param i: The x position of the tile on the board.
+    :param j: The y position of the tile on the board.
+    :param level: The level of the tile.
+    :param pawn: The (number, player number) of the pawn on the tile, or None.
+    :return: The list of shapes.
+    """
+    shapes = []
+
+    x = (j - i) * TILE_SIZE / 2 + SIZE_X / 2
+    y = (j + i) * TILE_SIZE / 5.2 + 25
+
+    for color, cube_size, cube_heigth in CUBES[: level + 1]:
+        y += cube_heigth
+        for polygon in get_cube_polygons(x, y, cube_size, cube_heigth):
+            shapes.append(("polygon", polygon, color, "black", 2))
+
+    # Pawn
+    if pawn is not None:
+        pawn_number, player_number = pawn
+        y_pos = (j + i) * TILE_SIZE / 5.2 + cube_heigth * level + PAWN_SIZE
+
+        # The pawn's shadow, the pawn and its number
+        shapes.append(
+            (
+                "oval",
+                (x - 14, y_pos - PAWN_SIZE / 2 - 2),
+                (x + 14, y_pos - PAWN_SIZE / 2 + 8),
+                "black",
+                None,
+                1,
+            )
+        )
+        shapes.append(
+            (
+                "oval",
+                (x - 14, y_pos - PAWN_SIZE / 2),
+                (x + 14, y_pos + PAWN_SIZE / 2),
+                pawns_colors[player_number],
+                "black",
+                2,
+            )
+        )
+        shapes.append(("text", str(pawn_number), (x, y_pos - 3), "white"))
+
+    return shapes
+
+
+def get_tiles(board: Board):
+    """
+    Get the displayed state of each tile of a board
+    :param board: The board.
+    :return: A dict (i, j) -> (level, pawn), pawn being a tuple
+        (number, player number) or None.
+    """
+    pawns = {}
+    for pawn in board.pawns:
+        if pawn.pos[0] is not None and pawn.pos[1] is not None:
+            pawns[pawn.pos] = (pawn.number, pawn.player_number)
+
+    return {(i, j): (board.board[i][j], pawns.get((i, j))) for i, j in TILES_ORDER}
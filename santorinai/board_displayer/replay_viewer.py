@@ -0,0 +1,114 @@
+"""
+Browse a recorded game in the board window, ply by ply.
+
+Usage:
+    python -m santorinai.board_displayer.replay_viewer records.jsonl --game 3
+
+Controls: the buttons or the Left / Right / Home / End keys step through the
+game, the slider jumps to any ply.
+"""
+
+import argparse
+from itertools import islice
+
+import PySimpleGUI as sg
+
+from santorinai.board_displayer.board_displayer import (
+    close_window,
+    draw_board,
+    init_window,
+)
+from santorinai.game_record import load_records
+from santorinai.replay import Replay
+
+# The ply change of each button
+STEPS = {
+    "-FIRST-": -float("inf"),
+    "-PREVIOUS-": -1,
+    "-NEXT-": 1,
+    "-LAST-": float("inf"),
+}
+
+# The button of each key
+KEYS = {
+    "<Home>": "-FIRST-",
+    "<Left>": "-PREVIOUS-",
+    "<Right>": "-NEXT-",
+    "<End>": "-LAST-",
+}
+
+
+def get_controls_layout(nb_plies):
+    """
+    Get the rows of the replay controls, added under the board.
+    :param nb_plies: The number of plies of the game.
+    :return: The layout rows.
+    """
+    return [
+        [
+            sg.Button("<<", key="-FIRST-"),
+            sg.Button("<", key="-PREVIOUS-"),
+            sg.Button(">", key="-NEXT-"),
+            sg.Button(">>", key="-LAST-"),
+            sg.Slider(
+                (0, nb_plies),
+                default_value=0,
+                orientation="h",
+                size=(60, 15),
+                enable_events=True,
+                key="-PLY-",
+            ),
+        ],
+        [sg.Text("", size=(80, 1), key="-DESCRIPTION-")],
+    ]
+
+
+def view_replay(replay: Replay):
+    """
+    Open a window to browse a replay, until the window is closed.
+    :param replay: The replay of the game.
+    """
+    window = init_window(
+        replay.record.player_names, get_controls_layout(replay.nb_plies)
+    )
+    for key, button in KEYS.items():
+        window.bind(key, button)
+
+    ply = 0
+    while True:
+        board = replay.seek(ply)
+        draw_board(window, board)
+        description = f"Ply {replay.ply} / {replay.nb_plies}: "
+        description += replay.get_ply_description(replay.ply)
+        if replay.ply == replay.nb_plies:
+            description += f" - winner: {replay.record.winner_name}"
+        window["-DESCRIPTION-"].update(description)
+        window["-PLY-"].update(replay.ply)
+
+        event, values = window.read()
+        if event == sg.WIN_CLOSED:
+            break
+        if event == "-PLY-":
+            ply = int(values["-PLY-"])
+        elif event in STEPS:
+            ply = int(max(0, min(replay.ply + STEPS[event], replay.nb_plies)))
+
+    close_window(window)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browse a recorded game")
+    parser.add_argument("records", help="A records archive (records.jsonl)")
+    parser.add_argument("--game", type=int, default=0, help="The game index")
+    args = parser.parse_args()
+
+    record = next(islice(load_records(args.records), args.game, None), None)
+    if record is None:
+        parser.error(f"There is no game {args.game} in {args.records}")
+
+    print(record)
+    view_replay(Replay(record))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Render boards and recorded games to SVG images, without a display.
+
+The boards are drawn with the same isometric projection as the board
+displayer window (see geometry.py), in pure Python.
+
+A game is rendered as a sequence of frames, one per position: the empty
+board, the board after each pawn placement and after each move. Positions
+seen in several frames, or in several games, are rendered once: each frame
+file is named after the hash of its position, and each game gets a list of
+its frame files.
+
+Usage:
+    python -m santorinai.board_displayer.svg_renderer records.jsonl \\
+        --out frames --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from santorinai.board import Board
+from santorinai.board_displayer.geometry import (
+    BOARD_PLANE,
+    HEIGHT,
+    TILES_ORDER,
+    WIDTH,
+    get_tile_shapes,
+    get_tiles,
+)
+from santorinai.game_record import GameRecord, load_records
+
+
+def to_svg_color(color: Optional[str]) -> str:
+    """
+    Convert a Tk color name ("light grey") to a SVG one ("lightgrey")
+    """
+    if color is None:
+        return "none"
+    return color.replace(" ", "")
+
+
+def to_svg_point(point: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Convert a point of the geometry module (y going up) to SVG coordinates
+    (y going down)
+    """
+    return point[0], HEIGHT - point[1]
+
+
+def shape_to_svg(shape) -> str:
+    """
+    Convert a shape of the geometry module to a SVG element
+    """
+    if shape[0] == "polygon":
+        _, points, fill_color, line_color, line_width = shape
+        points = " ".join(
+            f"{x:g},{y:g}" for x, y in (to_svg_point(point) for point in points)
+        )
+        return (
+            f'<polygon points="{points}" fill="{to_svg_color(fill_color)}" '
+            f'stroke="{to_svg_color(line_color)}" stroke-width="{line_width}"/>'
+        )
+    if shape[0] == "oval":
+        _, top_left, bottom_right, fill_color, line_color, line_width = shape
+        left, top = to_svg_point(top_left)
+        right, bottom = to_svg_point(bottom_right)
+        return (
+            f'<ellipse cx="{(left + right) / 2:g}" cy="{(top + bottom) / 2:g}" '
+            f'rx="{abs(right - left) / 2:g}" ry="{abs(bottom - top) / 2:g}" '
+            f'fill="{to_svg_color(fill_color)}" '
+            f'stroke="{to_svg_color(line_color)}" stroke-width="{line_width}"/>'
+        )
+    _, text, location, color = shape
+    x, y = to_svg_point(location)
+    return (
+        f'<text x="{x:g}" y="{y:g}" fill="{to_svg_color(color)}" '
+        'font-family="Courier" font-size="15pt" text-anchor="middle" '
+        f'dominant-baseline="central">{text}</text>'
+    )
+
+
+@lru_cache(maxsize=None)
+def get_tile_svg(i: int, j: int, level: int, pawn: Optional[Tuple[int, int]]) -> str:
+    """
+    Get the SVG elements of a tile, a tile only has a few hundred states
+    so they are rendered once
+    """
+    return "\n".join(
+        shape_to_svg(shape) for shape in get_tile_shapes(i, j, level, pawn)
+    )
+
+
+def render_tiles_svg(tiles: Dict[Tuple[int, int], tuple]) -> str:
+    """
+    Render the displayed state of the tiles of a board, see get_tiles
+
+    Args:
+        tiles (dict): (i, j) -> (level, pawn)
+
+    Returns:
+        str: the SVG image
+    """
+    elements = [shape_to_svg(BOARD_PLANE)]
+    for i, j in TILES_ORDER:
+        elements.append(get_tile_svg(i, j, *tiles[(i, j)]))
+
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{WIDTH}" height="{HEIGHT}" viewBox="0 0 {WIDTH} {HEIGHT}">\n'
+        + "\n".join(elements)
+        + "\n</svg>\n"
+    )
+
+
+def render_svg(board: Board) -> str:
+    """
+    Render a board as a SVG image
+
+    Args:
+        board (Board): the board to render
+
+    Returns:
+        str: the SVG image
+    """
+    return render_tiles_svg(get_tiles(board))
+
+
+def get_position_hash(tiles: Dict[Tuple[int, int], tuple]) -> str:
+    """
+    Get a hash of the displayed state of a board, two boards with the
+    same hash give the same image
+
+    Args:
+        tiles (dict): (i, j) -> (level, pawn), see get_tiles
+
+    Returns:
+        str: the hash, as 16 hexadecimal characters
+    """
+    key = repr([tiles[tile] for tile in TILES_ORDER]).encode()
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+def get_game_boards(record: GameRecord) -> Iterator[Board]:
+    """
+    Replay a recorded game, the same board is updated and yielded
+    for each position
+
+    Args:
+        record (GameRecord): the record of the game
+
+    Returns:
+        Iterator[Board]: the empty board, then the board after each pawn
+            placement and after each move
+    """
+    board = Board(len(record.player_names))
+    yield board
+
+    for position in record.placements:
+        success, _ = board.place_pawn(position)
+        if not success:
+            return
+        yield board
+
+    for pawn_order, move, build in record.moves:
+        success, _ = board.play_move(pawn_order, move, build)
+        if not success:
+            # The invalid action that lost the game
+            return
+        yield board
+
+
+def write_frame(path: str, tiles: Dict[Tuple[int, int], tuple]):
+    """
+    Render the tiles of a board to a SVG file
+    """
+    with open(path, "w") as f:
+        f.write(render_tiles_svg(tiles))
+
+
+def render_games(
+    records: Iterable[GameRecord], out_dir: str, workers: int = 1
+) -> List[List[str]]:
+    """
+    Render recorded games to SVG frames
+
+    Each position is rendered once in out_dir/<position hash>.svg, the
+    files already present are kept. The frames of the n-th game are listed
+    in out_dir/game_<n>.json.
+
+    Args:
+        records (Iterable[GameRecord]): the games to render
+        out_dir (str): the directory of the frames
+        workers (int): the number of processes rendering frames
+
+    Returns:
+        list: the frame paths of each game
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    games_frames = []
+    to_render = {}
+    for game_index, record in enumerate(records):
+        frames = []
+        for board in get_game_boards(record):
+            tiles = get_tiles(board)
+            path = os.path.join(out_dir, get_position_hash(tiles) + ".svg")
+            if path not in to_render and not os.path.exists(path):
+                to_render[path] = tiles
+            frames.append(path)
+
+        with open(os.path.join(out_dir, f"game_{game_index:05d}.json"), "w") as f:
+            json.dump([os.path.basename(path) for path in frames], f)
+        games_frames.append(frames)
+
+    paths = list(to_render)
+    tiles = [to_render[path] for path in paths]
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            chunk_size = max(1, len(paths) // (workers * 8))
+            list(executor.map(write_frame, paths, tiles, chunksize=chunk_size))
+    else:
+        list(map(write_frame, paths, tiles))
+
+    return games_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render recorded games to SVG")
+    parser.add_argument("records", help="A records archive (records.jsonl)")
+    parser.add_argument("--out", default="frames")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    games_frames = render_games(load_records(args.records), args.out, args.workers)
+    nb_frames = sum(len(frames) for frames in games_frames)
+    nb_files = len({path for frames in games_frames for path in frames})
+    print(
+        f"{len(games_frames)} games, {nb_frames} frames "
+        f"({nb_files} unique positions) in {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+The santorinai command.
+
+Usage:
+    santorinai analyze --board position.txt --turn 2 --time 10 --workers 4
+    santorinai analyze --record records.jsonl --game 3 --ply 24
+
+The position to analyze is given:
+    - as a text file in the format printed by Board.__repr__ ("-" for the
+      standard input), a square being the pawn number (or _) and the level:
+        _0 _0 _1 _0 _0
+        _0 12 _0 _1 _0
+        _0 _0 30 _0 _0
+        _0 _2 _1 41 _0
+        _0 _0 _0 _0 _0
+    - or as a position of a recorded game, after ply actions (pawn
+      placements then moves), the last position of the game by default.
+"""
+
+import argparse
+import os
+import sys
+from itertools import islice
+
+from santorinai.board import Board
+from santorinai.game_record import load_records
+from santorinai.replay import Replay
+from santorinai.search import analyze, format_action, format_score
+
+
+def load_position(args) -> Board:
+    """
+    Load the position given on the command line
+    """
+    if args.board is not None:
+        if args.board == "-":
+            text = sys.stdin.read()
+        else:
+            with open(args.board) as f:
+                text = f.read()
+        return Board.from_repr(text, args.turn, args.players)
+
+    record = next(islice(load_records(args.record), args.game, None), None)
+    if record is None:
+        raise ValueError(f"There is no game {args.game} in {args.record}")
+
+    replay = Replay(record)
+    if args.ply is not None:
+        return replay.seek(args.ply).copy()
+
+    # The last position where the game is not over
+    board = replay.seek(replay.nb_plies)
+    if board.is_game_over():
+        board = replay.seek(replay.nb_plies - 1)
+    return board.copy()
+
+
+def run_analyze(args):
+    board = load_position(args)
+    print(board)
+    print(f"Player {board.player_turn} to move")
+
+    result = analyze(board, args.time, args.workers, args.max_depth)
+
+    order, move, build = result["best_action"]
+    print(f"Best move: {format_action(board.player_turn, result['best_action'])}")
+    print(f"    (pawn {order}, move {move}, build {build})")
+    print(f"Score: {format_score(result['score'])}")
+    print(f"Principal variation: {', '.join(format_action(*a) for a in result['pv'])}")
+    print(f"Depth: {result['depth']}")
+    print(
+        f"Nodes: {result['nodes']} in {result['duration']:.2f} s "
+        f"({result['nodes_per_second']:.0f} nodes/s)"
+    )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="santorinai")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    analyze_parser = commands.add_parser(
+        "analyze", help="Search the best move of a position"
+    )
+    position = analyze_parser.add_mutually_exclusive_group(required=True)
+    position.add_argument("--board", help="A board text file, - for stdin")
+    position.add_argument("--record", help="A records archive (records.jsonl)")
+    analyze_parser.add_argument(
+        "--turn", type=int, default=1, help="The player to move, with --board"
+    )
+    analyze_parser.add_argument(
+        "--players", type=int, default=None, help="The number of players"
+    )
+    analyze_parser.add_argument(
+        "--game", type=int, default=0, help="The game index, with --record"
+    )
+    analyze_parser.add_argument(
+        "--ply", type=int, default=None, help="The number of actions played"
+    )
+    analyze_parser.add_argument("--time", type=float, default=5.0)
+    analyze_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    analyze_parser.add_argument("--max-depth", type=int, default=None)
+    args = parser.parse_args(args)
+
+    try:
+        run_analyze(args)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
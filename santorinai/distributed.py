@@ -0,0 +1,313 @@
+"""
+Spread the games of a match over several processes and machines.
+
+The coordinator hands out games to the workers connected over TCP,
+the workers play them with their local engine and send back the results.
+The game of a worker that disconnects or times out is given to another worker.
+
+The players are given as "module:PlayerClass" specs, the same code has to be
+installed on the coordinator and on the workers.
+
+Usage:
+    # On the coordinator machine
+    python -m santorinai.distributed coordinator --port 5555 --games 1000 \\
+        santorinai.player_examples.basic_player:BasicPlayer \\
+        santorinai.player_examples.random_player:RandomPlayer
+
+    # On each worker machine, one worker per core
+    python -m santorinai.distributed worker --host coordinator.local --port 5555 \\
+        --processes 8
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import queue
+import socket
+import socketserver
+import threading
+from typing import List, Optional
+
+from santorinai.game_record import GameRecord
+from santorinai.player import Player
+from santorinai.tester import Tester, get_game_seed
+
+
+def load_player(player_spec: str, player_number: int) -> Player:
+    """
+    Create a player from its spec
+
+    Args:
+        player_spec (str): the player class, as "module:PlayerClass"
+        player_number (int): the number of the player
+
+    Returns:
+        Player: the new player
+    """
+    module_name, class_name = player_spec.split(":")
+    player_class = getattr(importlib.import_module(module_name), class_name)
+    return player_class(player_number)
+
+
+class CoordinatorServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    """
+    Give games to a connected worker until there is no game left
+    """
+
+    def handle(self):
+        coordinator: Coordinator = self.server.coordinator
+        self.request.settimeout(coordinator.job_timeout)
+
+        while True:
+            try:
+                job = coordinator.jobs.get(timeout=0.1)
+            except queue.Empty:
+                if coordinator.done.is_set():
+                    self.send({"type": "stop"})
+                    return
+                continue
+
+            try:
+                self.send(job)
+                answer = self.rfile.readline()
+                if not answer:
+                    raise ConnectionError("The worker left")
+                coordinator.add_result(job, json.loads(answer))
+            except (OSError, ValueError):
+                # The worker is lost, another one will play the game
+                coordinator.jobs.put(job)
+                return
+
+    def send(self, message: dict):
+        self.wfile.write((json.dumps(message) + "\n").encode())
+
+
+class Coordinator:
+    """
+    Hands out the games of a match to the workers and collects the results.
+    As in Tester.play_match, the seats are rotated from one game to the next.
+
+    Attributes:
+        tester (Tester): used to count and display the results,
+            its records_path is used to save the records
+        job_timeout (float): the maximum time in seconds to play a game,
+            after it the worker is considered lost
+    """
+
+    def __init__(
+        self,
+        player_specs: List[str],
+        nb_games: int,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+        job_timeout: Optional[float] = None,
+    ):
+        if not 2 <= len(player_specs) <= 3:
+            raise ValueError("A match is played between 2 or 3 players")
+
+        self.player_specs = list(player_specs)
+        self.player_names = [
+            load_player(spec, number).name()
+            for number, spec in enumerate(player_specs, 1)
+        ]
+        if len(set(self.player_names)) != len(self.player_names):
+            raise ValueError("The players should have different names")
+
+        self.nb_games = nb_games
+        self.job_timeout = job_timeout
+        self.tester = Tester()
+        self.tester.verbose_level = 1
+
+        self.jobs = queue.Queue()
+        for game_nb in range(nb_games):
+            shift = game_nb % len(player_specs)
+            seats = list(range(shift, len(player_specs))) + list(range(shift))
+            self.jobs.put(
+                {
+                    "type": "game",
+                    "game_nb": game_nb,
+                    "seats": seats,
+                    "players": [self.player_specs[seat] for seat in seats],
+                    "seed": None if seed is None else get_game_seed(seed, game_nb),
+                }
+            )
+
+        self.nb_victories = {player_name: 0 for player_name in self.player_names}
+        self.dic_win_lose_type = {player_name: {} for player_name in self.player_names}
+        self.played_games = set()
+        self.on_game_end = None
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+        self.server = CoordinatorServer((host, port), WorkerHandler)
+        self.server.coordinator = self
+
+    @property
+    def address(self):
+        """
+        The (host, port) the coordinator listens on
+        """
+        return self.server.server_address[:2]
+
+    def add_result(self, job: dict, result: dict):
+        """
+        Count the result of a game sent by a worker
+        """
+        seats = job["seats"]
+        record = GameRecord([self.player_names[seat] for seat in seats])
+        if result["winner"] is not None:
+            record.winner_number = result["winner"] + 1
+            record.winner_name = record.player_names[result["winner"]]
+        if result["loser"] is not None:
+            record.loser_name = record.player_names[result["loser"]]
+        record.reason = result["reason"]
+
+        with self.lock:
+            # A game given again after a timeout may be played twice
+            if job["game_nb"] in self.played_games:
+                return
+            self.played_games.add(job["game_nb"])
+
+            self.tester.display_message(f"Game {job['game_nb'] + 1}: {record}", 1)
+            self.tester.register_game(
+                record, self.nb_victories, self.dic_win_lose_type, self.on_game_end
+            )
+            if len(self.played_games) == self.nb_games:
+                self.done.set()
+
+    def run(self, on_game_end=None):
+        """
+        Wait for the workers to play all the games
+
+        Args:
+            on_game_end (callable): a function called with the GameRecord of
+                each game as soon as it is over
+
+        Returns:
+            dict: the number of victories for each player
+            dict: the different types of winning and loosing conditions
+        """
+        self.on_game_end = on_game_end
+        if self.nb_games == 0:
+            self.done.set()
+
+        server_thread = threading.Thread(target=self.server.serve_forever)
+        server_thread.start()
+        try:
+            self.done.wait()
+        finally:
+            self.server.shutdown()
+            server_thread.join()
+            self.server.server_close()
+
+        self.tester.display_results(self.nb_victories, self.nb_games)
+        return self.nb_victories, self.dic_win_lose_type
+
+
+def play_job(job: dict, tester: Tester) -> dict:
+    """
+    Play a game given by the coordinator
+
+    Returns:
+        dict: the compact result sent back to the coordinator
+    """
+    players = [
+        load_player(player_spec, number)
+        for number, player_spec in enumerate(job["players"], 1)
+    ]
+    record = tester.play_game(players, seed=job["seed"])
+
+    return {
+        "winner": None if record.winner_number is None else record.winner_number - 1,
+        "loser": (
+            None
+            if record.loser_name is None
+            else record.player_names.index(record.loser_name)
+        ),
+        "reason": record.reason,
+    }
+
+
+def run_worker(host: str, port: int) -> int:
+    """
+    Play the games given by a coordinator until it has no game left
+
+    Args:
+        host (str): the coordinator address
+        port (int): the coordinator port
+
+    Returns:
+        int: the number of games played
+    """
+    tester = Tester()
+    tester.verbose_level = 0
+
+    nb_games_played = 0
+    with socket.create_connection((host, port)) as connection:
+        stream = connection.makefile("rw")
+        for line in stream:
+            job = json.loads(line)
+            if job["type"] == "stop":
+                break
+
+            result = play_job(job, tester)
+            try:
+                stream.write(json.dumps(result) + "\n")
+                stream.flush()
+            except OSError:
+                # The coordinator gave up on this worker
+                break
+            nb_games_played += 1
+
+    return nb_games_played
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a match on several machines")
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator_parser = subparsers.add_parser(
+        "coordinator", help="Hand out the games to the workers"
+    )
+    coordinator_parser.add_argument("players", nargs="+", help="module:PlayerClass")
+    coordinator_parser.add_argument("--games", type=int, default=100)
+    coordinator_parser.add_argument("--host", default="0.0.0.0")
+    coordinator_parser.add_argument("--port", type=int, default=5555)
+    coordinator_parser.add_argument("--seed", type=int, default=None)
+    coordinator_parser.add_argument("--job-timeout", type=float, default=None)
+    coordinator_parser.add_argument("--records", default=None, help="Records file")
+
+    worker_parser = subparsers.add_parser("worker", help="Play games")
+    worker_parser.add_argument("--host", default="127.0.0.1")
+    worker_parser.add_argument("--port", type=int, default=5555)
+    worker_parser.add_argument("--processes", type=int, default=1)
+
+    args = parser.parse_args()
+
+    if args.role == "coordinator":
+        coordinator = Coordinator(
+            args.players, args.games, args.host, args.port, args.seed, args.job_timeout
+        )
+        coordinator.tester.records_path = args.records
+        print(f"Waiting for workers on {args.host}:{args.port}")
+        coordinator.run()
+    else:
+        workers = [
+            multiprocessing.Process(target=run_worker, args=(args.host, args.port))
+            for _ in range(args.processes)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
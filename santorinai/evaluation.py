@@ -0,0 +1,228 @@
+"""
+Score many positions at once with NumPy, to evaluate all the children
+of a position in a single call.
+
+The positions are encoded as two arrays:
+    levels (N, 25): the level of each square, square x * 5 + y
+    pawn_squares (N, nb_pawns): the square of each pawn, -1 if not placed
+
+Usage:
+    actions, scores = evaluate_actions(board)
+    best_action = actions[scores.argmax()]
+
+NumPy is an optional dependency: pip install santorinai[numpy]
+"""
+
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "santorinai.evaluation requires NumPy: pip install santorinai[numpy]"
+    ) from error
+
+from santorinai.board import BOARD_SIZE, NEIGHBOURS, SQUARES, Board
+
+NB_SQUARES = BOARD_SIZE * BOARD_SIZE
+
+# ADJACENCY[a, b] is True if the squares a and b are adjacent
+ADJACENCY = np.zeros((NB_SQUARES, NB_SQUARES), dtype=bool)
+for _x, _y in SQUARES:
+    for _nx, _ny in NEIGHBOURS[(_x, _y)]:
+        ADJACENCY[_x * BOARD_SIZE + _y, _nx * BOARD_SIZE + _ny] = True
+
+# The weight of each feature in the score, see compute_features
+DEFAULT_WEIGHTS = {
+    "win": 1000.0,
+    "height": 4.0,
+    "mobility": 1.0,
+    "own_threats": 5.0,
+    "opponent_threats": -50.0,
+    "domes": 0.5,
+}
+
+
+def encode_boards(boards: List[Board]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode boards with the same number of players
+
+    Args:
+        boards (list): the boards to encode
+
+    Returns:
+        np.ndarray: the levels, shape (N, 25)
+        np.ndarray: the pawn squares, shape (N, nb_pawns)
+    """
+    levels = np.array(
+        [[board.board[x][y] for x, y in SQUARES] for board in boards], dtype=np.int8
+    ).reshape(len(boards), NB_SQUARES)
+    pawn_squares = np.array(
+        [
+            [
+                -1 if pawn.pos[0] is None else pawn.pos[0] * BOARD_SIZE + pawn.pos[1]
+                for pawn in board.pawns
+            ]
+            for board in boards
+        ],
+        dtype=np.int64,
+    ).reshape(len(boards), -1)
+    return levels, pawn_squares
+
+
+def compute_features(
+    levels: np.ndarray, pawn_squares: np.ndarray, player_number: int, nb_players: int
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the features of a batch of positions for a player,
+    each feature is an array of shape (N,)
+
+    Features:
+        win: 1 if a pawn of the player is on a level 3, -1 for an opponent
+        height: the mean level under the player pawns minus the opponents one
+        mobility: the mean number of moves of the player pawns minus the
+            opponents one
+        own_threats: the number of player pawns able to climb to a level 3
+        opponent_threats: the number of opponent pawns able to climb to a level 3
+        domes: the number of domes next to the opponent pawns minus the
+            number of domes next to the player pawns
+
+    Args:
+        levels (np.ndarray): the levels, shape (N, 25)
+        pawn_squares (np.ndarray): the pawn squares, shape (N, nb_pawns)
+        player_number (int): the player the features are computed for
+        nb_players (int): the number of players
+
+    Returns:
+        dict: the features, by name
+    """
+    nb_positions, nb_pawns = pawn_squares.shape
+    levels = levels.astype(np.int64)
+
+    placed = pawn_squares >= 0
+    squares = np.where(placed, pawn_squares, 0)
+    pawn_levels = np.where(placed, np.take_along_axis(levels, squares, axis=1), 0)
+
+    occupied = np.zeros((nb_positions, NB_SQUARES), dtype=bool)
+    rows, pawns = np.nonzero(placed)
+    occupied[rows, pawn_squares[rows, pawns]] = True
+
+    # (N, nb_pawns, 25) masks of the squares around each pawn
+    neighbours = ADJACENCY[squares] & placed[:, :, None]
+    reachable = (
+        neighbours
+        & ((levels != 4) & ~occupied)[:, None, :]
+        & (levels[:, None, :] <= pawn_levels[:, :, None] + 1)
+    )
+    mobility = reachable.sum(axis=2)
+    threats = (reachable & (levels[:, None, :] == 3)).any(axis=2)
+    domes = (neighbours & (levels[:, None, :] == 4)).sum(axis=2)
+    on_top = placed & (pawn_levels == 3)
+
+    own = np.arange(nb_pawns) % nb_players == player_number - 1
+    opponents = ~own
+
+    def mean(values, pawn_mask):
+        return values[:, pawn_mask].mean(axis=1)
+
+    return {
+        "win": on_top[:, own].any(axis=1).astype(np.float64)
+        - on_top[:, opponents].any(axis=1),
+        "height": mean(pawn_levels, own) - mean(pawn_levels, opponents),
+        "mobility": mean(mobility, own) - mean(mobility, opponents),
+        "own_threats": threats[:, own].sum(axis=1).astype(np.float64),
+        "opponent_threats": threats[:, opponents].sum(axis=1).astype(np.float64),
+        "domes": mean(domes, opponents) - mean(domes, own),
+    }
+
+
+def evaluate_positions(
+    levels: np.ndarray,
+    pawn_squares: np.ndarray,
+    player_number: int,
+    nb_players: int,
+    weights: Dict[str, float] = None,
+) -> np.ndarray:
+    """
+    Score a batch of positions for a player, the higher the better
+
+    Args:
+        levels (np.ndarray): the levels, shape (N, 25)
+        pawn_squares (np.ndarray): the pawn squares, shape (N, nb_pawns)
+        player_number (int): the player the positions are scored for
+        nb_players (int): the number of players
+        weights (dict): the weight of each feature, DEFAULT_WEIGHTS if None
+
+    Returns:
+        np.ndarray: the scores, shape (N,)
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+
+    features = compute_features(levels, pawn_squares, player_number, nb_players)
+    scores = np.zeros(len(levels))
+    for name, weight in weights.items():
+        scores += weight * features[name]
+    return scores
+
+
+def get_child_positions(
+    board: Board,
+) -> Tuple[List[Tuple[int, Tuple[int, int], Tuple[int, int]]], np.ndarray, np.ndarray]:
+    """
+    Get the positions reached by every possible move of the playing player,
+    all the pawns being placed
+
+    Args:
+        board (Board): the current board
+
+    Returns:
+        list: the actions (pawn order, move position, build position)
+        np.ndarray: the levels of the child positions, shape (A, 25)
+        np.ndarray: the pawn squares of the child positions, shape (A, nb_pawns)
+    """
+    actions = []
+    pawn_indexes = []
+    for pawn in board.get_player_pawns(board.player_turn):
+        for move, build in board.iter_actions(pawn):
+            actions.append((pawn.order, move, build))
+            pawn_indexes.append(pawn.number - 1)
+
+    levels, pawn_squares = encode_boards([board])
+    nb_actions = len(actions)
+    levels = np.repeat(levels, nb_actions, axis=0)
+    pawn_squares = np.repeat(pawn_squares, nb_actions, axis=0)
+    if nb_actions == 0:
+        return actions, levels, pawn_squares
+
+    moves = np.array([move[0] * BOARD_SIZE + move[1] for _, move, _ in actions])
+    builds = np.array([build[0] * BOARD_SIZE + build[1] for _, _, build in actions])
+    rows = np.arange(nb_actions)
+
+    # A pawn reaching a level 3 wins before building
+    winning = levels[rows, moves] == 3
+    levels[rows[~winning], builds[~winning]] += 1
+    pawn_squares[rows, pawn_indexes] = moves
+
+    return actions, levels, pawn_squares
+
+
+def evaluate_actions(
+    board: Board, weights: Dict[str, float] = None
+) -> Tuple[List[Tuple[int, Tuple[int, int], Tuple[int, int]]], np.ndarray]:
+    """
+    Score every possible move of the playing player by the position it leads to
+
+    Args:
+        board (Board): the current board, all the pawns being placed
+        weights (dict): the weight of each feature, DEFAULT_WEIGHTS if None
+
+    Returns:
+        list: the actions (pawn order, move position, build position)
+        np.ndarray: the score of each action for the playing player
+    """
+    actions, levels, pawn_squares = get_child_positions(board)
+    scores = evaluate_positions(
+        levels, pawn_squares, board.player_turn, board.nb_players, weights
+    )
+    return actions, scores
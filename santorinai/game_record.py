@@ -0,0 +1,106 @@
+import json
+from typing import Iterator, List, Optional, Tuple
+
+
+class GameRecord:
+    """
+    The record of a played game: the players, their actions and the result.
+
+    Attributes:
+        player_names (list): The names of the players, in playing order.
+        placements (list): The pawn placement positions, in playing order.
+        moves (list): The moves (pawn_order, move_position, build_position),
+            in playing order.
+        winner_name (str): The name of the winning player, None for a draw.
+        winner_number (int): The seat of the winning player, from 1, None
+            for a draw. Unlike the name, it tells the winner apart when the
+            same player plays several seats. None in the records saved
+            before it was recorded.
+        loser_name (str): The name of the player who lost by playing an invalid
+            action, None if the game ended normally.
+        reason (str): Why the game ended.
+    """
+
+    def __init__(self, player_names: List[str]):
+        self.player_names = list(player_names)
+        self.placements: List[Tuple[int, int]] = []
+        self.moves: List[Tuple[int, Tuple[int, int], Tuple[int, int]]] = []
+        self.winner_name: Optional[str] = None
+        self.winner_number: Optional[int] = None
+        self.loser_name: Optional[str] = None
+        self.reason: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """
+        Convert the record into a JSON serializable dictionary
+        """
+        return {
+            "player_names": self.player_names,
+            "placements": self.placements,
+            "moves": self.moves,
+            "winner_name": self.winner_name,
+            "winner_number": self.winner_number,
+            "loser_name": self.loser_name,
+            "reason": self.reason,
+        }
+
+    @staticmethod
+    def from_dict(record_dict: dict) -> "GameRecord":
+        """
+        Create a record from a dictionary made by to_dict
+        """
+        record = GameRecord(record_dict["player_names"])
+        record.placements = [to_position(pos) for pos in record_dict["placements"]]
+        record.moves = [
+            (pawn_order, to_position(move), to_position(build))
+            for pawn_order, move, build in record_dict["moves"]
+        ]
+        record.winner_name = record_dict["winner_name"]
+        record.winner_number = record_dict.get("winner_number")
+        record.loser_name = record_dict.get("loser_name")
+        record.reason = record_dict["reason"]
+        return record
+
+    def __repr__(self) -> str:
+        return (
+            f"Game {' VS '.join(self.player_names)}: "
+            f"{len(self.placements)} placements, {len(self.moves)} moves, "
+            f"winner: {self.winner_name}"
+        )
+
+
+def to_position(position) -> Optional[Tuple[int, int]]:
+    """
+    Convert a position loaded from JSON (a list) back to a tuple
+    """
+    if position is None:
+        return None
+    return tuple(position)
+
+
+def append_record(records_path: str, record: GameRecord):
+    """
+    Append a game record to a records archive (one JSON record per line)
+
+    Args:
+        records_path (str): The path of the archive.
+        record (GameRecord): The record to save.
+    """
+    with open(records_path, "a") as f:
+        f.write(json.dumps(record.to_dict()) + "\n")
+
+
+def load_records(records_path: str) -> Iterator[GameRecord]:
+    """
+    Read the game records of an archive one by one
+
+    Args:
+        records_path (str): The path of the archive.
+
+    Returns:
+        Iterator[GameRecord]: The records, in the order they were saved.
+    """
+    with open(records_path) as f:
+        for line in f:
+            if line.strip():
+                yield GameRecord.from_dict(json.loads(line))
@@ -24,7 +24,21 @@ class Pawn:
         self.number = number  # 1 to 6 depending on the number of pawns
         self.order = order  # 1 or 2
         self.player_number = player_number  # 1, 2 or 3 depending on players number
-        self.pos = (None, None)
+        self.board = None  # The board indexing the pawn position, if any
+        self._pos = (None, None)
+
+    @property
+    def pos(self) -> Tuple[int, int]:
+        """
+        The position of the pawn, (None, None) if it is not placed yet
+        """
+        return self._pos
+
+    @pos.setter
+    def pos(self, new_pos: Tuple[int, int]):
+        if self.board is not None:
+            self.board.update_pawn_position(self, self._pos, new_pos)
+        self._pos = new_pos
 
     def move(self, new_pos: Tuple[int, int]):
         """
@@ -42,6 +56,15 @@ class Pawn:
         new_pawn.pos = self.pos
         return new_pawn
 
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle a pawn of a board as its pawn in the pickled board, the boards
+        being pickled with their compact encoding (see Board.__reduce_ex__)
+        """
+        if self.board is None or not self.board.is_encodable():
+            return super().__reduce_ex__(protocol)
+        return self.board.get_player_pawn, (self.player_number, self.order)
+
     def __repr__(self):
         return (
             f"pawn n°{self.order} of player {self.player_number} at position {self.pos}"
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+import random
 
 from santorinai.board import Board
 from santorinai.pawn import Pawn
@@ -8,11 +9,23 @@ from typing import Tuple
 class Player:
     """
     A player of Santorini, has a name and can play a move given a board
+
+    Random choices should be made with self.rng: when the Tester is given a seed,
+    it replaces it before each game with a generator seeded for the game and
+    the seat of the player, making the game reproducible.
     """
 
     def __init__(self, player_number: int, log_level=0) -> None:
         self.log_level = log_level
         self.player_number = player_number
+        self.rng = random.Random()
+
+    def new_game(self):
+        """
+        Called by the Tester when a game starts, before the first request,
+        players keeping a state between requests can reset it here
+        """
+        pass
 
     @abstractmethod
     def name(self):
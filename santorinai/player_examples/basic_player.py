@@ -1,7 +1,6 @@
 from santorinai.player import Player
 from santorinai.board import Board
 from santorinai.pawn import Pawn
-from random import choice
 from typing import Tuple
 
 
@@ -58,14 +57,14 @@ class BasicPlayer(Player):
             or ally_pawn.pos[1] is not None
         ):
             # First pawn to place
-            return choice(available_positions)
+            return self.rng.choice(available_positions)
 
         # Place second pawn next to the first one if possible
         for pos in available_positions:
             if board.is_position_adjacent(pos, ally_pawn.pos):
                 return pos
 
-        return choice(available_positions)
+        return self.rng.choice(available_positions)
 
     def play_move(self, board):
         available_pawns = []
@@ -124,10 +123,11 @@ class BasicPlayer(Player):
             if self.log_level:
                 print("Moving up")
             best_pawn = available_pawns[best_spot_pawn_idx]
-            best_pawn.move(best_spot)
-            available_build_pos = board.get_possible_building_positions(best_pawn)
+            available_build_pos = list(
+                board.iter_builds_after_move(best_pawn, best_spot)
+            )
             if available_build_pos:
-                build_choice = choice(available_build_pos)
+                build_choice = self.rng.choice(available_build_pos)
             else:
                 build_choice = None
 
@@ -137,10 +137,10 @@ class BasicPlayer(Player):
             print("Random move")
 
         # play randomly
-        pawn = choice(board.get_player_pawns(self.player_number))
+        pawn = self.rng.choice(board.get_player_pawns(self.player_number))
         t_move_build = board.get_possible_movement_and_building_positions(pawn)
         if t_move_build:
-            t_move_build = choice(t_move_build)
+            t_move_build = self.rng.choice(t_move_build)
         else:
             t_move_build = (None, None)
         return (pawn.order,) + t_move_build
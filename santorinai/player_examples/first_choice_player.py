@@ -24,24 +24,11 @@ class FirstChoicePlayer(Player):
         l_pawns = board.get_player_pawns(self.player_number)
         pawn = l_pawns[0]
 
-        # Get movement positions
-        available_move_positions = board.get_possible_movement_positions(pawn)
-        if len(available_move_positions) == 0:
+        # Take the first possible move and build
+        action = next(board.iter_actions(pawn), None)
+        if action is None:
             # The pawn cannot move
             return pawn.order, None, None
 
-        my_move_choice = available_move_positions[0]
-
-        # Simulate the move (Need to use pawn copy since returned pawn will be moved)
-        pawn.move(my_move_choice)
-
-        # Get construction positions
-        available_build_positions = board.get_possible_building_positions(pawn)
-        if len(available_build_positions) == 0:
-            # The pawn cannot build
-            raise Exception("Pawn cannot build")
-
-        # Their is always at least one position available
-        my_build_choice = available_build_positions[0]
-
+        my_move_choice, my_build_choice = action
         return pawn.order, my_move_choice, my_build_choice
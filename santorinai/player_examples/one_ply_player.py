@@ -0,0 +1,50 @@
+from santorinai.player import Player
+from santorinai.board import Board
+from santorinai.pawn import Pawn
+from santorinai.evaluation import evaluate_actions
+
+
+class OnePlyPlayer(Player):
+    """
+    A player that scores the positions reached by all its possible moves
+    in a single batched evaluation, and plays the best one.
+    Needs NumPy.
+
+    :weights: the weight of each feature, see santorinai.evaluation
+    """
+
+    def __init__(self, player_number, log_level=0, weights=None) -> None:
+        super().__init__(player_number, log_level)
+        self.weights = weights
+
+    def name(self):
+        return "Ollie One Ply"
+
+    def place_pawn(self, board: Board, pawn: Pawn):
+        # Place the pawns as close to the center as possible
+        available_positions = board.get_possible_movement_positions(pawn)
+        center = board.board_size // 2
+        best_distance = min(
+            max(abs(x - center), abs(y - center)) for x, y in available_positions
+        )
+        return self.rng.choice(
+            [
+                (x, y)
+                for x, y in available_positions
+                if max(abs(x - center), abs(y - center)) == best_distance
+            ]
+        )
+
+    def play_move(self, board: Board):
+        actions, scores = evaluate_actions(board, self.weights)
+        if not actions:
+            return None, None, None
+
+        # Draw one of the best actions
+        best_score = scores.max()
+        best_actions = [
+            action for action, score in zip(actions, scores) if score == best_score
+        ]
+        if self.log_level:
+            print(f"{len(actions)} actions, best score {best_score}")
+        return self.rng.choice(best_actions)
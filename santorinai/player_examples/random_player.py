@@ -1,5 +1,4 @@
 from santorinai import Player, Board, Pawn
-from random import choice
 
 
 class RandomPlayer(Player):
@@ -15,19 +14,9 @@ class RandomPlayer(Player):
 
     def place_pawn(self, board: Board, pawn: Pawn):
         available_positions = board.get_possible_movement_positions(pawn)
-        my_choice = choice(available_positions)
+        my_choice = self.rng.choice(available_positions)
         return my_choice
 
     def play_move(self, board: Board):
-        # List all possible moves
-        all_possible_pawns_moves = []
-        for pawn in board.get_player_pawns(self.player_number):
-            pawn_moves = board.get_possible_movement_and_building_positions(pawn)
-            # Add the pawn number to the possible moves
-            all_possible_pawns_moves += [
-                (pawn.order, move, build) for move, build in pawn_moves
-            ]
-
-        my_move_choice = choice(all_possible_pawns_moves)
-
-        return my_move_choice
+        # Draw one of all the possible moves
+        return board.sample_random_move(self.rng)
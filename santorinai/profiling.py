@@ -0,0 +1,227 @@
+"""
+Profile the games of a match with cProfile.
+
+Each profiled game writes its statistics in <profile_dir>/games/, from the
+main process or from a worker process. At the end of the match, they are
+merged in <profile_dir>/merged.prof (readable with pstats or snakeviz), and
+a report is written in <profile_dir>/report.txt: the time spent by each
+player choosing its actions, the time spent by the engine (rules, board
+copies, tester), and the functions taking the most time.
+
+Usage:
+    tester.profile_dir = "profiles"
+    tester.profile_every = 10  # Profile one game out of 10
+    tester.play_match([player1, player2], nb_games=1000, workers=4)
+"""
+
+import cProfile
+import glob
+import io
+import os
+import pstats
+from typing import Dict, List, Tuple
+
+from santorinai.player import Player
+
+# The player methods choosing the actions
+PLAYER_METHODS = ["place_pawn", "play_move"]
+
+ENGINE = "engine"
+OTHER = "other"
+
+SANTORINAI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_games_dir(profile_dir: str) -> str:
+    return os.path.join(profile_dir, "games")
+
+
+def clear_profiles(profile_dir: str):
+    """
+    Remove the game profiles of a previous match
+    """
+    for path in glob.glob(os.path.join(get_games_dir(profile_dir), "*.prof")):
+        os.remove(path)
+
+
+def get_game_profile_path(profile_dir: str, game_nb: int) -> str:
+    """
+    Get the profile file of a game of a match
+    """
+    return os.path.join(get_games_dir(profile_dir), f"game_{game_nb:06d}.prof")
+
+
+def save_profile(profiler: cProfile.Profile, profile_path: str):
+    """
+    Save the statistics of a profiler
+    """
+    os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+    profiler.dump_stats(profile_path)
+
+
+def profile_call(profile_path: str, function, *args, **kwargs):
+    """
+    Call a function under cProfile and save its statistics
+
+    Args:
+        profile_path (str): the file of the statistics
+        function (callable): the function to call
+
+    Returns:
+        the result of the function
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        save_profile(profiler, profile_path)
+
+
+def profile_game(profile_dir: str, game_nb: int, function, *args, **kwargs):
+    """
+    Play a game under cProfile, see profile_call
+
+    Args:
+        profile_dir (str): the profiles directory
+        game_nb (int): the number of the game in the match, naming its profile
+        function (callable): the function playing the game
+
+    Returns:
+        the result of the function
+    """
+    return profile_call(
+        get_game_profile_path(profile_dir, game_nb), function, *args, **kwargs
+    )
+
+
+def get_player_entries(players: List[Player]) -> Dict[tuple, str]:
+    """
+    Get the statistics keys of the methods of the players choosing their
+    actions, players of the same class share their methods
+
+    Args:
+        players (list): the players
+
+    Returns:
+        dict: (file, line, function name) -> label of the players
+    """
+    labels = {}
+    for player in players:
+        for method_name in PLAYER_METHODS:
+            code = getattr(getattr(type(player), method_name, None), "__code__", None)
+            if code is None:
+                continue
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            labels.setdefault(key, [])
+            if player.name() not in labels[key]:
+                labels[key].append(player.name())
+    return {key: ", ".join(names) for key, names in labels.items()}
+
+
+def get_owner(filename: str, player_files: Dict[str, str]) -> str:
+    """
+    Get who a function belongs to: a player, the engine or other code
+    (standard library, builtins)
+    """
+    if filename in player_files:
+        return player_files[filename]
+    if os.path.abspath(filename).startswith(SANTORINAI_DIR):
+        return ENGINE
+    return OTHER
+
+
+def get_time_split(
+    stats: pstats.Stats, players: List[Player]
+) -> List[Tuple[str, float]]:
+    """
+    Split the total time between the players and the engine: the time of a
+    player is the cumulative time of its place_pawn and play_move methods,
+    the engine gets the rest
+
+    Args:
+        stats (pstats.Stats): the statistics of the games
+        players (list): the players of the games
+
+    Returns:
+        list: (owner, time in seconds), the engine first
+    """
+    player_times = {}
+    for key, label in get_player_entries(players).items():
+        if key in stats.stats:
+            cumulative_time = stats.stats[key][3]
+            player_times[label] = player_times.get(label, 0.0) + cumulative_time
+
+    engine_time = stats.total_tt - sum(player_times.values())
+    return [(ENGINE, engine_time)] + sorted(
+        player_times.items(), key=lambda item: -item[1]
+    )
+
+
+def format_report(stats: pstats.Stats, players: List[Player], nb_games, top=20):
+    """
+    Format the profiling report of games
+
+    Args:
+        stats (pstats.Stats): the statistics of the games
+        players (list): the players of the games
+        nb_games (int): the number of profiled games
+        top (int): the number of functions listed
+
+    Returns:
+        str: the report
+    """
+    total_time = stats.total_tt
+    lines = [f"Profile of {nb_games} games: {total_time:.3f} s", ""]
+
+    lines.append("Time split:")
+    for owner, owner_time in get_time_split(stats, players):
+        share = owner_time / total_time * 100 if total_time else 0
+        lines.append(f"  {owner:<40} {owner_time:>10.3f} s {share:>6.1f}%")
+
+    player_files = {}
+    for (filename, _, _), label in get_player_entries(players).items():
+        player_files[filename] = label
+
+    lines.append("")
+    lines.append(f"Top {top} functions by own time:")
+    lines.append(
+        f"  {'own time':>10} {'cum. time':>10} {'calls':>10}  {'owner':<24} function"
+    )
+    entries = sorted(stats.stats.items(), key=lambda item: -item[1][2])
+    for (filename, line, function_name), entry in entries[:top]:
+        _, nb_calls, own_time, cumulative_time, _ = entry
+        owner = get_owner(filename, player_files)
+        location = f"{os.path.basename(filename)}:{line}({function_name})"
+        lines.append(
+            f"  {own_time:>10.3f} {cumulative_time:>10.3f} {nb_calls:>10}  "
+            f"{owner:<24} {location}"
+        )
+
+    return "\n".join(lines)
+
+
+def merge_profiles(profile_dir: str, players: List[Player], top: int = 20):
+    """
+    Merge the game profiles in merged.prof and write the report in report.txt
+
+    Args:
+        profile_dir (str): the profiles directory
+        players (list): the players of the games
+        top (int): the number of functions listed in the report
+
+    Returns:
+        str: the report, None if no game was profiled
+    """
+    paths = sorted(glob.glob(os.path.join(get_games_dir(profile_dir), "*.prof")))
+    if not paths:
+        return None
+
+    stats = pstats.Stats(paths[0], stream=io.StringIO())
+    for path in paths[1:]:
+        stats.add(path)
+    stats.dump_stats(os.path.join(profile_dir, "merged.prof"))
+
+    report = format_report(stats, players, len(paths), top)
+    with open(os.path.join(profile_dir, "report.txt"), "w") as f:
+        f.write(report + "\n")
+    return report
@@ -0,0 +1,168 @@
+from itertools import combinations
+from math import exp, log, pi, sqrt
+from typing import Dict, Iterable, List, Tuple
+
+from santorinai.game_record import GameRecord
+
+Q = log(10) / 400
+
+
+class PlayerRating:
+    """
+    The rating of a player: an Elo-like rating and its uncertainty.
+
+    Attributes:
+        rating (float): The estimated rating.
+        deviation (float): The standard deviation of the estimation.
+        nb_games (int): The number of games taken into account.
+    """
+
+    def __init__(self, rating: float, deviation: float):
+        self.rating = rating
+        self.deviation = deviation
+        self.nb_games = 0
+
+    def confidence_interval(self, z: float = 1.96) -> Tuple[float, float]:
+        """
+        The confidence interval of the rating (95% by default)
+        """
+        return self.rating - z * self.deviation, self.rating + z * self.deviation
+
+    def __repr__(self) -> str:
+        return f"{self.rating:.0f} ± {1.96 * self.deviation:.0f}"
+
+
+def g(deviation: float) -> float:
+    """
+    Reduce the impact of a game against an opponent with an uncertain rating
+    """
+    return 1 / sqrt(1 + 3 * (Q * deviation) ** 2 / pi**2)
+
+
+class Ratings:
+    """
+    Ratings of a pool of players, updated game by game.
+
+    The ratings follow the Glicko system: an Elo rating completed by a rating
+    deviation that shrinks as games are played, giving a confidence interval.
+    Every game is a rating period of its own, so each update only touches the
+    players of the game and costs O(1), whatever the number of players
+    and games.
+
+    In a 3 players game, the winner is considered as having beaten
+    each of the other players.
+
+    Usage:
+        ratings = Ratings()
+        tester.play_1v1(player1, player2, nb_games, on_game_end=ratings.add_record)
+        print(ratings)
+    """
+
+    def __init__(self, initial_rating: float = 1500, initial_deviation: float = 350):
+        self.initial_rating = initial_rating
+        self.initial_deviation = initial_deviation
+        self.players: Dict[str, PlayerRating] = {}
+
+    def get(self, player_name: str) -> PlayerRating:
+        """
+        Get the rating of a player, a new player gets the initial rating
+        """
+        if player_name not in self.players:
+            self.players[player_name] = PlayerRating(
+                self.initial_rating, self.initial_deviation
+            )
+        return self.players[player_name]
+
+    def expected_score(self, player_name: str, opponent_name: str) -> float:
+        """
+        The expected score of a player against an opponent, between 0 and 1
+        """
+        player = self.get(player_name)
+        opponent = self.get(opponent_name)
+        return 1 / (
+            1 + exp(-Q * g(opponent.deviation) * (player.rating - opponent.rating))
+        )
+
+    def add_result(self, player_name: str, opponent_name: str, score: float):
+        """
+        Update the ratings of two players after a game
+
+        Args:
+            player_name (str): The name of the first player.
+            opponent_name (str): The name of the second player.
+            score (float): The score of the first player:
+                1 for a win, 0.5 for a draw and 0 for a loss.
+        """
+        player = self.get(player_name)
+        opponent = self.get(opponent_name)
+
+        # Both updates use the ratings from before the game
+        updates = []
+        for rated, other, rated_score in (
+            (player, opponent, score),
+            (opponent, player, 1 - score),
+        ):
+            g_other = g(other.deviation)
+            expected = 1 / (1 + exp(-Q * g_other * (rated.rating - other.rating)))
+            inv_d2 = Q**2 * g_other**2 * expected * (1 - expected)
+            inv_variance = 1 / rated.deviation**2 + inv_d2
+            rating = rated.rating + Q / inv_variance * g_other * (
+                rated_score - expected
+            )
+            updates.append((rated, rating, sqrt(1 / inv_variance)))
+
+        for rated, rating, deviation in updates:
+            rated.rating = rating
+            rated.deviation = deviation
+            rated.nb_games += 1
+
+    def add_game(self, player_names: List[str], winner_name: str = None):
+        """
+        Update the ratings with the result of a game
+
+        Args:
+            player_names (list): The names of the players of the game.
+            winner_name (str): The name of the winner, None for a draw.
+        """
+        if winner_name is None:
+            for player_name, opponent_name in combinations(player_names, 2):
+                self.add_result(player_name, opponent_name, 0.5)
+            return
+
+        for player_name in player_names:
+            if player_name != winner_name:
+                self.add_result(winner_name, player_name, 1)
+
+    def add_record(self, record: GameRecord):
+        """
+        Update the ratings with a game record, can be given to the Tester
+        as on_game_end callback
+        """
+        self.add_game(record.player_names, record.winner_name)
+
+    def add_records(self, records: Iterable[GameRecord]):
+        """
+        Update the ratings with a stream of game records,
+        for example from santorinai.game_record.load_records
+        """
+        for record in records:
+            self.add_record(record)
+
+    def leaderboard(self) -> List[Tuple[str, PlayerRating]]:
+        """
+        The players sorted by rating, best first
+        """
+        return sorted(
+            self.players.items(), key=lambda item: item[1].rating, reverse=True
+        )
+
+    def __repr__(self) -> str:
+        output = "| Rank | Player | Rating | 95% interval | Games |\n"
+        output += "| ---- | ------ | ------ | ------------ | ----- |\n"
+        for rank, (name, rating) in enumerate(self.leaderboard(), 1):
+            low, high = rating.confidence_interval()
+            output += (
+                f"| {rank} | {name} | {rating.rating:.0f} "
+                f"| {low:.0f} - {high:.0f} | {rating.nb_games} |\n"
+            )
+        return output
@@ -0,0 +1,194 @@
+from typing import List, Optional, Tuple
+
+from santorinai.board import Board
+from santorinai.game_record import GameRecord
+
+
+class Replay:
+    """
+    Browse the positions of a recorded game.
+
+    The game is replayed once: a copy of the board is kept every
+    snapshot_interval plies, and each ply is stored as a delta that can be
+    applied or undone. Seeking to a ply restores the closest snapshot, or
+    steps from the current position if it is closer, so it costs at most
+    snapshot_interval deltas whatever the length of the game.
+
+    Ply 0 is the empty board, ply n the board after the n first actions
+    (pawn placements, then moves).
+
+    Usage:
+        replay = Replay(record)
+        board = replay.seek(42)
+        board = replay.step(-1)
+
+    The board returned is the replay's own board, it is updated by the next
+    seek or step: copy it to keep it.
+
+    Attributes:
+        record (GameRecord): The replayed game.
+        board (Board): The board at the current ply.
+        ply (int): The current ply.
+        nb_plies (int): The number of plies of the game.
+    """
+
+    def __init__(self, record: GameRecord, snapshot_interval: int = 16):
+        if snapshot_interval < 1:
+            raise ValueError("The snapshot interval should be at least 1")
+
+        self.record = record
+        self.snapshot_interval = snapshot_interval
+        self.snapshots: List[Board] = []
+        # Each delta: (pawn number, old position, new position,
+        #   build position or None, state before, state after)
+        # a state being (turn number, player turn, winner player number)
+        self.deltas: List[tuple] = []
+
+        board = Board(len(record.player_names))
+        self.snapshots.append(board.copy())
+
+        for position in record.placements:
+            pawn = board.get_first_unplaced_player_pawn(board.player_turn)
+            state = self.get_state(board)
+            success, _ = board.place_pawn(position)
+            if not success:
+                break
+            self.add_delta(board, pawn, (None, None), None, state)
+        else:
+            for pawn_order, move, build in record.moves:
+                pawn = board.get_playing_pawn(pawn_order)
+                old_position = pawn.pos
+                # A winning move may be recorded without build: None or (None, None)
+                if build is None or build[0] is None:
+                    build = level = None
+                else:
+                    level = board.board[build[0]][build[1]]
+                state = self.get_state(board)
+                success, _ = board.play_move(pawn_order, move, build)
+                if not success:
+                    # The invalid action that lost the game
+                    break
+                if build is not None and board.board[build[0]][build[1]] == level:
+                    # A winning move, the build is not played
+                    build = None
+                self.add_delta(board, pawn, old_position, build, state)
+
+        self.nb_plies = len(self.deltas)
+        self.board = board
+        self.ply = self.nb_plies
+
+    @staticmethod
+    def get_state(board: Board) -> Tuple[int, int, Optional[int]]:
+        """
+        Get the turn state of a board
+        """
+        return board.turn_number, board.player_turn, board.winner_player_number
+
+    @staticmethod
+    def set_state(board: Board, state: Tuple[int, int, Optional[int]]):
+        """
+        Set the turn state of a board
+        """
+        board.turn_number, board.player_turn, board.winner_player_number = state
+
+    def add_delta(self, board: Board, pawn, old_position, build, state_before):
+        """
+        Store the delta of the ply just played on the board
+        """
+        self.deltas.append(
+            (
+                pawn.number,
+                old_position,
+                pawn.pos,
+                build,
+                state_before,
+                self.get_state(board),
+            )
+        )
+        if len(self.deltas) % self.snapshot_interval == 0:
+            self.snapshots.append(board.copy())
+
+    def apply_delta(self, ply: int):
+        """
+        Go from ply - 1 to ply
+        """
+        pawn_number, _, new_position, build, _, state_after = self.deltas[ply - 1]
+        self.board.pawns[pawn_number - 1].pos = new_position
+        if build is not None:
+            self.board.board[build[0]][build[1]] += 1
+        self.set_state(self.board, state_after)
+
+    def undo_delta(self, ply: int):
+        """
+        Go from ply to ply - 1
+        """
+        pawn_number, old_position, _, build, state_before, _ = self.deltas[ply - 1]
+        if build is not None:
+            self.board.board[build[0]][build[1]] -= 1
+        self.board.pawns[pawn_number - 1].pos = old_position
+        self.set_state(self.board, state_before)
+
+    def seek(self, ply: int) -> Board:
+        """
+        Go to a ply, clamped between 0 and nb_plies
+
+        Args:
+            ply (int): The ply to go to.
+
+        Returns:
+            Board: The board at this ply.
+        """
+        ply = max(0, min(ply, self.nb_plies))
+
+        snapshot_index = ply // self.snapshot_interval
+        snapshot_ply = snapshot_index * self.snapshot_interval
+        if abs(ply - self.ply) > ply - snapshot_ply:
+            self.board = self.snapshots[snapshot_index].copy()
+            self.ply = snapshot_ply
+
+        while self.ply < ply:
+            self.ply += 1
+            self.apply_delta(self.ply)
+        while self.ply > ply:
+            self.undo_delta(self.ply)
+            self.ply -= 1
+
+        return self.board
+
+    def step(self, nb_plies: int = 1) -> Board:
+        """
+        Go forward, or backward with a negative number of plies
+
+        Args:
+            nb_plies (int): The number of plies to go forward.
+
+        Returns:
+            Board: The board at the new ply.
+        """
+        return self.seek(self.ply + nb_plies)
+
+    def get_ply_description(self, ply: int) -> str:
+        """
+        Describe the action leading to a ply
+
+        Args:
+            ply (int): The ply.
+
+        Returns:
+            str: The description of the action, or of the game start.
+        """
+        if ply <= 0:
+            return "Game start"
+
+        pawn_number, old_position, new_position, build, state, _ = self.deltas[ply - 1]
+        player_name = self.record.player_names[state[1] - 1]
+        if old_position[0] is None:
+            return f"{player_name} places pawn {pawn_number} on {new_position}"
+
+        description = (
+            f"{player_name} moves pawn {pawn_number} "
+            f"from {old_position} to {new_position}"
+        )
+        if build is not None:
+            description += f" and builds on {build}"
+        return description
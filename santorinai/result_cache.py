@@ -0,0 +1,198 @@
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sysconfig
+import time
+from typing import List, Optional
+
+from santorinai.board import Board
+from santorinai.game_record import GameRecord
+from santorinai.player import Player
+
+
+def get_source_hash(obj) -> str:
+    """
+    Hash the source file where a class or module is defined
+    """
+    try:
+        with open(inspect.getfile(obj), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return "unknown"
+
+
+# The standard library, its classes are not part of the players code. The
+# installed packages may be inside it, their classes are part of the code.
+STDLIB_PATH = os.path.abspath(sysconfig.get_path("stdlib")) + os.sep
+PACKAGES_PATHS = tuple(
+    os.path.abspath(path) + os.sep
+    for path in {sysconfig.get_path("purelib"), sysconfig.get_path("platlib")}
+    if path
+)
+
+
+def is_stdlib_class(player_class: type) -> bool:
+    """
+    Check if a class is a builtin or standard library class
+    """
+    try:
+        path = os.path.abspath(inspect.getfile(player_class))
+    except TypeError:
+        # A builtin class
+        return True
+    return path.startswith(STDLIB_PATH) and not path.startswith(PACKAGES_PATHS)
+
+
+def get_player_version(player: Player) -> str:
+    """
+    Get the version of a player: its "version" attribute if it has one,
+    otherwise a hash of the source files of the classes of its MRO, except
+    the builtin and standard library classes and the Player base class.
+    The installed players are hashed too, so a new release of a package
+    invalidates its results.
+
+    The other modules the player code calls (helpers, evaluation functions)
+    are not hashed: players whose behavior depends on them, or on options
+    given to their constructor, should set a version attribute reflecting
+    them.
+    """
+    version = getattr(player, "version", None)
+    if version is not None:
+        return str(version)
+
+    source_hashes = [
+        get_source_hash(player_class)
+        for player_class in type(player).__mro__
+        if player_class is not Player and not is_stdlib_class(player_class)
+    ]
+    return hashlib.sha256(" ".join(source_hashes).encode()).hexdigest()
+
+
+def get_game_key(players: List[Player], seed) -> str:
+    """
+    Get the cache key of a game: the players (class, version and name)
+    in seat order, the seed of the game and the version of the game rules.
+
+    Args:
+        players (list): the players, in playing order
+        seed: the seed of the game
+
+    Returns:
+        str: the key of the game
+    """
+    key = {
+        "players": [
+            [
+                f"{type(player).__module__}.{type(player).__qualname__}",
+                get_player_version(player),
+                player.name(),
+            ]
+            for player in players
+        ],
+        "seed": seed,
+        "rules": get_source_hash(Board),
+    }
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    A local on-disk store of game records, to skip the games already played
+    by deterministic players with the same seed.
+
+    When the store grows over max_size bytes, the least recently used
+    records are removed.
+
+    Usage:
+        tester.seed = 42
+        tester.result_cache = ResultCache("results_cache.sqlite")
+        tester.play_match([player1, player2], nb_games=1000)
+        tester.play_1v1(player1, player2, nb_games=1000)
+    """
+
+    def __init__(self, path: str, max_size: int = 100 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, record TEXT, size INTEGER, last_used REAL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+        )
+        self.connection.commit()
+        self.size = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[GameRecord]:
+        """
+        Get the record of a game, None if it is not in the cache
+        """
+        row = self.connection.execute(
+            "SELECT record FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        self.connection.commit()
+        return GameRecord.from_dict(json.loads(row[0]))
+
+    def put(self, key: str, record: GameRecord):
+        """
+        Store the record of a game
+        """
+        record_json = json.dumps(record.to_dict())
+        size = len(key) + len(record_json)
+
+        previous = self.connection.execute(
+            "SELECT size FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if previous is not None:
+            self.size -= previous[0]
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+            (key, record_json, size, time.time()),
+        )
+        self.size += size
+        self.evict()
+        self.connection.commit()
+
+    def evict(self):
+        """
+        Remove the least recently used records until the cache fits in max_size
+        """
+        while self.size > self.max_size:
+            rows = self.connection.execute(
+                "SELECT key, size FROM results ORDER BY last_used, rowid LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self.connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.size -= size
+                if self.size <= self.max_size:
+                    break
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
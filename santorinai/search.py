@@ -0,0 +1,499 @@
+"""
+Alpha-beta search of the best move of a position.
+
+The search works on a compact copy of the board: the levels and the pawn
+squares as lists of square indexes (x * 5 + y), played and undone in
+place, which is much faster than copying Board objects.
+
+With 3 players, the search is "paranoid": the opponents are assumed to
+play together against the player to move. The scores are given for the
+player to move at the root, WIN_SCORE minus the number of plies for a
+forced win.
+
+The search deepens one ply at a time until the time limit. With several
+workers, the root moves are split between processes, each searching its
+share; the results of the deepest depth completed by every worker are
+combined.
+
+Usage:
+    result = analyze(board, time_limit=5, workers=4)
+    print(result["best_action"], result["score"], result["pv"])
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from santorinai.board import BOARD_SIZE, NEIGHBOURS, SQUARES, Board
+
+WIN_SCORE = 100_000
+# Scores above this are forced wins
+WIN_THRESHOLD = WIN_SCORE - 1_000
+
+# The weights of the evaluation, see Searcher.evaluate
+HEIGHT_WEIGHT = 40
+MOBILITY_WEIGHT = 10
+THREAT_WEIGHT = 50
+
+# The neighbour squares of each square index
+NEIGHBOUR_INDEXES = [
+    tuple(nx * BOARD_SIZE + ny for nx, ny in NEIGHBOURS[(x, y)]) for x, y in SQUARES
+]
+
+# Number of nodes between two checks of the time limit
+TIME_CHECK_INTERVAL = 1024
+
+
+def to_position(square: Optional[int]) -> Optional[Tuple[int, int]]:
+    if square is None:
+        return None
+    return divmod(square, BOARD_SIZE)
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class Searcher:
+    """
+    An alpha-beta search on a compact board
+
+    Attributes:
+        levels (list): the level of each square
+        squares (list): the square of each pawn, by pawn number - 1
+        nb_players (int): the number of players
+        root_player (int): the player the scores are given for
+        nodes (int): the number of nodes searched
+    """
+
+    def __init__(self, levels, squares, nb_players, root_player, deadline=None):
+        self.levels = list(levels)
+        self.squares = list(squares)
+        self.nb_players = nb_players
+        self.root_player = root_player
+        self.deadline = deadline
+        self.check_time = False
+        self.next_time_check = 0
+        self.nodes = 0
+        # The principal variation found at each ply
+        self.pv: List[list] = [[] for _ in range(64)]
+
+    @staticmethod
+    def from_board(board: Board, deadline=None) -> "Searcher":
+        """
+        Create a searcher on a board, all the pawns being placed
+
+        Args:
+            board (Board): the position, the player to move is board.player_turn
+            deadline (float): the time.time() the search has to stop at
+
+        Returns:
+            Searcher: the searcher
+        """
+        if any(pawn.pos[0] is None for pawn in board.pawns):
+            raise ValueError("All the pawns have to be placed to search a position")
+
+        levels = [board.board[x][y] for x, y in SQUARES]
+        squares = [pawn.pos[0] * BOARD_SIZE + pawn.pos[1] for pawn in board.pawns]
+        return Searcher(levels, squares, board.nb_players, board.player_turn, deadline)
+
+    def get_pawns(self, player: int) -> Tuple[int, int]:
+        """
+        Get the pawn indexes of a player, by order
+        """
+        return player - 1, player - 1 + self.nb_players
+
+    def get_actions(self, player: int) -> List[Tuple[int, int, Optional[int]]]:
+        """
+        Get the possible actions of a player, the moves climbing the most first
+
+        Returns:
+            list: (pawn order, move square, build square), the build square
+                being None for a winning move
+        """
+        levels = self.levels
+        squares = self.squares
+        occupied = set(squares)
+
+        # The actions by level of the move square
+        actions = ([], [], [], [])
+        for order, pawn in enumerate(self.get_pawns(player), 1):
+            start = squares[pawn]
+            max_level = levels[start] + 1
+            for move in NEIGHBOUR_INDEXES[start]:
+                level = levels[move]
+                if move in occupied or level > max_level or level == 4:
+                    continue
+                if level == 3:
+                    actions[3].append((order, move, None))
+                    continue
+                level_actions = actions[level]
+                for build in NEIGHBOUR_INDEXES[move]:
+                    if levels[build] != 4 and (build == start or build not in occupied):
+                        level_actions.append((order, move, build))
+
+        return actions[3] + actions[2] + actions[1] + actions[0]
+
+    def can_move(self, player: int) -> bool:
+        """
+        Check if a player has a possible move
+        """
+        levels = self.levels
+        occupied = set(self.squares)
+        for pawn in self.get_pawns(player):
+            max_level = levels[self.squares[pawn]] + 1
+            for move in NEIGHBOUR_INDEXES[self.squares[pawn]]:
+                level = levels[move]
+                if move not in occupied and level <= max_level and level != 4:
+                    return True
+        return False
+
+    def can_climb(self, player: int) -> bool:
+        """
+        Check if a player can move a pawn on a level 3, winning the game
+        """
+        levels = self.levels
+        occupied = set(self.squares)
+        for pawn in self.get_pawns(player):
+            if levels[self.squares[pawn]] < 2:
+                continue
+            for move in NEIGHBOUR_INDEXES[self.squares[pawn]]:
+                if levels[move] == 3 and move not in occupied:
+                    return True
+        return False
+
+    def evaluate(self, player_to_move: int, ply: int) -> int:
+        """
+        Score a position for the root player
+
+        Args:
+            player_to_move (int): the player playing next
+            ply (int): the distance to the root
+
+        Returns:
+            int: the score
+        """
+        levels = self.levels
+        squares = self.squares
+        occupied = set(squares)
+        nb_players = self.nb_players
+
+        # The height and mobility of each player, and if it can climb
+        # on a level 3
+        values = [0] * (nb_players + 1)
+        threats = [False] * (nb_players + 1)
+        for pawn, square in enumerate(squares):
+            player = pawn % nb_players + 1
+            level = levels[square]
+            max_level = level + 1
+            mobility = 0
+            for move in NEIGHBOUR_INDEXES[square]:
+                move_level = levels[move]
+                if move_level <= max_level and move_level != 4:
+                    if move not in occupied:
+                        mobility += 1
+                        if move_level == 3:
+                            threats[player] = True
+            values[player] += HEIGHT_WEIGHT * level + MOBILITY_WEIGHT * mobility
+
+        # The player to move wins by climbing on a level 3
+        if threats[player_to_move]:
+            if player_to_move == self.root_player:
+                return WIN_SCORE - ply - 1
+            return -(WIN_SCORE - ply - 1)
+
+        score = 0
+        for player in range(1, nb_players + 1):
+            value = values[player] + THREAT_WEIGHT * threats[player]
+            if player == self.root_player:
+                score += value * (nb_players - 1)
+            else:
+                score -= value
+        return score // (nb_players - 1)
+
+    def play(self, player: int, action) -> Tuple[int, int]:
+        """
+        Play an action in place
+
+        Returns:
+            tuple: the pawn index and its previous square, to undo the action
+        """
+        order, move, build = action
+        pawn = self.get_pawns(player)[order - 1]
+        start = self.squares[pawn]
+        self.squares[pawn] = move
+        if build is not None:
+            self.levels[build] += 1
+        return pawn, start
+
+    def undo(self, action, pawn: int, start: int):
+        """
+        Undo an action played by play
+        """
+        if action[2] is not None:
+            self.levels[action[2]] -= 1
+        self.squares[pawn] = start
+
+    def get_win_score(self, player: int, ply: int) -> int:
+        """
+        Get the score of a win of a player after ply plies
+        """
+        if player == self.root_player:
+            return WIN_SCORE - ply
+        return -(WIN_SCORE - ply)
+
+    def search(self, player: int, depth: int, alpha: int, beta: int, ply: int):
+        """
+        Search the position with alpha-beta, the player to move playing first
+
+        Args:
+            player (int): the player to move
+            depth (int): the number of plies left to search
+            alpha (int): the score the root player is sure to get
+            beta (int): the score the opponents are sure to limit it to
+            ply (int): the distance to the root
+
+        Returns:
+            int: the score for the root player
+        """
+        if self.check_time and self.nodes >= self.next_time_check:
+            self.next_time_check = self.nodes + TIME_CHECK_INTERVAL
+            if time.time() > self.deadline:
+                raise SearchTimeout()
+
+        self.pv[ply] = []
+        maximizing = player == self.root_player
+        next_player = player % self.nb_players + 1
+        best_score = None
+
+        for action in self.get_actions(player):
+            self.nodes += 1
+            pawn, start = self.play(player, action)
+            self.pv[ply + 1] = []
+            if action[2] is None or not self.can_move(next_player):
+                # Climbed on a level 3, or the next player is stuck
+                score = self.get_win_score(player, ply + 1)
+            elif depth <= 1:
+                score = self.evaluate(next_player, ply + 1)
+            else:
+                score = self.search(next_player, depth - 1, alpha, beta, ply + 1)
+            self.undo(action, pawn, start)
+
+            if (
+                best_score is None
+                or (maximizing and score > best_score)
+                or (not maximizing and score < best_score)
+            ):
+                best_score = score
+                self.pv[ply] = [(player, action)] + self.pv[ply + 1]
+
+            if maximizing:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                break
+
+        if best_score is None:
+            # The player is stuck, only possible at the root
+            return self.get_win_score(next_player, ply)
+        return best_score
+
+    def search_root(self, actions: list, depth: int) -> Tuple[int, list, list]:
+        """
+        Search the root actions of the root player at a depth
+
+        Args:
+            actions (list): the actions to search
+            depth (int): the depth of the search
+
+        Returns:
+            int: the best score
+            list: the principal variation, (player, action) tuples
+            list: the actions ordered by score, the best first
+        """
+        player = self.root_player
+        next_player = player % self.nb_players + 1
+        alpha = -WIN_SCORE - 1
+        scores = []
+        best_pv = []
+
+        for action in actions:
+            self.nodes += 1
+            pawn, start = self.play(player, action)
+            self.pv[1] = []
+            if action[2] is None or not self.can_move(next_player):
+                score = self.get_win_score(player, 1)
+            elif depth <= 1:
+                score = self.evaluate(next_player, 1)
+            else:
+                score = self.search(next_player, depth - 1, alpha, WIN_SCORE + 1, 1)
+            self.undo(action, pawn, start)
+
+            scores.append(score)
+            if score > alpha:
+                alpha = score
+                best_pv = [(player, action)] + self.pv[1]
+
+        ordered = [
+            action
+            for _, _, action in sorted(
+                zip(scores, range(len(actions)), actions),
+                key=lambda item: (-item[0], item[1]),
+            )
+        ]
+        return alpha, best_pv, ordered
+
+
+def search_actions(
+    levels, squares, nb_players, root_player, actions, deadline, max_depth=None
+) -> dict:
+    """
+    Search some root actions with iterative deepening until the deadline,
+    run in the worker processes
+
+    Args:
+        levels (list): the level of each square
+        squares (list): the square of each pawn
+        nb_players (int): the number of players
+        root_player (int): the player to move
+        actions (list): the root actions to search
+        deadline (float): the time.time() the search has to stop at
+        max_depth (int): the maximum depth, None for no limit
+
+    Returns:
+        dict: "depths": the (score, principal variation) of each completed
+            depth, "nodes": the number of nodes searched
+    """
+    searcher = Searcher(levels, squares, nb_players, root_player, deadline)
+    depths = []
+    depth = 1
+    while max_depth is None or depth <= max_depth:
+        try:
+            score, pv, actions = searcher.search_root(actions, depth)
+        except SearchTimeout:
+            break
+        depths.append((score, pv))
+
+        # A forced result does not change with the depth
+        if abs(score) >= WIN_THRESHOLD:
+            break
+        # The first depth is always completed
+        searcher.check_time = True
+        if time.time() > deadline:
+            break
+        depth += 1
+
+    return {"depths": depths, "nodes": searcher.nodes}
+
+
+def analyze(
+    board: Board, time_limit: float = 5.0, workers: int = 1, max_depth: int = None
+) -> dict:
+    """
+    Search the best action of the player to move
+
+    Args:
+        board (Board): the position, all the pawns being placed
+        time_limit (float): the search time in seconds, at least a depth of
+            1 is searched
+        workers (int): the number of processes searching
+        max_depth (int): the maximum depth, None for no limit
+
+    Returns:
+        dict: the result of the search:
+            best_action: (pawn order, move position, build position)
+            score: the score for the player to move
+            pv: the principal variation, (player number, action) tuples
+            depth: the depth of the search
+            nodes: the number of nodes searched
+            duration: the search time in seconds
+            nodes_per_second: the search speed
+    """
+    start = time.time()
+    deadline = start + time_limit
+    searcher = Searcher.from_board(board)
+    if board.is_game_over():
+        raise ValueError("The game is over")
+
+    actions = searcher.get_actions(board.player_turn)
+    if not actions:
+        raise ValueError("The player to move is stuck")
+
+    arguments = (
+        searcher.levels,
+        searcher.squares,
+        searcher.nb_players,
+        searcher.root_player,
+    )
+    workers = max(1, min(workers, len(actions)))
+    if workers > 1:
+        # The actions are dealt to the workers, each gets good and bad ones
+        shares = [actions[worker::workers] for worker in range(workers)]
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(search_actions, *arguments, share, deadline, max_depth)
+                for share in shares
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [search_actions(*arguments, actions, deadline, max_depth)]
+
+    # The deepest depth completed by every worker, or a forced win found
+    # by any of them. A worker stops at a proven score, which stays the
+    # same at the deeper depths
+    unproven = [
+        len(result["depths"])
+        for result in results
+        if abs(result["depths"][-1][0]) < WIN_THRESHOLD
+    ]
+    if unproven:
+        depth = min(unproven)
+    else:
+        depth = max(len(result["depths"]) for result in results)
+    candidates = [
+        result["depths"][min(depth, len(result["depths"])) - 1] for result in results
+    ]
+    for result in results:
+        score, pv = result["depths"][-1]
+        if score >= WIN_THRESHOLD:
+            candidates.append((score, pv))
+    score, pv = max(candidates, key=lambda candidate: candidate[0])
+
+    duration = time.time() - start
+    nodes = sum(result["nodes"] for result in results)
+    pv = [
+        (player, (order, to_position(move), to_position(build)))
+        for player, (order, move, build) in pv
+    ]
+    return {
+        "best_action": pv[0][1],
+        "score": score,
+        "pv": pv,
+        "depth": depth,
+        "nodes": nodes,
+        "duration": duration,
+        "nodes_per_second": nodes / max(duration, 1e-9),
+    }
+
+
+def format_score(score: int) -> str:
+    """
+    Format a score, forced wins and losses as a number of plies
+    """
+    if score >= WIN_THRESHOLD:
+        return f"win in {WIN_SCORE - score} plies"
+    if score <= -WIN_THRESHOLD:
+        return f"loss in {WIN_SCORE + score} plies"
+    return str(score)
+
+
+def format_action(player: int, action) -> str:
+    """
+    Format an action of a principal variation
+    """
+    order, move, build = action
+    text = f"P{player} pawn {order} to {move}"
+    if build is None:
+        return text + " (climbs on a level 3)"
+    return text + f" builds {build}"
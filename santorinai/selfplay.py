@@ -0,0 +1,444 @@
+"""
+Generate datasets of positions from games between players, to train
+value and policy models.
+
+The games are played in a process pool. Every position of the move phase
+is saved with:
+    levels (int8, 25): the level of each square, square x * 5 + y
+    pawns (int8, nb_pawns): the square of each pawn
+    player (int8): the number of the player to move
+    mask (bool, 128): the legal actions, see get_action_index
+    action (int16): the action played
+    outcome (int8): 1 if the player to move won the game, -1 if it lost,
+        0 for a draw
+
+The samples are written in shards of shard_size samples, shard_00000.npz,
+shard_00001.npz, ... The positions already seen are skipped, and each
+position can be augmented with its 7 symmetric positions.
+
+Usage:
+    python -m santorinai.selfplay --games 1000 --workers 8 --out dataset \\
+        santorinai.player_examples.basic_player:BasicPlayer \\
+        santorinai.player_examples.random_player:RandomPlayer
+
+NumPy is needed: pip install santorinai[numpy]
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from santorinai.board import BOARD_SIZE, DIRECTIONS, SQUARES, Board
+from santorinai.distributed import load_player
+from santorinai.game_record import GameRecord
+from santorinai.tester import Tester, get_game_seed
+
+# Pawn order (2) x move direction (8) x build direction (8)
+ACTION_SIZE = 2 * len(DIRECTIONS) * len(DIRECTIONS)
+
+SAMPLE_FIELDS = ["levels", "pawns", "player", "mask", "action", "outcome"]
+
+
+def get_action_index(
+    pawn_order: int,
+    pawn_position: Tuple[int, int],
+    move_position: Tuple[int, int],
+    build_position: Tuple[int, int],
+) -> int:
+    """
+    Get the index of an action among the ACTION_SIZE possible actions
+
+    Args:
+        pawn_order (int): the order of the moving pawn, 1 or 2
+        pawn_position (tuple): the position of the pawn before the move
+        move_position (tuple): the position the pawn moves to
+        build_position (tuple): the position of the build
+
+    Returns:
+        int: (pawn_order - 1) * 64 + move direction * 8 + build direction
+    """
+    move_direction = DIRECTIONS.index(
+        (move_position[0] - pawn_position[0], move_position[1] - pawn_position[1])
+    )
+    build_direction = DIRECTIONS.index(
+        (build_position[0] - move_position[0], build_position[1] - move_position[1])
+    )
+    return (
+        (pawn_order - 1) * len(DIRECTIONS) ** 2
+        + move_direction * len(DIRECTIONS)
+        + build_direction
+    )
+
+
+def get_legal_action_mask(board: Board) -> np.ndarray:
+    """
+    Get the mask of the legal actions of the playing player
+
+    Args:
+        board (Board): the board, all the pawns being placed
+
+    Returns:
+        np.ndarray: a boolean array of shape (ACTION_SIZE,)
+    """
+    mask = np.zeros(ACTION_SIZE, dtype=bool)
+    for pawn in board.get_player_pawns(board.player_turn):
+        for move, build in board.iter_actions(pawn):
+            mask[get_action_index(pawn.order, pawn.pos, move, build)] = True
+    return mask
+
+
+def transform_vector(symmetry: int, dx: int, dy: int) -> Tuple[int, int]:
+    """
+    Apply one of the 8 symmetries of the square to a direction:
+    symmetry % 4 quarter turns, then a transposition if symmetry >= 4
+    """
+    for _ in range(symmetry % 4):
+        dx, dy = dy, -dx
+    if symmetry >= 4:
+        dx, dy = dy, dx
+    return dx, dy
+
+
+def transform_position(symmetry: int, x: int, y: int) -> Tuple[int, int]:
+    """
+    Apply one of the 8 symmetries of the square to a position of the board
+    """
+    center = BOARD_SIZE // 2
+    dx, dy = transform_vector(symmetry, x - center, y - center)
+    return center + dx, center + dy
+
+
+def get_square_permutation(symmetry: int) -> List[int]:
+    """
+    Get the square each square goes to with one of the 8 symmetries
+    """
+    permutation = []
+    for x, y in SQUARES:
+        new_x, new_y = transform_position(symmetry, x, y)
+        permutation.append(new_x * BOARD_SIZE + new_y)
+    return permutation
+
+
+# SQUARE_PERMUTATIONS[s][square] is the square after the symmetry s
+SQUARE_PERMUTATIONS = np.array(
+    [get_square_permutation(symmetry) for symmetry in range(8)], dtype=np.int64
+)
+
+# ACTION_PERMUTATIONS[s][action] is the action after the symmetry s
+ACTION_PERMUTATIONS = np.array(
+    [
+        [
+            order * len(DIRECTIONS) ** 2
+            + DIRECTIONS.index(transform_vector(symmetry, *move_direction))
+            * len(DIRECTIONS)
+            + DIRECTIONS.index(transform_vector(symmetry, *build_direction))
+            for order in range(2)
+            for move_direction in DIRECTIONS
+            for build_direction in DIRECTIONS
+        ]
+        for symmetry in range(8)
+    ],
+    dtype=np.int64,
+)
+
+
+def get_game_samples(record: GameRecord, nb_players: int) -> Dict[str, np.ndarray]:
+    """
+    Replay a game and get a sample for each position of the move phase
+
+    Args:
+        record (GameRecord): the record of the game
+        nb_players (int): the number of players of the game
+
+    Returns:
+        dict: the sample arrays, by field name
+    """
+    board = Board(nb_players)
+    for position in record.placements:
+        board.place_pawn(position)
+
+    samples = {field: [] for field in SAMPLE_FIELDS}
+    for pawn_order, move, build in record.moves:
+        pawn = board.get_playing_pawn(pawn_order)
+        if record.winner_number is None:
+            outcome = 0
+        else:
+            outcome = 1 if record.winner_number == board.player_turn else -1
+
+        samples["levels"].append([board.board[x][y] for x, y in SQUARES])
+        samples["pawns"].append([p.pos[0] * BOARD_SIZE + p.pos[1] for p in board.pawns])
+        samples["player"].append(board.player_turn)
+        samples["mask"].append(get_legal_action_mask(board))
+        if board.board[move[0]][move[1]] == 3:
+            # A winning move, the build is not played nor checked by the
+            # Tester: the action gets the first possible build
+            build = next(board.iter_builds_after_move(pawn, move))
+        samples["action"].append(get_action_index(pawn_order, pawn.pos, move, build))
+        samples["outcome"].append(outcome)
+
+        board.play_move(pawn_order, move, build)
+
+    nb_pawns = nb_players * 2
+    return {
+        "levels": np.array(samples["levels"], dtype=np.int8).reshape(-1, 25),
+        "pawns": np.array(samples["pawns"], dtype=np.int8).reshape(-1, nb_pawns),
+        "player": np.array(samples["player"], dtype=np.int8),
+        "mask": np.array(samples["mask"], dtype=bool).reshape(-1, ACTION_SIZE),
+        "action": np.array(samples["action"], dtype=np.int16),
+        "outcome": np.array(samples["outcome"], dtype=np.int8),
+    }
+
+
+def augment_samples(samples: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Add the 7 symmetric positions of each sample
+
+    Args:
+        samples (dict): the sample arrays, by field name
+
+    Returns:
+        dict: the 8 times bigger sample arrays, the original samples first
+    """
+    augmented = {field: [] for field in SAMPLE_FIELDS}
+    for symmetry in range(8):
+        squares = SQUARE_PERMUTATIONS[symmetry]
+        actions = ACTION_PERMUTATIONS[symmetry]
+
+        levels = np.empty_like(samples["levels"])
+        levels[:, squares] = samples["levels"]
+        mask = np.empty_like(samples["mask"])
+        mask[:, actions] = samples["mask"]
+
+        augmented["levels"].append(levels)
+        augmented["pawns"].append(squares[samples["pawns"]].astype(np.int8))
+        augmented["player"].append(samples["player"])
+        augmented["mask"].append(mask)
+        augmented["action"].append(actions[samples["action"]].astype(np.int16))
+        augmented["outcome"].append(samples["outcome"])
+
+    return {field: np.concatenate(arrays) for field, arrays in augmented.items()}
+
+
+class ShardWriter:
+    """
+    Write samples to disk in shards of shard_size samples,
+    skipping the positions already written when dedupe is True.
+
+    A position is identified by its levels, pawns and player to move,
+    the first sample of a position is kept.
+    """
+
+    def __init__(self, out_dir: str, shard_size: int = 100_000, dedupe: bool = True):
+        self.out_dir = out_dir
+        self.shard_size = shard_size
+        self.dedupe = dedupe
+        os.makedirs(out_dir, exist_ok=True)
+
+        self.seen_positions = set()
+        self.buffer = {field: [] for field in SAMPLE_FIELDS}
+        self.buffer_size = 0
+        self.shard_paths: List[str] = []
+        self.nb_samples = 0
+        self.nb_duplicates = 0
+
+    def add(self, samples: Dict[str, np.ndarray]):
+        """
+        Add samples, full shards are written right away
+        """
+        if self.dedupe:
+            keep = np.zeros(len(samples["player"]), dtype=bool)
+            for index in range(len(keep)):
+                position_hash = hashlib.blake2b(
+                    samples["levels"][index].tobytes()
+                    + samples["pawns"][index].tobytes()
+                    + samples["player"][index].tobytes(),
+                    digest_size=8,
+                ).digest()
+                if position_hash not in self.seen_positions:
+                    self.seen_positions.add(position_hash)
+                    keep[index] = True
+            self.nb_duplicates += int((~keep).sum())
+            samples = {field: array[keep] for field, array in samples.items()}
+
+        for field in SAMPLE_FIELDS:
+            self.buffer[field].append(samples[field])
+        self.buffer_size += len(samples["player"])
+        self.nb_samples += len(samples["player"])
+
+        while self.buffer_size >= self.shard_size:
+            self.write_shard(self.shard_size)
+
+    def write_shard(self, size: int):
+        """
+        Write the first size samples of the buffer in a new shard
+        """
+        arrays = {field: np.concatenate(self.buffer[field]) for field in SAMPLE_FIELDS}
+        path = os.path.join(self.out_dir, f"shard_{len(self.shard_paths):05}.npz")
+        np.savez_compressed(
+            path, **{field: array[:size] for field, array in arrays.items()}
+        )
+        self.shard_paths.append(path)
+
+        self.buffer = {field: [array[size:]] for field, array in arrays.items()}
+        self.buffer_size -= size
+
+    def close(self):
+        """
+        Write the last samples in a smaller shard
+        """
+        if self.buffer_size > 0:
+            self.write_shard(self.buffer_size)
+
+
+# Players loaded by each worker process, by (spec, seat): a spec playing
+# several seats gets an object per seat
+loaded_players = {}
+
+
+def play_selfplay_record(
+    player_specs: List[str], game_nb: int, seed: Optional[int]
+) -> GameRecord:
+    """
+    Play a game of the dataset, the seats are rotated as in Tester.play_match
+
+    Returns:
+        GameRecord: the record of the game
+    """
+    shift = game_nb % len(player_specs)
+    seated_specs = player_specs[shift:] + player_specs[:shift]
+
+    players = []
+    for seat, spec in enumerate(seated_specs, 1):
+        if (spec, seat) not in loaded_players:
+            loaded_players[(spec, seat)] = load_player(spec, seat)
+        players.append(loaded_players[(spec, seat)])
+
+    tester = Tester()
+    tester.verbose_level = 0
+    game_seed = None if seed is None else get_game_seed(seed, game_nb)
+    return tester.play_game(players, seed=game_seed)
+
+
+def play_selfplay_game(
+    player_specs: List[str], game_nb: int, seed: Optional[int], augment: bool
+) -> Dict[str, np.ndarray]:
+    """
+    Play a game and get its samples, see play_selfplay_record
+
+    Returns:
+        dict: the sample arrays of the game, by field name
+    """
+    record = play_selfplay_record(player_specs, game_nb, seed)
+    samples = get_game_samples(record, len(player_specs))
+    if augment:
+        samples = augment_samples(samples)
+    return samples
+
+
+def generate_dataset(
+    player_specs: List[str],
+    nb_games: int,
+    out_dir: str,
+    workers: int = 1,
+    shard_size: int = 100_000,
+    seed: Optional[int] = None,
+    augment: bool = True,
+    dedupe: bool = True,
+) -> dict:
+    """
+    Play games between the players and write their positions in shards
+
+    Args:
+        player_specs (list): 2 or 3 players, as "module:PlayerClass"
+        nb_games (int): the number of games to play
+        out_dir (str): the directory of the shards
+        workers (int): the number of processes playing games
+        shard_size (int): the number of samples of a shard
+        seed (int): the seed of the games, None for random games
+        augment (bool): add the symmetric positions
+        dedupe (bool): skip the positions already written
+
+    Returns:
+        dict: statistics on the generation
+    """
+    if not 2 <= len(player_specs) <= 3:
+        raise ValueError("A match is played between 2 or 3 players")
+    player_specs = list(player_specs)
+
+    start = time.perf_counter()
+    writer = ShardWriter(out_dir, shard_size, dedupe)
+    game_arguments = (
+        [player_specs] * nb_games,
+        range(nb_games),
+        [seed] * nb_games,
+        [augment] * nb_games,
+    )
+
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            chunk_size = max(1, nb_games // (workers * 8))
+            for samples in executor.map(
+                play_selfplay_game, *game_arguments, chunksize=chunk_size
+            ):
+                writer.add(samples)
+    else:
+        for samples in map(play_selfplay_game, *game_arguments):
+            writer.add(samples)
+    writer.close()
+
+    duration = time.perf_counter() - start
+    positions_per_second = (writer.nb_samples + writer.nb_duplicates) / duration
+    return {
+        "nb_games": nb_games,
+        "nb_samples": writer.nb_samples,
+        "nb_duplicates": writer.nb_duplicates,
+        "shard_paths": writer.shard_paths,
+        "duration": duration,
+        "positions_per_second": positions_per_second,
+        "positions_per_second_per_core": positions_per_second / max(workers, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a dataset of positions from games between players"
+    )
+    parser.add_argument("players", nargs="+", help="module:PlayerClass")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default="selfplay_dataset")
+    parser.add_argument("--shard-size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-augment", action="store_true")
+    parser.add_argument("--no-dedupe", action="store_true")
+    args = parser.parse_args()
+
+    stats = generate_dataset(
+        args.players,
+        args.games,
+        args.out,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        seed=args.seed,
+        augment=not args.no_augment,
+        dedupe=not args.no_dedupe,
+    )
+
+    print(
+        f"{stats['nb_samples']} positions written in {len(stats['shard_paths'])} "
+        f"shards ({stats['nb_duplicates']} duplicates skipped) "
+        f"in {stats['duration']:.1f} s"
+    )
+    print(
+        f"{stats['positions_per_second']:.0f} positions/s, "
+        f"{stats['positions_per_second_per_core']:.0f} positions/s per core"
+    )
+
+
+if __name__ == "__main__":
+    main()
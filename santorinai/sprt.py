@@ -0,0 +1,117 @@
+from math import log
+from typing import Optional
+
+
+def elo_to_score(elo: float) -> float:
+    """
+    Convert an Elo difference into the expected score of the stronger player
+
+    Args:
+        elo (float): the Elo difference between the two players
+
+    Returns:
+        float: the expected score, between 0 and 1
+    """
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class SPRT:
+    """
+    Sequential probability ratio test on the Elo difference between two players.
+
+    After each game, the log-likelihood ratio (LLR) of the two hypotheses
+    H0: elo = elo0 and H1: elo = elo1 is updated. The match can stop as soon as
+    the LLR crosses one of the bounds given by the error rates:
+    - H0 is accepted when the LLR goes below log(beta / (1 - alpha))
+    - H1 is accepted when the LLR goes above log((1 - beta) / alpha)
+
+    Draws count as half a win and half a loss.
+
+    Attributes:
+        elo0 (float): the Elo difference of the null hypothesis
+        elo1 (float): the Elo difference of the alternative hypothesis
+        alpha (float): the probability to accept H1 while H0 is true
+        beta (float): the probability to accept H0 while H1 is true
+        wins (int): the number of games won by the tested player
+        draws (int): the number of draws
+        losses (int): the number of games lost by the tested player
+    """
+
+    def __init__(
+        self,
+        elo0: float = 0.0,
+        elo1: float = 50.0,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+    ):
+        if elo0 >= elo1:
+            raise ValueError("elo0 should be lower than elo1")
+        if not 0 < alpha < 1 or not 0 < beta < 1:
+            raise ValueError("alpha and beta should be between 0 and 1")
+
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+
+        self.lower_bound = log(beta / (1 - alpha))
+        self.upper_bound = log((1 - beta) / alpha)
+
+        # Log-likelihood ratio of a won and a lost game
+        score0 = elo_to_score(elo0)
+        score1 = elo_to_score(elo1)
+        self.win_llr = log(score1 / score0)
+        self.loss_llr = log((1 - score1) / (1 - score0))
+
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+
+    @property
+    def nb_games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    def add_result(self, score: float):
+        """
+        Register the result of a game
+
+        Args:
+            score (float): 1 for a win, 0.5 for a draw and 0 for a loss
+        """
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        elif score == 0.5:
+            self.draws += 1
+        else:
+            raise ValueError(f"A game score should be 0, 0.5 or 1, not {score}")
+
+    def llr(self) -> float:
+        """
+        The log-likelihood ratio of the results registered so far
+        """
+        return (self.wins + self.draws / 2) * self.win_llr + (
+            self.losses + self.draws / 2
+        ) * self.loss_llr
+
+    def status(self) -> Optional[str]:
+        """
+        The state of the test
+
+        Returns:
+            str: "H0" or "H1" if the test is decided, None if more games are needed
+        """
+        llr = self.llr()
+        if llr <= self.lower_bound:
+            return "H0"
+        if llr >= self.upper_bound:
+            return "H1"
+        return None
+
+    def __repr__(self) -> str:
+        return (
+            f"SPRT(elo0={self.elo0}, elo1={self.elo1}) W/D/L: "
+            f"{self.wins}/{self.draws}/{self.losses}, "
+            f"LLR: {self.llr():.2f} ({self.lower_bound:.2f}, {self.upper_bound:.2f})"
+        )
@@ -0,0 +1,366 @@
+"""
+Play with engines running in another process, talking over stdin/stdout.
+
+Protocol:
+    The engine reads one command per line on its standard input and answers
+    the requests (name, place, move) with one line on its standard output.
+
+    Position updates, only the changes since the previous request are sent:
+        newgame <nb_players> <player_number>   A new game starts, empty board
+        level <x> <y> <level>                  The level of a tile changed
+        pawn <pawn_number> <x> <y>             A pawn was placed or moved
+        turn <player_turn> <turn_number>       The turn changed
+
+    Requests:
+        name                  -> <the name of the engine>
+        place <pawn_number>   -> <x> <y>
+        move                  -> <pawn_order> <move_x> <move_y> <build_x> <build_y>
+        quit                     The engine should exit
+
+    A position without value is written "-".
+
+Usage:
+    # Any Player can be served as an engine:
+    # python -m santorinai.subprocess_player my_module:MyPlayer
+    player = SubprocessPlayer(1, ["./my_engine", "--option"])
+"""
+
+import atexit
+import importlib
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from santorinai.board import Board
+from santorinai.pawn import Pawn
+from santorinai.player import Player
+
+
+class EngineProcess:
+    """
+    A running engine process
+
+    Attributes:
+        command (tuple): The command used to start the engine.
+        process (subprocess.Popen): The engine process.
+    """
+
+    def __init__(self, command: Tuple[str, ...]):
+        self.command = command
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(self, lines: List[str]) -> str:
+        """
+        Send lines to the engine and wait for its answer
+
+        Args:
+            lines (list): The lines to send, the last one being the request.
+
+        Returns:
+            str: The answer of the engine, without the line break.
+        """
+        try:
+            self.process.stdin.write("\n".join(lines) + "\n")
+            self.process.stdin.flush()
+            answer = self.process.stdout.readline()
+        except (BrokenPipeError, OSError):
+            answer = ""
+
+        if not answer:
+            raise RuntimeError(f"The engine {self.command} stopped unexpectedly")
+        return answer.rstrip("\n")
+
+    def close(self):
+        """
+        Ask the engine to exit, kill it if it does not
+        """
+        if self.is_alive():
+            try:
+                self.process.stdin.write("quit\n")
+                self.process.stdin.close()
+                self.process.wait(timeout=1)
+            except (BrokenPipeError, OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        self.process.stdout.close()
+
+
+class EnginePool:
+    """
+    Keeps the idle engine processes to reuse them instead of starting new ones
+    """
+
+    def __init__(self):
+        self.idle_engines: Dict[Tuple[str, ...], List[EngineProcess]] = {}
+
+    def acquire(self, command: Tuple[str, ...]) -> EngineProcess:
+        """
+        Get an engine running the given command, started if none is idle
+        """
+        idle_engines = self.idle_engines.get(command, [])
+        while idle_engines:
+            engine = idle_engines.pop()
+            if engine.is_alive():
+                return engine
+            engine.close()
+
+        return EngineProcess(command)
+
+    def release(self, engine: EngineProcess):
+        """
+        Give back an engine that is no longer used
+        """
+        if engine.is_alive():
+            self.idle_engines.setdefault(engine.command, []).append(engine)
+
+    def close(self):
+        """
+        Stop all the idle engines
+        """
+        for engines in self.idle_engines.values():
+            for engine in engines:
+                engine.close()
+        self.idle_engines = {}
+
+
+# Engines are shared by all the subprocess players of the process
+engine_pool = EnginePool()
+atexit.register(engine_pool.close)
+
+
+def format_position(position: Optional[Tuple[int, int]]) -> str:
+    if position is None or position[0] is None or position[1] is None:
+        return "- -"
+    return f"{position[0]} {position[1]}"
+
+
+def parse_position(words: List[str]) -> Optional[Tuple[int, int]]:
+    if words[0] == "-" or words[1] == "-":
+        return None
+    return int(words[0]), int(words[1])
+
+
+class SubprocessPlayer(Player):
+    """
+    A player whose choices are made by an engine running in another process.
+
+    The engine is taken from the engine pool on the first request and kept
+    until the player is closed, it is then given back to the pool to be reused
+    by the next player with the same command.
+    Only the changes since the previous request are sent to the engine. A new
+    game is sent when the Tester starts a game (new_game), or when the board
+    can't follow the known position: the turn number goes back, a pawn is
+    removed or a level goes down.
+
+    An answer that can't be read is played as an invalid action.
+    """
+
+    def __init__(
+        self,
+        player_number: int,
+        command: List[str],
+        name: str = None,
+        log_level=0,
+    ) -> None:
+        super().__init__(player_number, log_level)
+        self.command = tuple(command)
+        self.engine_name = name
+        self.engine: Optional[EngineProcess] = None
+        self.reset_known_position()
+
+    def reset_known_position(self):
+        """
+        Forget the position known by the engine, a new game will be sent
+        """
+        self.known_nb_players = None
+        self.known_player_number = None
+        self.known_levels = None
+        self.known_pawns = None
+        self.known_turn = None
+
+    def new_game(self):
+        self.reset_known_position()
+
+    def name(self):
+        if self.engine_name is None:
+            self.engine_name = self.request(["name"])
+        return self.engine_name
+
+    def connect(self):
+        """
+        Get an engine from the pool if the player has none
+        """
+        if self.engine is None:
+            self.engine = engine_pool.acquire(self.command)
+            # The engine may come from another player, its position is unknown
+            self.reset_known_position()
+
+    def request(self, lines: List[str]) -> str:
+        self.connect()
+        answer = self.engine.request(lines)
+        if self.log_level:
+            print(f"{lines} -> {answer}")
+        return answer
+
+    def is_position_unreachable(self, board: Board) -> bool:
+        """
+        Check if the board can't follow the position known by the engine in
+        the same game: a placed pawn was removed or a level went down
+        """
+        for pawn in board.pawns:
+            known_pos = self.known_pawns[pawn.number - 1]
+            if known_pos[0] is not None and pawn.pos[0] is None:
+                return True
+
+        for row, known_row in zip(board.board, self.known_levels):
+            for level, known_level in zip(row, known_row):
+                if level < known_level:
+                    return True
+        return False
+
+    def position_updates(self, board: Board) -> List[str]:
+        """
+        Get the lines updating the engine position to the given board
+
+        Args:
+            board (Board): The current board.
+
+        Returns:
+            list: The update lines, only the changes since the last update.
+        """
+        lines = []
+        turn = (board.player_turn, board.turn_number)
+
+        if (
+            self.known_turn is None
+            or board.nb_players != self.known_nb_players
+            or self.player_number != self.known_player_number
+            or board.turn_number <= self.known_turn[1]
+            or self.is_position_unreachable(board)
+        ):
+            lines.append(f"newgame {board.nb_players} {self.player_number}")
+            self.known_nb_players = board.nb_players
+            self.known_player_number = self.player_number
+            self.known_levels = [[0] * board.board_size for _ in board.board]
+            self.known_pawns = [(None, None)] * board.nb_pawns
+            self.known_turn = (1, 1)
+
+        for x, row in enumerate(board.board):
+            known_row = self.known_levels[x]
+            for y, level in enumerate(row):
+                if level != known_row[y]:
+                    lines.append(f"level {x} {y} {level}")
+                    known_row[y] = level
+
+        for pawn in board.pawns:
+            if pawn.pos != self.known_pawns[pawn.number - 1]:
+                lines.append(f"pawn {pawn.number} {format_position(pawn.pos)}")
+                self.known_pawns[pawn.number - 1] = pawn.pos
+
+        if turn != self.known_turn:
+            lines.append(f"turn {turn[0]} {turn[1]}")
+            self.known_turn = turn
+
+        return lines
+
+    def place_pawn(self, board: Board, pawn: Pawn):
+        self.connect()
+        lines = self.position_updates(board)
+        answer = self.request(lines + [f"place {pawn.number}"])
+        try:
+            return parse_position(answer.split())
+        except (IndexError, ValueError):
+            return None, None
+
+    def play_move(self, board: Board):
+        self.connect()
+        lines = self.position_updates(board)
+        answer = self.request(lines + ["move"])
+        try:
+            words = answer.split()
+            return int(words[0]), parse_position(words[1:3]), parse_position(words[3:5])
+        except (IndexError, ValueError):
+            return None, None, None
+
+    def close(self):
+        """
+        Give the engine back to the pool
+        """
+        if self.engine is not None:
+            engine_pool.release(self.engine)
+            self.engine = None
+
+    def __del__(self):
+        self.close()
+
+    def __getstate__(self):
+        # The engine process stays in this process, the copy gets its own
+        state = self.__dict__.copy()
+        state["engine"] = None
+        state["known_turn"] = None
+        return state
+
+
+def serve_player(player: Player, input_stream=sys.stdin, output_stream=sys.stdout):
+    """
+    Run a player as an engine, reading the protocol commands on the input stream
+
+    Args:
+        player (Player): The player choosing the actions.
+        input_stream: Where the commands are read.
+        output_stream: Where the answers are written.
+    """
+
+    def answer(message):
+        output_stream.write(f"{message}\n")
+        output_stream.flush()
+
+    board = None
+    for line in input_stream:
+        words = line.split()
+        if not words:
+            continue
+        command, args = words[0], words[1:]
+
+        if command == "newgame":
+            board = Board(int(args[0]))
+            player.player_number = int(args[1])
+        elif command == "level":
+            board.board[int(args[0])][int(args[1])] = int(args[2])
+        elif command == "pawn":
+            position = parse_position(args[1:3])
+            if position is None:
+                position = (None, None)
+            board.pawns[int(args[0]) - 1].pos = position
+        elif command == "turn":
+            board.player_turn, board.turn_number = int(args[0]), int(args[1])
+        elif command == "name":
+            answer(player.name())
+        elif command == "place":
+            board_copy = board.copy()
+            position = player.place_pawn(board_copy, board_copy.pawns[int(args[0]) - 1])
+            answer(format_position(position))
+        elif command == "move":
+            pawn_order, move, build = player.play_move(board.copy())
+            answer(f"{pawn_order} {format_position(move)} {format_position(build)}")
+        elif command == "quit":
+            break
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or ":" not in sys.argv[1]:
+        print("Usage: python -m santorinai.subprocess_player module:PlayerClass")
+        sys.exit(1)
+
+    module_name, class_name = sys.argv[1].split(":")
+    player_class = getattr(importlib.import_module(module_name), class_name)
+    serve_player(player_class(1))
@@ -1,11 +1,17 @@
 from santorinai.player import Player
 from santorinai.board import Board
-from santorinai.board_displayer.board_displayer import (
-    init_window,
-    update_board,
-    close_window,
-)
+from santorinai.sprt import SPRT
+from santorinai.game_record import GameRecord, append_record
+from santorinai.result_cache import get_game_key, get_player_version
+from santorinai.profiling import clear_profiles, merge_profiles, profile_game
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from time import sleep
+from typing import List
+import json
+import os
+import random
+import re
 
 
 class Tester:
@@ -16,6 +22,33 @@ class Tester:
     verbose_level = 2
     delay_between_moves = 0.0
     display_board = False
+    display_fps = 30  # Maximum number of boards displayed per second
+
+    # Directory where the match progress is saved, None to disable
+    checkpoint_dir = None
+    checkpoint_every = 10  # Number of games between two checkpoints
+
+    # File where the record of each game is appended, None to disable
+    records_path = None
+
+    # Seed of the players random generators, None to disable.
+    # Each game is seeded from it and the game number: see get_game_seed
+    seed = None
+    # ResultCache of the games of play_match and play_1v1,
+    # used only when the seed is set
+    result_cache = None
+
+    # Directory where the games are profiled with cProfile, None to disable.
+    # The merged profile and a report are written at the end of the match
+    profile_dir = None
+    profile_every = 1  # Profile one game out of profile_every
+    profile_top = 20  # Number of functions listed in the report
+
+    def __getstate__(self):
+        # The cache stays in the main process, the workers only play games
+        state = self.__dict__.copy()
+        state.pop("result_cache", None)
+        return state
 
     def display_message(self, message, verbose_level=1):
         """
@@ -33,6 +66,8 @@ class Tester:
         player2: Player,
         nb_games: int = 1,
         dic_win_lose_type=None,
+        sprt: SPRT = None,
+        on_game_end=None,
     ):
         """
         Play a 1v1 game between player1 and player2
@@ -40,13 +75,17 @@ class Tester:
         Args:
             player1 (Player): the first player
             player2 (Player): the second player
+            nb_games (int): the maximum number of games to play
+            dic_win_lose_type (dict): the winning and loosing conditions counters
+            sprt (SPRT): a sequential test on the strength of player1 against
+                player2, the match stops as soon as the test is decided
+            on_game_end (callable): a function called with the GameRecord of
+                each game as soon as it is over
 
         Returns:
             dict: the number of victories for each player
             dict: the different types of winning and loosing conditions
         """
-        NB_PLAYERS = 2
-
         # Check if the players are objects of the Player class
         if player1 is None or not isinstance(player1, Player):
             raise TypeError("player1 should be an object of the Player class")
@@ -77,148 +116,570 @@ class Tester:
 
         players = [player1, player2]
 
+        # Resume from a previous checkpoint if there is one
+        first_game_nb = 1
+        checkpoint_path = None
+        if self.checkpoint_dir is not None:
+            checkpoint_path = get_checkpoint_path(self.checkpoint_dir, player_names)
+            match = get_checkpoint_match(players, nb_games, self.seed)
+            checkpoint = load_checkpoint(checkpoint_path, player_names, match)
+            if checkpoint is not None:
+                nb_victories = checkpoint["nb_victories"]
+                for name in player_names:
+                    dic_win_lose_type[name] = checkpoint["dic_win_lose_type"][name]
+                first_game_nb = checkpoint["nb_games_played"] + 1
+                if sprt is not None:
+                    sprt.wins += nb_victories[player_names[0]]
+                    sprt.losses += nb_victories[player_names[1]]
+                    sprt.draws += first_game_nb - 1 - sprt.wins - sprt.losses
+                self.display_message(
+                    f"Resuming from game {first_game_nb} ({checkpoint_path})", 1
+                )
+
         # Initialize the window
         window = None
         if self.display_board:
-            window = init_window([player1.name(), player2.name()])
+            window = self.open_display(player_names)
+
+        if self.profile_dir is not None:
+            clear_profiles(self.profile_dir)
+
+        # The games after the last checkpoint are played again when resuming,
+        # their records must not be saved or passed to on_game_end twice
+        checkpoint_every = self.checkpoint_every
+        if self.records_path is not None or on_game_end is not None:
+            checkpoint_every = 1
 
         # Play the games
-        for game_nb in range(1, nb_games + 1):
-            self.display_message(f"Game {game_nb}", 1)
+        nb_games_played = first_game_nb - 1
+        for game_nb in range(first_game_nb, nb_games + 1):
+            if sprt is not None and sprt.status() is not None:
+                break
 
-            # Initialize the board
-            board = Board(NB_PLAYERS)
+            self.display_message(f"Game {game_nb}", 1)
+            seed = None
+            if self.seed is not None:
+                seed = get_game_seed(self.seed, game_nb - 1)
+            record = self.play_cached_game(players, game_nb - 1, window, seed)
+            self.register_game(record, nb_victories, dic_win_lose_type, on_game_end)
+            nb_games_played = game_nb
+
+            # Update the sequential test with the player1 score
+            if sprt is not None:
+                if record.winner_name == player_names[0]:
+                    sprt.add_result(1)
+                elif record.winner_name == player_names[1]:
+                    sprt.add_result(0)
+                else:
+                    sprt.add_result(0.5)
+
+            # Save the progress
+            if checkpoint_path is not None and game_nb % checkpoint_every == 0:
+                save_checkpoint(
+                    checkpoint_path,
+                    player_names,
+                    game_nb,
+                    nb_victories,
+                    dic_win_lose_type,
+                    match,
+                )
 
-            # Placement the pawns
-            for pawn_nb, current_pawn in enumerate(board.pawns):
-                board_copy = board.copy()
-                # If pawn_nb == 1, the player_nb is 0, if pawn_nb == 2, the
-                # player_nb is 1, if pawn_nb == 3, the player_nb is 0, etc.
-                player_nb = (pawn_nb) % NB_PLAYERS
-                player = players[player_nb]
+        # The match is over, the next one starts from the first game
+        if checkpoint_path is not None and os.path.isfile(checkpoint_path):
+            os.remove(checkpoint_path)
 
-                # Ask the player where to place the pawn
+        if sprt is not None:
+            self.display_message(f"\nSequential test: {sprt}", 1)
+            if sprt.status() is not None:
                 self.display_message(
-                    f"Player '{player.name()}' is placing pawn {pawn_nb + 1}", 2
+                    f"{sprt.status()} accepted after {nb_games_played} games", 1
                 )
-                position_choice = player.place_pawn(board_copy, current_pawn)
 
-                # Place the pawn
-                success, reason = board.place_pawn(position_choice)
+        self.display_results(nb_victories, nb_games_played)
+        self.report_profiles(players)
 
-                if not success:
-                    self.display_message(
-                        f"   Pawn placed at an invalid position: {reason}", 1
-                    )
-                    self.display_message(f"   Player '{player.name()}' loses")
-                    dic_win_lose_type[player.name()] = register_new_victory_type(
-                        dic_win_lose_type[player.name()],
-                        f"Pawn placed at an invalid position: {reason}",
+        # Close the window
+        if self.display_board:
+            window.close()
+
+        return nb_victories, dic_win_lose_type
+
+    def play_match(
+        self,
+        players: List[Player],
+        nb_games: int = 1,
+        workers: int = 1,
+        dic_win_lose_type=None,
+        on_game_end=None,
+    ):
+        """
+        Play games between 2 or 3 players.
+        The seats are rotated from one game to the next so that every player
+        starts the same number of games (when nb_games is a multiple of the
+        number of players). Before each game, the player_number of each player
+        is set to its seat number.
+
+        Args:
+            players (list): the players, 2 or 3 objects of the Player class
+            nb_games (int): the number of games to play
+            workers (int): the number of processes playing games in parallel
+            dic_win_lose_type (dict): the winning and loosing conditions counters
+            on_game_end (callable): a function called with the GameRecord of
+                each game as soon as it is over
+
+        Returns:
+            dict: the number of victories for each player
+            dict: the different types of winning and loosing conditions
+        """
+        player_names = self.check_players(players)
+
+        if workers > 1 and self.display_board:
+            raise ValueError("The board can't be displayed with multiple workers")
+
+        nb_victories = {player_name: 0 for player_name in player_names}
+
+        if not dic_win_lose_type:
+            dic_win_lose_type = {player_name: {} for player_name in player_names}
+
+        # Game n is played with the seats rotated n times
+        seatings = []
+        for game_nb in range(nb_games):
+            shift = game_nb % len(players)
+            seatings.append(players[shift:] + players[:shift])
+
+        if self.seed is not None:
+            seeds = [get_game_seed(self.seed, game_nb) for game_nb in range(nb_games)]
+        else:
+            # The workers get copies of the players with the same random
+            # generators, each game needs its own seed to be a different game
+            system_random = random.SystemRandom()
+            seeds = [system_random.getrandbits(63) for _ in range(nb_games)]
+
+        # Get the games already played from the cache
+        cache_keys = [None] * nb_games
+        cached_records = [None] * nb_games
+        if self.result_cache is not None and self.seed is not None:
+            for game_nb in range(nb_games):
+                cache_keys[game_nb] = get_game_key(seatings[game_nb], seeds[game_nb])
+                cached_records[game_nb] = self.result_cache.get(cache_keys[game_nb])
+
+        games_to_play = [
+            game_nb for game_nb in range(nb_games) if cached_records[game_nb] is None
+        ]
+        if len(games_to_play) < nb_games:
+            self.display_message(
+                f"{nb_games - len(games_to_play)} games found in the cache", 1
+            )
+
+        if self.profile_dir is not None:
+            clear_profiles(self.profile_dir)
+
+        def register_games(played_records):
+            # Register the records in the games order, cached or just played
+            for game_nb in range(nb_games):
+                record = cached_records[game_nb]
+                if record is None:
+                    record = next(played_records)
+                    if cache_keys[game_nb] is not None:
+                        self.result_cache.put(cache_keys[game_nb], record)
+
+                self.display_message(f"Game {game_nb + 1}: {record}", 1)
+                self.register_game(record, nb_victories, dic_win_lose_type, on_game_end)
+
+        if workers > 1:
+            # Each game is played in a worker process, with copies of the players
+            chunk_size = max(1, len(games_to_play) // (workers * 8))
+            with ProcessPoolExecutor(workers) as executor:
+                register_games(
+                    executor.map(
+                        play_seated_game,
+                        repeat(self),
+                        [seatings[game_nb] for game_nb in games_to_play],
+                        [seeds[game_nb] for game_nb in games_to_play],
+                        games_to_play,
+                        chunksize=chunk_size,
                     )
-                    nb_victories[player_names[(player_nb + 1) % NB_PLAYERS]] += 1
-                    break
-
-                self.display_message(f"   Pawn placed at position {position_choice}", 2)
-                if self.display_board and window is not None:
-                    update_board(window, board)
-                sleep(self.delay_between_moves)
-
-            # Play the game
-            self.display_message("\nPlaying the game")
-            while not board.is_game_over():
-                current_player = players[board.player_turn - 1]
-                # current_pawn = board.get_playing_pawn()
-                # self.display_message(f"   Current pawn: {current_pawn}", 2)
-
-                # Check if the player can move
-                # if len(board.get_possible_movement_positions(current_pawn)) == 0:
-                #     self.display_message("   The pawn cannot move", 2)
-                #     board.next_turn()
-                #     # We don't ask the player to move, we just skip his turn
-                #     continue
-
-                board_copy = board.copy()
-                # current_pawn_copy = board_copy.get_playing_pawn()
-
-                # Ask the player where to move the pawn
-                # player = players[current_pawn.player_number - 1]
-                self.display_message(
-                    f"Player '{current_player.name()}' is moving a pawn", 2
                 )
-                pawn_nb, move_choice, build_choice = current_player.play_move(
-                    board_copy
+        else:
+            window = None
+            if self.display_board:
+                window = self.open_display(player_names)
+
+            player_numbers = [player.player_number for player in players]
+            try:
+                register_games(
+                    play_seated_game(
+                        self, seatings[game_nb], seeds[game_nb], game_nb, window
+                    )
+                    for game_nb in games_to_play
                 )
+            finally:
+                # Give the players their number back
+                for player, player_number in zip(players, player_numbers):
+                    player.player_number = player_number
 
-                # Move the pawn
-                success, reason = board.play_move(pawn_nb, move_choice, build_choice)
+                if window is not None:
+                    window.close()
 
-                if not success:
-                    self.display_message(
-                        f"   Pawn moved at an invalid position: {reason}", 1
-                    )
-                    self.display_message(f"   Player '{current_player.name()}' loses")
-                    dic_win_lose_type[current_player.name()] = (
-                        register_new_victory_type(
-                            dic_win_lose_type[current_player.name()], reason
-                        )
-                    )
+        self.display_results(nb_victories, nb_games)
+        self.report_profiles(players)
+
+        return nb_victories, dic_win_lose_type
+
+    def open_display(self, player_names: List[str]):
+        """
+        Open the window displaying the boards, PySimpleGUI (and Tk) is only
+        imported here so the tester runs on machines without a display
 
-                    other_player_name_id = (board.player_turn - 1) % NB_PLAYERS
-                    other_player_name = player_names[other_player_name_id]
-                    nb_victories[other_player_name] += 1
+        Args:
+            player_names (list): the names of the players, for the window title
+
+        Returns:
+            BoardDisplay: the window
+        """
+        from santorinai.board_displayer.board_displayer import BoardDisplay
+
+        return BoardDisplay(player_names, self.display_fps)
+
+    def check_players(self, players: List[Player]) -> List[str]:
+        """
+        Check the players of a match: 2 or 3 Player objects with different,
+        non empty names
+
+        Args:
+            players (list): the players
+
+        Returns:
+            list: the names of the players
+        """
+        if not 2 <= len(players) <= 3:
+            raise ValueError("A match is played between 2 or 3 players")
+
+        for player in players:
+            if player is None or not isinstance(player, Player):
+                raise TypeError("players should be objects of the Player class")
+
+        player_names = [player.name() for player in players]
+        for player_name in player_names:
+            if type(player_name) is not str or len(player_name) == 0:
+                raise ValueError("Every player should have a valid name")
+
+        if len(set(player_names)) != len(player_names):
+            raise ValueError("The players should have different names")
+
+        return player_names
 
-                    break
+    def play_match_game(
+        self, players: List[Player], game_nb: int, window=None, seed: int = None
+    ) -> GameRecord:
+        """
+        Play a game of a match, under cProfile if the profiling is enabled
+        and the game is one of the profiled ones
+
+        Args:
+            players (list): the players, in playing order
+            game_nb (int): the index of the game in the match, from 0
+            window (BoardDisplay): the window displaying the board, if any
+            seed (int): the seed of the game, if any
 
-                # Log the move details
+        Returns:
+            GameRecord: the record of the game
+        """
+        if self.profile_dir is not None and game_nb % self.profile_every == 0:
+            return profile_game(
+                self.profile_dir, game_nb, self.play_game, players, window, seed
+            )
+        return self.play_game(players, window, seed)
+
+    def play_cached_game(
+        self, players: List[Player], game_nb: int, window=None, seed: int = None
+    ) -> GameRecord:
+        """
+        Get the record of a game from the result cache, or play it (see
+        play_match_game) and store it in the cache.
+        The cache is only used when the game is seeded.
+
+        Args:
+            players (list): the players, in playing order
+            game_nb (int): the index of the game in the match, from 0
+            window (BoardDisplay): the window displaying the board, if any
+            seed (int): the seed of the game, if any
+
+        Returns:
+            GameRecord: the record of the game
+        """
+        if self.result_cache is None or seed is None:
+            return self.play_match_game(players, game_nb, window, seed)
+
+        cache_key = get_game_key(players, seed)
+        record = self.result_cache.get(cache_key)
+        if record is None:
+            record = self.play_match_game(players, game_nb, window, seed)
+            self.result_cache.put(cache_key, record)
+        return record
+
+    def report_profiles(self, players: List[Player]):
+        """
+        Merge the profiles of the games of a match and display the report,
+        if the profiling is enabled
+        """
+        if self.profile_dir is None:
+            return
+
+        report = merge_profiles(self.profile_dir, players, self.profile_top)
+        if report is not None:
+            self.display_message(f"\n{report}", 1)
+            self.display_message(
+                f"Profile saved in {os.path.join(self.profile_dir, 'merged.prof')}", 1
+            )
+
+    def play_game(
+        self, players: List[Player], window=None, seed: int = None
+    ) -> GameRecord:
+        """
+        Play a single game
+
+        Args:
+            players (list): the players, in playing order
+            window (BoardDisplay): the window displaying the board, if any
+            seed (int): the seed of the game, the players random generators
+                are seeded from it, None to keep their generators
+
+        Returns:
+            GameRecord: the record of the game
+        """
+        game = self.iter_game(players, window, seed)
+        try:
+            player, method_name, args = next(game)
+            while True:
+                player, method_name, args = game.send(
+                    getattr(player, method_name)(*args)
+                )
+        except StopIteration as game_end:
+            return game_end.value
+
+    def iter_game(self, players: List[Player], window=None, seed: int = None):
+        """
+        Run the turns of a game, shared by play_game and
+        AsyncTester.play_game_async: the requests to the players are yielded
+        as (player, method name, arguments) and their answers are sent back.
+
+        Args:
+            players (list): the players, in playing order
+            window (BoardDisplay): the window displaying the board, if any
+            seed (int): the seed of the game, the players random generators
+                are seeded from it, None to keep their generators
+
+        Returns:
+            GameRecord: the record of the game, as the generator return value
+        """
+        if seed is not None:
+            seed_players(players, seed)
+        for player in players:
+            player.new_game()
+
+        nb_players = len(players)
+        player_names = [player.name() for player in players]
+        record = GameRecord(player_names)
+
+        # Initialize the board
+        board = Board(nb_players)
+
+        # Placement the pawns
+        for pawn_nb, current_pawn in enumerate(board.pawns):
+            board_copy = board.copy()
+            # If pawn_nb == 1, the player_nb is 0, if pawn_nb == 2, the
+            # player_nb is 1, if pawn_nb == 3, the player_nb is 0, etc.
+            player_nb = (pawn_nb) % nb_players
+            player = players[player_nb]
+
+            # Ask the player where to place the pawn
+            self.display_message(
+                f"Player '{player.name()}' is placing pawn {pawn_nb + 1}", 2
+            )
+            position_choice = yield player, "place_pawn", (board_copy, current_pawn)
+
+            # Place the pawn
+            success, reason = board.place_pawn(position_choice)
+
+            if not success:
                 self.display_message(
-                    f"   Pawn moved at position {move_choice}\
-                      and built at position {build_choice}",
-                    2,
+                    f"   Pawn placed at an invalid position: {reason}", 1
                 )
-                self.display_message(board, 2)
-
-                # Update the board display
-                if window and self.display_board:
-                    update_board(window, board)
-
-                    # Sleep between moves
-                    if self.delay_between_moves > 0:
-                        sleep(self.delay_between_moves)
-
-            # Game is over
-            winner_number = board.winner_player_number
-            if winner_number is None:
-                self.display_message("Draw")
-            else:
-                winner_player_name = players[winner_number - 1].name()
-                self.display_message(f"Player '{winner_player_name}' wins!")
-                dic_win_lose_type[winner_player_name] = register_new_victory_type(
-                    dic_win_lose_type[winner_player_name],
-                    reason,
+                self.display_message(f"   Player '{player.name()}' loses")
+                record.loser_name = player.name()
+                record.winner_number = (player_nb + 1) % nb_players + 1
+                record.winner_name = player_names[record.winner_number - 1]
+                record.reason = f"Pawn placed at an invalid position: {reason}"
+                return record
+
+            record.placements.append(position_choice)
+
+            self.display_message(f"   Pawn placed at position {position_choice}", 2)
+            if self.display_board and window is not None:
+                window.show(board)
+                if self.delay_between_moves > 0:
+                    sleep(self.delay_between_moves)
+
+        # Play the game
+        self.display_message("\nPlaying the game")
+        while not board.is_game_over():
+            current_player = players[board.player_turn - 1]
+            board_copy = board.copy()
+
+            # Ask the player where to move the pawn
+            self.display_message(
+                f"Player '{current_player.name()}' is moving a pawn", 2
+            )
+            pawn_nb, move_choice, build_choice = yield (
+                current_player,
+                "play_move",
+                (board_copy,),
+            )
+
+            # Move the pawn
+            success, reason = board.play_move(pawn_nb, move_choice, build_choice)
+
+            if not success:
+                self.display_message(
+                    f"   Pawn moved at an invalid position: {reason}", 1
                 )
+                self.display_message(f"   Player '{current_player.name()}' loses")
+
+                # The next player wins
+                record.loser_name = current_player.name()
+                record.winner_number = board.player_turn % nb_players + 1
+                record.winner_name = player_names[record.winner_number - 1]
+                record.reason = reason
+                return record
+
+            record.moves.append((pawn_nb, move_choice, build_choice))
+
+            # Log the move details
+            self.display_message(
+                f"   Pawn moved at position {move_choice}\
+                  and built at position {build_choice}",
+                2,
+            )
+            self.display_message(board, 2)
+
+            # Update the board display
+            if window and self.display_board:
+                window.show(board)
+
+                # Sleep between moves
+                if self.delay_between_moves > 0:
+                    sleep(self.delay_between_moves)
+
+        # Game is over
+        winner_number = board.winner_player_number
+        if winner_number is None:
+            self.display_message("Draw")
+        else:
+            record.winner_number = winner_number
+            record.winner_name = player_names[winner_number - 1]
+            record.reason = reason
+            self.display_message(f"Player '{record.winner_name}' wins!")
+
+        return record
+
+    def register_game(
+        self, record: GameRecord, nb_victories, dic_win_lose_type, on_game_end=None
+    ):
+        """
+        Count the result of a game and save its record
 
-                nb_victories[winner_player_name] += 1
+        Args:
+            record (GameRecord): the record of the game
+            nb_victories (dict): the number of victories for each player
+            dic_win_lose_type (dict): the winning and loosing conditions counters
+            on_game_end (callable): a function called with the record
+        """
+        if record.winner_name is not None:
+            nb_victories[record.winner_name] += 1
+
+        # Invalid actions are counted for the loser, other reasons for the winner
+        reason_player_name = record.loser_name or record.winner_name
+        if reason_player_name is not None:
+            dic_win_lose_type[reason_player_name] = register_new_victory_type(
+                dic_win_lose_type[reason_player_name], record.reason
+            )
+
+        if self.records_path is not None:
+            append_record(self.records_path, record)
+        if on_game_end is not None:
+            on_game_end(record)
+
+    def display_results(self, nb_victories, nb_games_played):
+        """
+        Display the number of victories of each player
 
-        # Display the results
+        Args:
+            nb_victories (dict): the number of victories for each player
+            nb_games_played (int): the number of games played
+        """
         print("\nResults:")
-        print(
-            f"Player {players[0].name()} won {nb_victories[players[0].name()]}\
- time{'s' if nb_victories[players[0].name()] != 1 else ''} ("
-            + str(round(nb_victories[players[0].name()] / nb_games * 100, 2))
-            + "%)"
-        )
-        print(
-            f"Player {players[1].name()} won {nb_victories[players[1].name()]}\
- time{'s' if nb_victories[players[1].name()] != 1 else ''} ("
-            + str(round(nb_victories[players[1].name()] / nb_games * 100, 2))
-            + "%)"
-        )
+        for player_name, player_victories in nb_victories.items():
+            print(
+                f"Player {player_name} won {player_victories}\
+ time{'s' if player_victories != 1 else ''} ("
+                + str(round(player_victories / max(nb_games_played, 1) * 100, 2))
+                + "%)"
+            )
 
-        # Close the window
-        if self.display_board:
-            close_window(window)
 
-        return nb_victories, dic_win_lose_type
+def get_game_seed(seed: int, game_nb: int) -> int:
+    """
+    Get the seed of a game of a match
+
+    Args:
+        seed (int): the seed of the match
+        game_nb (int): the index of the game in the match, from 0
+
+    Returns:
+        int: the seed of the game
+    """
+    return seed * 1_000_003 + game_nb
+
+
+def seed_players(players: List[Player], seed: int):
+    """
+    Give each player a random generator of its own, seeded from the game seed
+    and the seat of the player
+
+    Args:
+        players (list): the players, in playing order
+        seed (int): the seed of the game
+    """
+    for seat, player in enumerate(players, 1):
+        player.rng = random.Random(seed * 4 + seat)
+
+
+def play_seated_game(
+    tester: Tester,
+    players: List[Player],
+    seed: int = None,
+    game_nb: int = 0,
+    window=None,
+):
+    """
+    Play a game after giving each player the number of its seat,
+    used to run the games of Tester.play_match in worker processes
+
+    Args:
+        tester (Tester): the tester playing the game
+        players (list): the players, in playing order
+        seed (int): the seed of the game, if any
+        game_nb (int): the index of the game in the match, from 0
+        window (BoardDisplay): the window displaying the board, if any
+
+    Returns:
+        GameRecord: the record of the game
+    """
+    for seat, player in enumerate(players, 1):
+        player.player_number = seat
+
+    return tester.play_match_game(players, game_nb, window, seed)
 
 
 def register_new_victory_type(dic_win_lose_types, s_msg):
@@ -239,3 +700,114 @@ def register_new_victory_type(dic_win_lose_types, s_msg):
         dic_win_lose_types[s_msg] = 1
 
     return dic_win_lose_types
+
+
+def get_checkpoint_path(checkpoint_dir, player_names):
+    """
+    Get the checkpoint file of a match between the given players
+
+    Args:
+        checkpoint_dir (str): the directory containing the checkpoints
+        player_names (list): the names of the players, in playing order
+
+    Returns:
+        str: the path of the checkpoint file
+    """
+    file_name = "_vs_".join(re.sub(r"[^\w-]+", "_", name) for name in player_names)
+    return os.path.join(checkpoint_dir, file_name + ".json")
+
+
+def get_checkpoint_match(players: List[Player], nb_games: int, seed: int) -> dict:
+    """
+    Get the settings of a match a checkpoint can only be resumed with:
+    the number of games, the seed and the version of each player
+    (see result_cache.get_player_version)
+
+    Args:
+        players (list): the players, in playing order
+        nb_games (int): the number of games of the match
+        seed (int): the seed of the match, if any
+
+    Returns:
+        dict: the settings of the match
+    """
+    return {
+        "nb_games": nb_games,
+        "seed": seed,
+        "player_versions": [get_player_version(player) for player in players],
+    }
+
+
+def save_checkpoint(
+    checkpoint_path,
+    player_names,
+    nb_games_played,
+    nb_victories,
+    dic_win_lose_type,
+    match=None,
+):
+    """
+    Save the progress of a match, so that it can be resumed after an interruption.
+    The file is replaced atomically, a crash while saving keeps the previous one.
+
+    Args:
+        checkpoint_path (str): the path of the checkpoint file
+        player_names (list): the names of the players, in playing order
+        nb_games_played (int): the number of games already played
+        nb_victories (dict): the number of victories for each player
+        dic_win_lose_type (dict): the winning and loosing conditions counters
+        match (dict): the settings of the match, see get_checkpoint_match
+    """
+    checkpoint = {
+        "player_names": player_names,
+        "match": match,
+        "nb_games_played": nb_games_played,
+        "nb_victories": nb_victories,
+        "dic_win_lose_type": dic_win_lose_type,
+    }
+
+    checkpoint_dir = os.path.dirname(checkpoint_path)
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path, player_names, match=None):
+    """
+    Load the progress of a match saved with save_checkpoint
+
+    Args:
+        checkpoint_path (str): the path of the checkpoint file
+        player_names (list): the names of the players, in playing order
+        match (dict): the settings of the resumed match, see
+            get_checkpoint_match
+
+    Returns:
+        dict: the checkpoint content, None if there is no checkpoint
+        for these players
+
+    Raises:
+        ValueError: if the checkpoint was saved by a match with other
+            settings, its results can't be mixed with the resumed match
+    """
+    if not os.path.isfile(checkpoint_path):
+        return None
+
+    with open(checkpoint_path) as f:
+        checkpoint = json.load(f)
+
+    if checkpoint["player_names"] != player_names:
+        return None
+
+    if checkpoint.get("match") != match:
+        raise ValueError(
+            f"The checkpoint {checkpoint_path} was saved by a match with other "
+            f"settings (number of games, seed or players code): "
+            f"{checkpoint.get('match')}, remove it to start a new match"
+        )
+
+    return checkpoint
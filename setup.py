@@ -18,4 +18,6 @@ setup(
     keywords=["santorini", "ai", "boardgame"],
     python_requires=">=3.6",
     install_requires=["pysimplegui"],
+    extras_require={"numpy": ["numpy"]},
+    entry_points={"console_scripts": ["santorinai=santorinai.cli:main"]},
 )
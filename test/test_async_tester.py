@@ -0,0 +1,123 @@
+# Test file for async_tester.py
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from santorinai.async_tester import AsyncPlayer, AsyncTester, SocketPlayer, serve_player
+from santorinai.board import Board
+from santorinai.player_examples.basic_player import BasicPlayer
+from santorinai.player_examples.first_choice_player import FirstChoicePlayer
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.tester import Tester
+
+
+class SlowFirstChoicePlayer(AsyncPlayer):
+    def __init__(self, player_number, log_level=0):
+        super().__init__(player_number, log_level)
+        self.player = FirstChoicePlayer(player_number)
+
+    def name(self):
+        return "Slow First"
+
+    async def place_pawn(self, board, pawn):
+        await asyncio.sleep(0.001)
+        return self.player.place_pawn(board, pawn)
+
+    async def play_move(self, board):
+        await asyncio.sleep(0.001)
+        self.player.player_number = board.player_turn
+        return self.player.play_move(board)
+
+
+class TestAsyncTester(unittest.IsolatedAsyncioTestCase):
+    async def test_play_match_async(self):
+        tester = AsyncTester()
+        tester.verbose_level = 0
+
+        records = []
+        wins, details = await tester.play_match_async(
+            [SlowFirstChoicePlayer(1), RandomPlayer(2), BasicPlayer(3)],
+            nb_games=9,
+            max_concurrent_games=4,
+            on_game_end=records.append,
+        )
+
+        self.assertEqual(sum(wins.values()), 9)
+        self.assertEqual(len(records), 9)
+        for record in records:
+            self.assertEqual(len(record.placements), 6)
+
+    async def test_play_match_async_settings(self):
+        tester = AsyncTester()
+        tester.verbose_level = 0
+        tester.seed = 5
+
+        async def play():
+            records = []
+            players = [RandomPlayer(2), BasicPlayer(2)]
+            await tester.play_match_async(
+                players, nb_games=6, max_concurrent_games=3, on_game_end=records.append
+            )
+            # The players get their number back
+            self.assertEqual([player.player_number for player in players], [2, 2])
+            return [record.to_dict() for record in records]
+
+        # The games are seeded as in Tester.play_match
+        records = await play()
+        self.assertEqual(await play(), records)
+        seeded_records = []
+        sync_tester = Tester()
+        sync_tester.verbose_level = 0
+        sync_tester.seed = 5
+        sync_tester.play_match(
+            [RandomPlayer(2), BasicPlayer(2)],
+            nb_games=6,
+            on_game_end=seeded_records.append,
+        )
+        self.assertEqual([record.to_dict() for record in seeded_records], records)
+
+        # The match is profiled
+        with tempfile.TemporaryDirectory() as profile_dir:
+            tester.profile_dir = profile_dir
+            await play()
+            with open(os.path.join(profile_dir, "report.txt")) as f:
+                self.assertIn("basic_player.py", f.read())
+
+        # The names are checked
+        unnamed_player = RandomPlayer(1)
+        unnamed_player.name = lambda: ""
+        with self.assertRaises(ValueError):
+            await tester.play_match_async([unnamed_player, BasicPlayer(2)])
+
+    async def test_socket_player(self):
+        server = await serve_player(BasicPlayer(1), latency=0.001)
+        host, port = server.sockets[0].getsockname()[:2]
+
+        socket_player = SocketPlayer(1, host, port)
+        self.assertEqual(await socket_player.fetch_name(), "Extra BaThick!")
+
+        # A full board is sent with every request
+        board = Board(2)
+        board.place_pawn((2, 2))
+        position = await socket_player.place_pawn(board, board.pawns[1])
+        self.assertTrue(board.is_position_valid(position)[0])
+        self.assertNotEqual(position, (2, 2))
+
+        tester = AsyncTester()
+        tester.verbose_level = 0
+        wins, _ = await tester.play_match_async(
+            [socket_player, RandomPlayer(2)], nb_games=20, max_concurrent_games=10
+        )
+
+        self.assertEqual(sum(wins.values()), 20)
+        self.assertGreater(wins["Extra BaThick!"], wins["Randy Random"])
+
+        # The games waited for the server at the same time
+        self.assertGreater(socket_player.nb_connections, 1)
+        self.assertLessEqual(socket_player.nb_connections, 10)
+
+        await socket_player.close()
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,26 @@
+# Test file for benchmarks/run.py
+
+import json
+import unittest
+
+from benchmarks.run import BENCHMARKS, format_results, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_run_benchmarks(self):
+        results = run_benchmarks(repeat=2, warmup=0, nb_games=2, min_time=0)
+
+        self.assertEqual(set(results["benchmarks"]), set(BENCHMARKS))
+        self.assertEqual(results["metadata"]["repeat"], 2)
+        for result in results["benchmarks"].values():
+            self.assertEqual(len(result["samples"]), 2)
+            self.assertGreater(result["median"], 0)
+            self.assertGreater(result["ops_per_second"], 0)
+
+        # The results are JSON serializable
+        self.assertEqual(json.loads(json.dumps(results)), results)
+        self.assertIn("board.copy", format_results(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
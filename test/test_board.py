@@ -1,8 +1,42 @@
 # Test file for board.py
 
+import copy
+import pickle
+import random
 import unittest
+from collections import Counter
 
-from santorinai.board import Board
+from santorinai.board import (
+    ADJACENCY_MASKS,
+    DIRECTION_SQUARES,
+    NEIGHBOURS,
+    SQUARE_BITS,
+    SQUARES,
+    Board,
+)
+
+
+class AnnotatedBoard(Board):
+    # A board subclass, not pickled with the encoding of the boards
+    comment = None
+
+
+class TestBoardTables(unittest.TestCase):
+    def test_tables(self):
+        self.assertEqual(len(SQUARES), 25)
+        self.assertEqual(len(NEIGHBOURS[(0, 0)]), 3)
+        self.assertEqual(len(NEIGHBOURS[(0, 2)]), 5)
+        self.assertEqual(len(NEIGHBOURS[(2, 2)]), 8)
+        self.assertEqual(DIRECTION_SQUARES[(2, 2)][(1, -1)], (3, 1))
+        self.assertNotIn((-1, 0), DIRECTION_SQUARES[(0, 0)])
+
+        for x1, y1 in SQUARES:
+            for x2, y2 in SQUARES:
+                adjacent = max(abs(x1 - x2), abs(y1 - y2)) == 1
+                self.assertEqual((x2, y2) in NEIGHBOURS[(x1, y1)], adjacent)
+                self.assertEqual(
+                    bool(ADJACENCY_MASKS[(x1, y1)] & SQUARE_BITS[(x2, y2)]), adjacent
+                )
 
 
 class TestBoardTwoPlayers(unittest.TestCase):
@@ -132,6 +166,250 @@ class TestBoardTwoPlayers(unittest.TestCase):
         board_copy.pawns[0].pos = (1, 1)
         self.assertNotEqual(board_copy.pawns[0].pos, board.pawns[0].pos)
 
+    def test_from_repr(self):
+        board = Board(self.NB_PLAYERS)
+        for position in [(0, 0), (1, 1), (4, 4), (3, 2)]:
+            board.place_pawn(position)
+        board.play_move(1, (0, 1), (0, 2))
+
+        parsed_board = Board.from_repr(repr(board), board.player_turn)
+        self.assertEqual(parsed_board.board, board.board)
+        self.assertEqual(
+            [pawn.pos for pawn in parsed_board.pawns],
+            [pawn.pos for pawn in board.pawns],
+        )
+        self.assertEqual(parsed_board.player_turn, 2)
+        self.assertEqual(parsed_board.nb_players, 2)
+        self.assertTrue(parsed_board.is_pawn_on_position((0, 1)))
+
+        self.assertRaises(ValueError, Board.from_repr, "_0 _0")
+        self.assertRaises(ValueError, Board.from_repr, repr(board).replace("_0", "_7"))
+        self.assertRaises(ValueError, Board.from_repr, repr(board), 3)
+
+    def test_text(self):
+        board = Board(self.NB_PLAYERS)
+        text = board.to_text()
+        self.assertEqual(text.split()[1:], ["-" * board.nb_pawns, "1", "1", "-"])
+        self.assertEqual(Board.from_text(text).to_text(), text)
+
+        for position in [(0, 0), (1, 1), (4, 4), (3, 2)]:
+            board.place_pawn(position)
+        board.board[2][3] = 4
+        board.play_move(1, (0, 1), (0, 2))
+
+        text = board.to_text()
+        parsed_board = Board.from_text(text)
+        self.assertEqual(parsed_board.to_text(), text)
+        self.assertEqual(repr(parsed_board), repr(board))
+        self.assertEqual(parsed_board.nb_players, self.NB_PLAYERS)
+        self.assertEqual(parsed_board.player_turn, board.player_turn)
+        self.assertEqual(parsed_board.turn_number, board.turn_number)
+        self.assertEqual(parsed_board.board[2][3], 4)
+        self.assertTrue(parsed_board.is_pawn_on_position((0, 1)))
+        self.assertEqual(
+            [pawn.pos for pawn in parsed_board.get_player_pawns(1)],
+            [pawn.pos for pawn in board.get_player_pawns(1)],
+        )
+
+        # The parsed board can be played
+        pawn = parsed_board.get_player_pawns(parsed_board.player_turn)[0]
+        move, build = next(parsed_board.iter_actions(pawn))
+        self.assertTrue(parsed_board.play_move(pawn.order, move, build)[0])
+
+        levels, pawns, player_turn, turn_number, winner = text.split()
+        for invalid_text in [
+            "",
+            f"{levels} {pawns} {player_turn} {turn_number}",
+            f"{levels.replace('0', '5', 1)} {pawns} {player_turn} 1 -",
+            f"{levels[:-1]} {pawns} {player_turn} 1 -",
+            f"{levels} {pawns[:-1]} {player_turn} 1 -",
+            f"{levels} {pawns[0] * len(pawns)} {player_turn} 1 -",
+            f"{levels} {'z' * len(pawns)} {player_turn} 1 -",
+            f"{levels} {pawns} 4 1 -",
+            f"{levels} {pawns} {player_turn} x -",
+            f"{levels} {pawns} {player_turn} 1 0",
+        ]:
+            self.assertRaises(ValueError, Board.from_text, invalid_text)
+
+    def test_bytes(self):
+        board = Board(self.NB_PLAYERS)
+        for position in [(0, 0), (1, 1), (4, 4)]:
+            board.place_pawn(position)
+        self.assertEqual(Board.from_bytes(board.to_bytes()).to_text(), board.to_text())
+
+        board.place_pawn((3, 2))
+        board.board[2][3] = 4
+        board.play_move(1, (0, 1), (0, 2))
+        board.winner_player_number = 2
+
+        data = board.to_bytes()
+        self.assertEqual(len(data), 36)
+        parsed_board = Board.from_bytes(data)
+        self.assertEqual(parsed_board.to_text(), board.to_text())
+        self.assertEqual(parsed_board.to_bytes(), data)
+        self.assertEqual(parsed_board.winner_player_number, 2)
+
+        # Pickle and deepcopy use the encoding
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            pickled_board = pickle.loads(pickle.dumps(board, protocol))
+            self.assertEqual(pickled_board.to_text(), board.to_text())
+        self.assertLess(len(pickle.dumps(board)), 100)
+        copied_board = copy.deepcopy(board)
+        self.assertEqual(copied_board.to_text(), board.to_text())
+        copied_board.board[0][0] = 1
+        self.assertEqual(board.board[0][0], 0)
+
+        # A pickled pawn keeps its board
+        pawn = pickle.loads(pickle.dumps(board.pawns[0]))
+        self.assertEqual(pawn.pos, (0, 1))
+        self.assertIs(pawn.board.occupancy[(0, 1)], pawn)
+
+        for invalid_data in [
+            data[:-1],
+            b"\x05" + data[1:],
+            data[:25] + b"\x04" + data[26:],
+            data[:26] + b"\x00" * 6 + data[32:],
+            data[:26] + b"\x19" + data[27:],
+            data[:32] + b"\x03" + data[33:],
+        ]:
+            self.assertRaises(ValueError, Board.from_bytes, invalid_data)
+
+    def test_pickle_not_encodable(self):
+        board = AnnotatedBoard(self.NB_PLAYERS)
+        for position in [(0, 0), (1, 1), (4, 4), (3, 2)]:
+            board.place_pawn(position)
+        board.play_move(1, (0, 1), (0, 2))
+        board.comment = "A good move"
+        self.assertFalse(board.is_encodable())
+
+        # The subclasses and their attributes are kept
+        copied_boards = [copy.deepcopy(board)] + [
+            pickle.loads(pickle.dumps(board, protocol))
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1)
+        ]
+        for copied_board in copied_boards:
+            self.assertIs(type(copied_board), AnnotatedBoard)
+            self.assertEqual(copied_board.comment, "A good move")
+            self.assertEqual(copied_board.to_text(), board.to_text())
+            self.assertIs(copied_board.occupancy[(0, 1)].board, copied_board)
+
+        # Their pawns keep their board too
+        pawn = pickle.loads(pickle.dumps(board.pawns[0]))
+        self.assertIs(type(pawn.board), AnnotatedBoard)
+        self.assertIs(pawn.board.occupancy[(0, 1)], pawn)
+
+        # The extra attributes of a board are kept
+        board = Board(self.NB_PLAYERS)
+        self.assertTrue(board.is_encodable())
+        board.comment = "Empty"
+        self.assertFalse(board.is_encodable())
+        self.assertEqual(pickle.loads(pickle.dumps(board)).comment, "Empty")
+
+        # Only the boards of 2 or 3 players are encoded
+        board = Board(1)
+        self.assertFalse(board.is_encodable())
+        self.assertRaises(ValueError, board.to_bytes)
+        self.assertEqual(pickle.loads(pickle.dumps(board)).nb_players, 1)
+
+    def test_occupancy(self):
+        board = Board(self.NB_PLAYERS)
+        board.place_pawn((0, 0))
+        board.place_pawn((1, 1))
+        self.assertTrue(board.is_pawn_on_position((0, 0)))
+        self.assertTrue(board.is_pawn_on_position([1, 1]))
+        self.assertFalse(board.is_pawn_on_position((None, None)))
+
+        # The index follows the pawns however they move
+        board.pawns[0].move((0, 1))
+        board.pawns[1].pos = (2, 2)
+        self.assertEqual(
+            board.occupancy, {(0, 1): board.pawns[0], (2, 2): board.pawns[1]}
+        )
+
+        # The copy has its own index
+        board_copy = board.copy()
+        board_copy.pawns[0].move((0, 2))
+        self.assertTrue(board.is_pawn_on_position((0, 1)))
+        self.assertFalse(board_copy.is_pawn_on_position((0, 1)))
+        self.assertIs(board_copy.occupancy[(0, 2)], board_copy.pawns[0])
+
+        # A detached copy of a pawn does not change the board
+        pawn_copy = board.pawns[0].copy()
+        pawn_copy.move((4, 4))
+        self.assertFalse(board.is_pawn_on_position((4, 4)))
+
+        self.assertEqual(board.get_player_pawns(1), [board.pawns[0], board.pawns[2]])
+        self.assertIs(board.get_first_unplaced_player_pawn(1), board.pawns[2])
+        self.assertIsNone(board.get_first_unplaced_player_pawn(4))
+
+    def test_iter_actions(self):
+        board = Board(self.NB_PLAYERS)
+        pawn = board.pawns[0]
+        self.assertEqual(
+            list(board.iter_actions(pawn)),
+            [
+                (position, None)
+                for position in board.get_possible_movement_positions(pawn)
+            ],
+        )
+
+        for position in [(0, 0), (1, 1), (4, 4), (0, 2)]:
+            board.place_pawn(position)
+        board.board[1][0] = 4
+
+        # The actions are the moves followed by the builds from the new position
+        expected_actions = []
+        for move in board.get_possible_movement_positions(pawn):
+            board_copy = board.copy()
+            board_copy.pawns[0].move(move)
+            for build in board_copy.get_possible_building_positions(
+                board_copy.pawns[0]
+            ):
+                expected_actions.append((move, build))
+
+        actions = board.iter_actions(pawn)
+        self.assertEqual(next(actions), expected_actions[0])
+        self.assertEqual(pawn.pos, (0, 0))
+        self.assertEqual(list(actions), expected_actions[1:])
+        self.assertEqual(pawn.pos, (0, 0))
+        self.assertIn(((0, 1), (0, 0)), expected_actions)
+
+    def test_sample_random_move(self):
+        board = Board(self.NB_PLAYERS)
+        for position in [(0, 0), (1, 1), (4, 4), (2, 1)]:
+            board.place_pawn(position)
+        board.board[0][1] = 4
+        board.board[1][2] = 2
+        board.board[3][3] = 1
+
+        # Every action is drawn, as often as the others
+        actions = []
+        for pawn in board.get_player_pawns(board.player_turn):
+            actions += [
+                (pawn.order, move, build)
+                for move, build in board.get_possible_movement_and_building_positions(
+                    pawn
+                )
+            ]
+
+        rng = random.Random(0)
+        nb_draws = 200 * len(actions)
+        counts = Counter(board.sample_random_move(rng) for _ in range(nb_draws))
+        self.assertEqual(set(counts), set(actions))
+        for count in counts.values():
+            self.assertAlmostEqual(count / nb_draws, 1 / len(actions), delta=0.01)
+
+        # The sampled moves can be played
+        for _ in range(20):
+            board_copy = board.copy()
+            self.assertTrue(board_copy.play_move(*board.sample_random_move(rng))[0])
+
+        # A stuck player has no move
+        for pawn in board.get_player_pawns(board.player_turn):
+            for x, y in board.get_adjacent_positions(pawn.pos):
+                board.board[x][y] = 4
+        self.assertEqual(board.sample_random_move(rng), (None, None, None))
+
 
 class TestBoardThreePlayers(unittest.TestCase):
     NB_PLAYERS = 3
@@ -175,6 +453,17 @@ class TestBoardThreePlayers(unittest.TestCase):
         self.assertEqual(self.board.pawns[5].number, 6)
         self.assertEqual(self.board.pawns[5].player_number, 3)
 
+    def test_bytes(self):
+        for position in [(0, 0), (1, 1), (4, 4), (3, 2), (2, 0)]:
+            self.board.place_pawn(position)
+
+        data = self.board.to_bytes()
+        self.assertEqual(len(data), 36)
+        board = pickle.loads(pickle.dumps(self.board))
+        self.assertEqual(board.nb_players, 3)
+        self.assertEqual(board.to_text(), self.board.to_text())
+        self.assertEqual(Board.from_bytes(data).to_bytes(), data)
+
 
 class TestBoardTwoPlayersGame(unittest.TestCase):
     NB_PLAYERS = 2
@@ -0,0 +1,91 @@
+# Test file for board_displayer.py
+
+import multiprocessing
+import unittest
+
+from santorinai.board import Board
+from santorinai.board_displayer.board_displayer import (
+    get_latest,
+    put_latest,
+    update_board,
+)
+
+
+class FakeGraph:
+    # Records the figures drawn, as a PySimpleGUI Graph would display them
+
+    def __init__(self):
+        self.figures = []
+        self.nb_drawn = 0
+
+    def draw(self, *args, **kwargs):
+        self.nb_drawn += 1
+        self.figures.append(self.nb_drawn)
+        return self.nb_drawn
+
+    draw_polygon = DrawOval = DrawText = draw
+
+    def erase(self):
+        self.figures = []
+
+    def delete_figure(self, figure):
+        self.figures.remove(figure)
+
+    def bring_figure_to_front(self, figure):
+        self.figures.remove(figure)
+        self.figures.append(figure)
+
+
+class FakeWindow:
+    def __init__(self):
+        self.graph = FakeGraph()
+        self.metadata = None
+
+    def __getitem__(self, key):
+        return self.graph
+
+    def read(self, timeout=None):
+        return "__TIMEOUT__", {}
+
+
+class TestBoardDisplayer(unittest.TestCase):
+    def test_update_board(self):
+        window = FakeWindow()
+        board = Board(2)
+        for position in [(0, 0), (1, 1), (4, 4), (3, 3)]:
+            board.place_pawn(position)
+
+        self.assertFalse(update_board(window, board))
+        # The plane, a cube per tile and 3 figures per pawn
+        nb_figures = 1 + 25 * 3 + 4 * 3
+        self.assertEqual(len(window.graph.figures), nb_figures)
+
+        # Nothing changed, nothing is drawn
+        update_board(window, board)
+        self.assertEqual(window.graph.nb_drawn, nb_figures)
+
+        # Only the two tiles of the move and the build are drawn again
+        board.play_move(1, (0, 1), (0, 2))
+        update_board(window, board)
+        self.assertEqual(window.graph.nb_drawn, nb_figures + 3 + (3 + 3) + 6)
+        self.assertEqual(len(window.graph.figures), nb_figures + 3)
+
+        # The tiles in front of a drawn tile stay in front
+        tile_figures = window.metadata["figures"]
+        self.assertLess(
+            window.graph.figures.index(tile_figures[(0, 2)][-1]),
+            window.graph.figures.index(tile_figures[(0, 1)][0]),
+        )
+
+    def test_latest_frame_queue(self):
+        frames = multiprocessing.Queue(2)
+
+        # The producer never waits, the oldest frames are dropped
+        for frame in range(10):
+            put_latest(frames, frame)
+        self.assertEqual(get_latest(frames, timeout=1), 9)
+        self.assertIsNone(get_latest(frames, timeout=0.01))
+
+        put_latest(frames, 10)
+        self.assertEqual(get_latest(frames, timeout=1), 10)
+        frames.close()
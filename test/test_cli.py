@@ -0,0 +1,76 @@
+# Test file for cli.py
+
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from santorinai.cli import main
+from santorinai.game_record import append_record
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.tester import Tester
+
+BOARD = """
+_0 _0 _0 _0 40
+_0 _0 _0 _0 _0
+_0 _0 _0 _0 _0
+_0 _3 _0 _0 30
+12 _0 _0 _0 20
+"""
+
+
+class TestCli(unittest.TestCase):
+    def run_main(self, args):
+        output = StringIO()
+        with redirect_stdout(output):
+            main(args)
+        return output.getvalue()
+
+    def test_analyze_board(self):
+        with tempfile.TemporaryDirectory() as directory:
+            board_path = os.path.join(directory, "board.txt")
+            with open(board_path, "w") as f:
+                f.write(BOARD)
+
+            output = self.run_main(
+                ["analyze", "--board", board_path, "--time", "0.5", "--workers", "1"]
+            )
+            self.assertIn("Best move: P1 pawn 1 to (1, 1)", output)
+            self.assertIn("Score: win in 1 plies", output)
+            self.assertIn("nodes/s", output)
+
+            # There is no player 3 in a 2 players game
+            with redirect_stderr(StringIO()):
+                with self.assertRaises(SystemExit):
+                    main(["analyze", "--board", board_path, "--turn", "3"])
+
+    def test_analyze_record(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        with tempfile.TemporaryDirectory() as directory:
+            records_path = os.path.join(directory, "records.jsonl")
+            for seed in range(2):
+                record = tester.play_game([RandomPlayer(1), RandomPlayer(2)], seed=seed)
+                append_record(records_path, record)
+
+            output = self.run_main(
+                [
+                    "analyze",
+                    "--record",
+                    records_path,
+                    "--game",
+                    "1",
+                    "--ply",
+                    "10",
+                    "--max-depth",
+                    "1",
+                    "--workers",
+                    "1",
+                ]
+            )
+            self.assertIn("Depth: 1", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
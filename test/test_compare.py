@@ -0,0 +1,87 @@
+# Test file for benchmarks/compare.py
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+from benchmarks.compare import bootstrap_ratio, compare_results, main
+
+
+def make_results(medians, seed=0):
+    # Fake benchmark results, 20 noisy samples around each median
+    rng = random.Random(seed)
+    benchmarks = {}
+    for name, median in medians.items():
+        samples = [median * rng.uniform(0.98, 1.02) for _ in range(20)]
+        benchmarks[name] = {"samples": samples, "median": median}
+    return {"metadata": {}, "benchmarks": benchmarks}
+
+
+class TestCompare(unittest.TestCase):
+    def test_bootstrap_ratio(self):
+        base = make_results({"board.copy": 1.0})["benchmarks"]["board.copy"]
+        new = make_results({"board.copy": 1.5}, seed=1)["benchmarks"]["board.copy"]
+
+        ratio, lower, upper = bootstrap_ratio(base["samples"], new["samples"])
+        self.assertLess(lower, ratio)
+        self.assertLess(ratio, upper)
+        self.assertAlmostEqual(ratio, 1.5, delta=0.05)
+        self.assertGreater(lower, 1.4)
+
+    def test_compare_results(self):
+        base = make_results(
+            {"board.copy": 1.0, "board.play_move": 1.0, "selfplay.games": 1.0}
+        )
+        new = make_results(
+            {"board.copy": 1.2, "board.play_move": 1.01, "selfplay.games": 2.0},
+            seed=1,
+        )
+
+        comparisons = {c["name"]: c for c in compare_results(base, new, 0.05)}
+        self.assertTrue(comparisons["board.copy"]["regression"])
+        # Below the threshold
+        self.assertFalse(comparisons["board.play_move"]["regression"])
+        # Not a gated module
+        self.assertFalse(comparisons["selfplay.games"]["regression"])
+
+        # A larger threshold
+        comparisons = compare_results(base, new, 0.5)
+        self.assertFalse(any(c["regression"] for c in comparisons))
+
+    def test_reference(self):
+        base = make_results({"board.copy": 1.0, "reference.python_loop": 1.0})
+        # The whole machine is 50% slower during the new run
+        new = make_results({"board.copy": 1.5, "reference.python_loop": 1.5}, seed=1)
+
+        comparisons = compare_results(base, new)
+        self.assertEqual([c["name"] for c in comparisons], ["board.copy"])
+        self.assertFalse(comparisons[0]["regression"])
+        self.assertAlmostEqual(comparisons[0]["change"], 0, delta=0.05)
+
+        comparisons = compare_results(base, new, reference=None)
+        self.assertTrue(comparisons[0]["regression"])
+
+    def test_main(self):
+        base = make_results({"board.copy": 1.0, "tester.random_games": 1.0})
+        new = make_results({"board.copy": 1.0, "tester.random_games": 1.3}, seed=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, results in [("base", base), ("new", new)]:
+                paths.append(os.path.join(directory, name + ".json"))
+                with open(paths[-1], "w") as f:
+                    json.dump(results, f)
+
+            with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                self.assertEqual(main(paths), 1)
+                self.assertEqual(main(paths + ["--threshold", "0.5"]), 0)
+                self.assertEqual(main(paths + ["--modules", "board"]), 0)
+                self.assertEqual(main([paths[0], paths[0]]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# Test file for distributed.py
+
+import json
+import socket
+import threading
+import unittest
+
+from santorinai.distributed import Coordinator, load_player, run_worker
+from santorinai.player_examples.random_player import RandomPlayer
+
+PLAYER_SPECS = [
+    "santorinai.player_examples.random_player:RandomPlayer",
+    "santorinai.player_examples.first_choice_player:FirstChoicePlayer",
+]
+
+
+class TestDistributed(unittest.TestCase):
+    def test_load_player(self):
+        player = load_player(PLAYER_SPECS[0], 2)
+        self.assertIsInstance(player, RandomPlayer)
+        self.assertEqual(player.player_number, 2)
+
+    def test_invalid_players(self):
+        self.assertRaises(ValueError, Coordinator, PLAYER_SPECS[:1], 10)
+        self.assertRaises(ValueError, Coordinator, PLAYER_SPECS[:1] * 2, 10)
+
+    def test_match(self):
+        coordinator = Coordinator(PLAYER_SPECS, nb_games=20, seed=42)
+        coordinator.tester.verbose_level = 0
+        host, port = coordinator.address
+
+        records = []
+        results = {}
+
+        def run_coordinator():
+            results["match"] = coordinator.run(on_game_end=records.append)
+
+        coordinator_thread = threading.Thread(target=run_coordinator)
+        coordinator_thread.start()
+
+        # A worker leaves without answering, its game is given to another one
+        with socket.create_connection((host, port)) as lost_worker:
+            job = json.loads(lost_worker.makefile().readline())
+            self.assertEqual(job["game_nb"], 0)
+            self.assertEqual(job["players"], PLAYER_SPECS)
+
+        nb_games_played = []
+        workers = [
+            threading.Thread(
+                target=lambda: nb_games_played.append(run_worker(host, port))
+            )
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        coordinator_thread.join()
+
+        wins, details = results["match"]
+        self.assertEqual(sum(wins.values()), 20)
+        self.assertEqual(sum(nb_games_played), 20)
+        self.assertEqual(len(records), 20)
+
+        # The seats are rotated
+        first_players = [record.player_names[0] for record in records]
+        self.assertEqual(first_players.count("Randy Random"), 10)
@@ -0,0 +1,124 @@
+# Test file for evaluation.py
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from santorinai.board import Board
+from santorinai.tester import Tester
+from santorinai.player_examples.random_player import RandomPlayer
+
+if np is not None:
+    from santorinai.evaluation import (
+        compute_features,
+        encode_boards,
+        evaluate_actions,
+        evaluate_positions,
+        get_child_positions,
+    )
+    from santorinai.player_examples.one_ply_player import OnePlyPlayer
+
+
+def get_random_board(rng, nb_players=2, nb_moves=8):
+    board = Board(nb_players)
+    for pawn in board.pawns:
+        board.place_pawn(rng.choice(board.get_possible_movement_positions(pawn)))
+    for _ in range(nb_moves):
+        action = board.sample_random_move(rng)
+        if board.is_game_over() or action[0] is None:
+            break
+        board.play_move(*action)
+    return board
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestEvaluation(unittest.TestCase):
+    def test_encode_boards(self):
+        board = Board(2)
+        board.place_pawn((1, 2))
+        board.board[4][3] = 2
+
+        levels, pawn_squares = encode_boards([board, Board(2)])
+        self.assertEqual(levels.shape, (2, 25))
+        self.assertEqual(levels[0, 4 * 5 + 3], 2)
+        self.assertEqual(levels[1].sum(), 0)
+        self.assertEqual(pawn_squares.tolist(), [[7, -1, -1, -1], [-1] * 4])
+
+    def test_compute_features(self):
+        rng = random.Random(0)
+        for nb_players in [2, 3]:
+            boards = [get_random_board(rng, nb_players) for _ in range(20)]
+            levels, pawn_squares = encode_boards(boards)
+            features = compute_features(levels, pawn_squares, 1, nb_players)
+
+            for board_nb, board in enumerate(boards):
+                # The mobility is the one given by the board
+                own_mobility, opponents_mobility = [], []
+                for pawn in board.pawns:
+                    mobility = len(board.get_possible_movement_positions(pawn))
+                    if pawn.player_number == 1:
+                        own_mobility.append(mobility)
+                    else:
+                        opponents_mobility.append(mobility)
+
+                self.assertAlmostEqual(
+                    features["mobility"][board_nb],
+                    np.mean(own_mobility) - np.mean(opponents_mobility),
+                )
+
+    def test_get_child_positions(self):
+        board = get_random_board(random.Random(1))
+        board.board[0][0] = 3
+        actions, levels, pawn_squares = get_child_positions(board)
+        self.assertEqual(len(actions), len(levels))
+
+        # The children are the boards after each action
+        for action, child_levels, child_pawn_squares in zip(
+            actions, levels, pawn_squares
+        ):
+            child = board.copy()
+            self.assertTrue(child.play_move(*action)[0])
+            expected_levels, expected_pawn_squares = encode_boards([child])
+            if child.winner_player_number is None:
+                self.assertEqual(child_levels.tolist(), expected_levels[0].tolist())
+            self.assertEqual(
+                child_pawn_squares.tolist(), expected_pawn_squares[0].tolist()
+            )
+
+    def test_evaluate_actions(self):
+        board = Board(2)
+        for position in [(0, 0), (4, 4), (0, 4), (4, 0)]:
+            board.place_pawn(position)
+        board.board[1][1] = 1
+        board.board[4][2] = 2
+        board.board[4][1] = 3
+
+        # Player 1 climbs
+        actions, scores = evaluate_actions(board)
+        self.assertEqual(actions[scores.argmax()][:2], (1, (1, 1)))
+
+        board.board[0][1] = 2
+        board.board[1][1] = 3
+        board.board[0][0] = 2
+        # Player 1 wins
+        actions, scores = evaluate_actions(board)
+        self.assertEqual(actions[scores.argmax()][:2], (1, (1, 1)))
+
+        # A batch is scored as the positions one by one
+        levels, pawn_squares = get_child_positions(board)[1:]
+        for index in [0, len(levels) - 1]:
+            self.assertAlmostEqual(
+                evaluate_positions(levels[[index]], pawn_squares[[index]], 1, 2)[0],
+                scores[index],
+            )
+
+    def test_one_ply_player(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.seed = 0
+        wins, _ = tester.play_match([OnePlyPlayer(1), RandomPlayer(2)], nb_games=10)
+        self.assertGreaterEqual(wins["Ollie One Ply"], 9)
@@ -0,0 +1,32 @@
+# Test file for game_record.py
+
+import os
+import tempfile
+import unittest
+
+from santorinai.game_record import GameRecord, append_record, load_records
+
+
+class TestGameRecord(unittest.TestCase):
+    def test_save_load(self):
+        record = GameRecord(["Player 1", "Player 2"])
+        record.placements = [(0, 0), (0, 1), (1, 0), (1, 1)]
+        record.moves = [(1, (0, 0), (0, 1)), (2, (2, 2), None)]
+        record.winner_name = "Player 2"
+        record.reason = "The player pawn reached the top of a tower."
+
+        self.assertEqual(
+            GameRecord.from_dict(record.to_dict()).to_dict(), record.to_dict()
+        )
+
+        with tempfile.TemporaryDirectory() as records_dir:
+            records_path = os.path.join(records_dir, "records.jsonl")
+            append_record(records_path, record)
+            append_record(records_path, GameRecord(["Player 3", "Player 1"]))
+
+            records = list(load_records(records_path))
+            self.assertEqual(len(records), 2)
+            self.assertEqual(records[0].to_dict(), record.to_dict())
+            self.assertEqual(records[0].moves[1], (2, (2, 2), None))
+            self.assertEqual(records[1].player_names, ["Player 3", "Player 1"])
+            self.assertIsNone(records[1].winner_name)
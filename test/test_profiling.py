@@ -0,0 +1,56 @@
+# Test file for profiling.py
+
+import os
+import pstats
+import tempfile
+import unittest
+
+from santorinai.player_examples.basic_player import BasicPlayer
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.profiling import ENGINE, get_time_split
+from santorinai.tester import Tester
+
+
+class TestProfiling(unittest.TestCase):
+    def play_profiled_match(self, profile_dir, workers):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.profile_dir = profile_dir
+        tester.profile_every = 2
+        players = [BasicPlayer(1), RandomPlayer(2)]
+        tester.play_match(players, nb_games=6, workers=workers)
+        return players
+
+    def test_profile_match(self):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            players = self.play_profiled_match(profile_dir, workers=1)
+
+            # Games 0, 2 and 4 are profiled
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(profile_dir, "games"))),
+                ["game_000000.prof", "game_000002.prof", "game_000004.prof"],
+            )
+
+            stats = pstats.Stats(os.path.join(profile_dir, "merged.prof"))
+            split = dict(get_time_split(stats, players))
+            self.assertEqual(set(split), {ENGINE, players[0].name(), players[1].name()})
+            self.assertAlmostEqual(sum(split.values()), stats.total_tt)
+
+            with open(os.path.join(profile_dir, "report.txt")) as f:
+                report = f.read()
+            self.assertIn("Profile of 3 games", report)
+            self.assertIn("basic_player.py", report)
+
+    def test_profile_workers(self):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            # The profiles of a previous match are removed
+            self.play_profiled_match(profile_dir, workers=1)
+            self.play_profiled_match(profile_dir, workers=2)
+
+            self.assertEqual(len(os.listdir(os.path.join(profile_dir, "games"))), 3)
+            with open(os.path.join(profile_dir, "report.txt")) as f:
+                self.assertIn("Profile of 3 games", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# Test file for ratings.py
+
+import unittest
+
+from santorinai.game_record import GameRecord
+from santorinai.ratings import Ratings
+
+
+class TestRatings(unittest.TestCase):
+    def test_new_player(self):
+        ratings = Ratings()
+        rating = ratings.get("New player")
+        self.assertEqual(rating.rating, 1500)
+        self.assertEqual(rating.deviation, 350)
+        self.assertEqual(rating.nb_games, 0)
+        self.assertEqual(rating.confidence_interval(), (814, 2186))
+
+    def test_add_result(self):
+        ratings = Ratings()
+        self.assertEqual(ratings.expected_score("A", "B"), 0.5)
+
+        ratings.add_result("A", "B", 1)
+        a, b = ratings.get("A"), ratings.get("B")
+        self.assertGreater(a.rating, 1500)
+        self.assertLess(b.rating, 1500)
+        self.assertAlmostEqual(a.rating + b.rating, 3000)
+        self.assertLess(a.deviation, 350)
+        self.assertEqual(a.nb_games, 1)
+        self.assertGreater(ratings.expected_score("A", "B"), 0.5)
+
+        # A draw between equal players changes nothing but the uncertainty
+        ratings.add_result("C", "D", 0.5)
+        self.assertEqual(ratings.get("C").rating, 1500)
+        self.assertLess(ratings.get("C").deviation, 350)
+
+    def test_convergence(self):
+        ratings = Ratings()
+        # A wins 75% of its games against B, which wins 75% against C
+        for _ in range(200):
+            for winner, loser in [("A", "B"), ("B", "C")] * 3 + [("B", "A")]:
+                ratings.add_game([winner, loser], winner)
+            ratings.add_game(["B", "C"], "C")
+
+        leaderboard = ratings.leaderboard()
+        self.assertEqual([name for name, _ in leaderboard], ["A", "B", "C"])
+
+        # 75% expected score is about 190 Elo points
+        a, b, c = [rating for _, rating in leaderboard]
+        self.assertAlmostEqual(a.rating - b.rating, 190, delta=40)
+        self.assertAlmostEqual(b.rating - c.rating, 190, delta=40)
+        self.assertLess(a.deviation, 50)
+
+    def test_add_game_three_players(self):
+        ratings = Ratings()
+        ratings.add_game(["A", "B", "C"], "B")
+        self.assertEqual(ratings.leaderboard()[0][0], "B")
+        self.assertEqual(ratings.get("B").nb_games, 2)
+        self.assertEqual(ratings.get("A").nb_games, 1)
+
+        ratings.add_game(["A", "B", "C"], None)
+        self.assertEqual(ratings.get("A").nb_games, 3)
+
+    def test_add_records(self):
+        records = []
+        for winner_name in ["A", "B", "A", "A"]:
+            record = GameRecord(["A", "B"])
+            record.winner_name = winner_name
+            records.append(record)
+
+        ratings = Ratings()
+        ratings.add_records(iter(records))
+        self.assertGreater(ratings.get("A").rating, ratings.get("B").rating)
+        self.assertIn("| 1 | A |", repr(ratings))
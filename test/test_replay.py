@@ -0,0 +1,90 @@
+# Test file for replay.py
+
+import random
+import unittest
+
+from santorinai.board_displayer.svg_renderer import get_game_boards
+from santorinai.game_record import GameRecord
+from santorinai.player_examples.basic_player import BasicPlayer
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.replay import Replay
+from santorinai.tester import Tester
+
+
+def get_board_state(board):
+    return (
+        [row[:] for row in board.board],
+        [pawn.pos for pawn in board.pawns],
+        dict((pos, pawn.number) for pos, pawn in board.occupancy.items()),
+        board.turn_number,
+        board.player_turn,
+        board.winner_player_number,
+    )
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.display_board = False
+        self.record = tester.play_game([RandomPlayer(1), RandomPlayer(2)], seed=3)
+        self.states = [get_board_state(board) for board in get_game_boards(self.record)]
+
+    def test_seek(self):
+        replay = Replay(self.record, snapshot_interval=4)
+        self.assertEqual(replay.nb_plies, len(self.states) - 1)
+        self.assertEqual(get_board_state(replay.board), self.states[-1])
+
+        plies = list(range(replay.nb_plies + 1)) * 3
+        random.Random(0).shuffle(plies)
+        for ply in plies:
+            board = replay.seek(ply)
+            self.assertEqual(replay.ply, ply)
+            self.assertEqual(get_board_state(board), self.states[ply])
+
+        # The snapshots are not modified by the seeks
+        self.assertEqual(get_board_state(replay.seek(0)), self.states[0])
+
+    def test_step(self):
+        replay = Replay(self.record)
+        replay.seek(0)
+        for ply in range(1, replay.nb_plies + 1):
+            self.assertEqual(get_board_state(replay.step()), self.states[ply])
+        self.assertEqual(get_board_state(replay.step()), self.states[-1])
+        self.assertEqual(get_board_state(replay.step(-1)), self.states[-2])
+        self.assertEqual(get_board_state(replay.seek(-5)), self.states[0])
+
+    def test_winning_move(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        record = tester.play_game([BasicPlayer(1), RandomPlayer(2)], seed=0)
+        # The basic player wins without giving a build position
+        self.assertEqual(record.moves[-1][2], (None, None))
+        states = [get_board_state(board) for board in get_game_boards(record)]
+
+        replay = Replay(record, snapshot_interval=4)
+        self.assertEqual(replay.nb_plies, len(states) - 1)
+        self.assertEqual(get_board_state(replay.board), states[-1])
+        self.assertEqual(replay.board.winner_player_number, 1)
+        for ply in range(replay.nb_plies, -1, -1):
+            self.assertEqual(get_board_state(replay.seek(ply)), states[ply])
+
+        self.assertNotIn("builds", replay.get_ply_description(replay.nb_plies))
+
+    def test_invalid_action(self):
+        record = GameRecord(["Player 1", "Player 2"])
+        record.placements = [(0, 0), (0, 1), (4, 4), (4, 3)]
+        # The pawn is not adjacent to the move position
+        record.moves = [(1, (0, 1), (0, 2)), (1, (3, 3), (3, 2))]
+        record.loser_name = "Player 1"
+
+        replay = Replay(record)
+        self.assertEqual(replay.nb_plies, 4)
+        self.assertEqual(replay.get_ply_description(0), "Game start")
+        self.assertEqual(
+            replay.get_ply_description(1), "Player 1 places pawn 1 on (0, 0)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
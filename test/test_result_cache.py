@@ -0,0 +1,192 @@
+# Test file for result_cache.py
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from santorinai import result_cache
+from santorinai.game_record import GameRecord
+from santorinai.result_cache import ResultCache, get_game_key, get_player_version
+from santorinai.tester import Tester
+from santorinai.player_examples.basic_player import BasicPlayer
+from santorinai.player_examples.first_choice_player import FirstChoicePlayer
+from santorinai.player_examples.random_player import RandomPlayer
+
+
+class CountingRandomPlayer(RandomPlayer):
+    nb_placements = 0
+
+    def place_pawn(self, board, pawn):
+        CountingRandomPlayer.nb_placements += 1
+        return super().place_pawn(board, pawn)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.cache_dir.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_get_game_key(self):
+        players = [RandomPlayer(1), FirstChoicePlayer(2)]
+        key = get_game_key(players, 1)
+        self.assertEqual(key, get_game_key([RandomPlayer(1), FirstChoicePlayer(2)], 1))
+        self.assertNotEqual(key, get_game_key(players, 2))
+        self.assertNotEqual(key, get_game_key(players[::-1], 1))
+        self.assertNotEqual(key, get_game_key([RandomPlayer(1), BasicPlayer(2)], 1))
+
+        # A new version of a player changes the key
+        players[0].version = "2.0"
+        self.assertEqual(get_player_version(players[0]), "2.0")
+        self.assertNotEqual(key, get_game_key(players, 1))
+
+    def test_player_version_mro(self):
+        with tempfile.TemporaryDirectory() as module_dir:
+            base_path = os.path.join(module_dir, "version_base_player.py")
+            with open(base_path, "w") as f:
+                f.write(
+                    "from santorinai.player_examples.random_player import "
+                    "RandomPlayer\n\n\nclass BasePlayer(RandomPlayer):\n"
+                    "    pass\n"
+                )
+            sys.path.insert(0, module_dir)
+            try:
+                base_module = importlib.import_module("version_base_player")
+
+                class DerivedPlayer(base_module.BasePlayer):
+                    pass
+
+                version = get_player_version(DerivedPlayer(1))
+
+                # A change of the base class changes the version
+                with open(base_path, "a") as f:
+                    f.write("    depth = 2\n")
+                self.assertNotEqual(get_player_version(DerivedPlayer(1)), version)
+            finally:
+                sys.path.remove(module_dir)
+                sys.modules.pop("version_base_player", None)
+
+    def test_player_version_installed(self):
+        with tempfile.TemporaryDirectory() as lib_dir:
+            # A player installed in the site-packages of the standard library
+            packages_dir = os.path.join(lib_dir, "site-packages")
+            os.makedirs(packages_dir)
+            player_path = os.path.join(packages_dir, "installed_player.py")
+            source = (
+                "from santorinai.player_examples.random_player import "
+                "RandomPlayer\n\n\nclass InstalledPlayer(RandomPlayer):\n"
+                "    def play_move(self, board):\n"
+                "        return super().play_move(board)\n"
+            )
+            with open(player_path, "w") as f:
+                f.write(source)
+
+            sys.path.insert(0, packages_dir)
+            try:
+                with mock.patch.multiple(
+                    result_cache,
+                    STDLIB_PATH=lib_dir + os.sep,
+                    PACKAGES_PATHS=(packages_dir + os.sep,),
+                ):
+                    module = importlib.import_module("installed_player")
+                    version = get_player_version(module.InstalledPlayer(1))
+
+                    # A new release changes a method body
+                    with open(player_path, "w") as f:
+                        f.write(source.replace("super().play_move(board)", "None"))
+                    self.assertNotEqual(
+                        get_player_version(module.InstalledPlayer(1)), version
+                    )
+            finally:
+                sys.path.remove(packages_dir)
+                sys.modules.pop("installed_player", None)
+
+    def test_put_get(self):
+        cache = ResultCache(self.cache_path)
+        record = GameRecord(["A", "B"])
+        record.winner_name = "B"
+        record.moves = [(1, (0, 0), (0, 1))]
+
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", record)
+        self.assertEqual(cache.get("key").to_dict(), record.to_dict())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.close()
+
+        # The records are kept on disk
+        cache = ResultCache(self.cache_path)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("key").winner_name, "B")
+        cache.close()
+
+    def test_play_1v1_cache(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.seed = 7
+        tester.result_cache = ResultCache(self.cache_path)
+
+        players = [CountingRandomPlayer(1), BasicPlayer(2)]
+        CountingRandomPlayer.nb_placements = 0
+        results = tester.play_1v1(*players, nb_games=4)
+        self.assertEqual(CountingRandomPlayer.nb_placements, 4 * 2)
+        self.assertEqual(len(tester.result_cache), 4)
+
+        # Every game is found in the cache
+        CountingRandomPlayer.nb_placements = 0
+        self.assertEqual(tester.play_1v1(*players, nb_games=4), results)
+        self.assertEqual(CountingRandomPlayer.nb_placements, 0)
+
+    def test_eviction(self):
+        record = GameRecord(["A", "B"])
+        record_size = len("key00") + len(json.dumps(record.to_dict()))
+
+        cache = ResultCache(self.cache_path, max_size=10 * record_size)
+        for i in range(10):
+            cache.put(f"key{i:02}", record)
+        self.assertEqual(len(cache), 10)
+
+        # The recently used records are kept
+        cache.get("key00")
+        for i in range(10, 15):
+            cache.put(f"key{i:02}", record)
+
+        self.assertLessEqual(cache.size, cache.max_size)
+        self.assertEqual(len(cache), 10)
+        self.assertIsNotNone(cache.get("key00"))
+        self.assertIsNone(cache.get("key01"))
+        self.assertIsNotNone(cache.get("key14"))
+        cache.close()
+
+    def test_play_match_cache(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.seed = 7
+        tester.result_cache = ResultCache(self.cache_path)
+
+        players = [CountingRandomPlayer(1), BasicPlayer(2)]
+        CountingRandomPlayer.nb_placements = 0
+        results = tester.play_match(players, nb_games=6)
+        self.assertEqual(CountingRandomPlayer.nb_placements, 6 * 2)
+
+        # Every game is found in the cache
+        CountingRandomPlayer.nb_placements = 0
+        self.assertEqual(tester.play_match(players, nb_games=6), results)
+        self.assertEqual(CountingRandomPlayer.nb_placements, 0)
+
+        # Only the games of the updated player are played again
+        players[1].version = "2.0"
+        tester.play_match(players + [FirstChoicePlayer(3)], nb_games=3)
+        tester.play_match(players, nb_games=8)
+        self.assertEqual(CountingRandomPlayer.nb_placements, 3 * 2 + 8 * 2)
+        self.assertEqual(len(tester.result_cache), 6 + 3 + 8)
+
+        # The cached results are the results of the same seeded games
+        tester.result_cache = None
+        players[1].version = None
+        self.assertEqual(tester.play_match(players, nb_games=6), results)
@@ -0,0 +1,100 @@
+# Test file for search.py
+
+import unittest
+
+from santorinai.board import Board
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.replay import Replay
+from santorinai.search import WIN_SCORE, Searcher, analyze, to_position
+from santorinai.tester import Tester
+
+
+def get_board_actions(board):
+    # The actions of the playing player, as returned by the searcher
+    actions = set()
+    for pawn in board.get_player_pawns(board.player_turn):
+        for move, build in board.iter_actions(pawn):
+            if board.board[move[0]][move[1]] == 3:
+                build = None
+            actions.add((pawn.order, move, build))
+    return actions
+
+
+class TestSearch(unittest.TestCase):
+    def test_get_actions(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        for seed in range(5):
+            record = tester.play_game([RandomPlayer(1), RandomPlayer(2)], seed=seed)
+            replay = Replay(record)
+            for ply in range(4, replay.nb_plies):
+                board = replay.seek(ply)
+                searcher = Searcher.from_board(board)
+                actions = {
+                    (order, to_position(move), to_position(build))
+                    for order, move, build in searcher.get_actions(board.player_turn)
+                }
+                self.assertEqual(actions, get_board_actions(board))
+
+    def test_win_in_one(self):
+        board = Board.from_repr("""
+            _0 _0 _0 _0 40
+            _0 _0 _0 _0 _0
+            _0 _0 _0 _0 _0
+            _0 _3 _0 _0 30
+            12 _0 _0 _0 20
+            """)
+        result = analyze(board, time_limit=1)
+        self.assertEqual(result["best_action"], (1, (1, 1), None))
+        self.assertEqual(result["score"], WIN_SCORE - 1)
+        self.assertEqual(len(result["pv"]), 1)
+
+    def test_block_opponent(self):
+        # Player 2 climbs on (1, 1) next turn if player 1 does not build on it
+        board = Board.from_repr("""
+            _0 _0 _0 _0 40
+            _0 _0 _0 _0 _0
+            _0 _0 10 _0 _0
+            _0 _3 _0 _0 _0
+            22 _0 _0 _0 30
+            """)
+        result = analyze(board, time_limit=10, max_depth=2)
+        self.assertEqual(result["depth"], 2)
+        self.assertEqual(result["best_action"][2], (1, 1))
+        self.assertGreater(result["score"], -WIN_SCORE // 2)
+
+    def test_workers(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        record = tester.play_game([RandomPlayer(1), RandomPlayer(2)], seed=1)
+        board = Replay(record).seek(12)
+
+        result = analyze(board, time_limit=60, workers=1, max_depth=2)
+        parallel_result = analyze(board, time_limit=60, workers=2, max_depth=2)
+        self.assertEqual(parallel_result["score"], result["score"])
+        self.assertEqual(parallel_result["depth"], 2)
+        self.assertGreater(parallel_result["nodes"], 0)
+
+    def test_workers_proven_loss(self):
+        # Only pawn 2 of player 1 can stop player 2 from climbing on (2, 3),
+        # the workers without its actions prove their loss quickly
+        board = Board.from_repr("""
+            30 _0 _0 _0 40
+            _0 _0 _3 _0 _0
+            _0 _0 22 _0 _0
+            _0 _0 _0 _0 _0
+            10 _0 _0 _0 _0
+            """)
+        result = analyze(board, time_limit=60, workers=1, max_depth=3)
+        parallel_result = analyze(board, time_limit=60, workers=4, max_depth=3)
+        self.assertEqual(result["depth"], 3)
+        self.assertEqual(parallel_result["depth"], 3)
+        self.assertEqual(parallel_result["score"], result["score"])
+        self.assertEqual(parallel_result["best_action"], result["best_action"])
+
+    def test_invalid_positions(self):
+        self.assertRaises(ValueError, analyze, Board(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
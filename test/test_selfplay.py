@@ -0,0 +1,181 @@
+# Test file for selfplay.py
+
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from santorinai.board import BOARD_SIZE, Board
+
+if np is not None:
+    from santorinai.selfplay import (
+        ACTION_SIZE,
+        SQUARE_PERMUTATIONS,
+        augment_samples,
+        generate_dataset,
+        get_action_index,
+        get_game_samples,
+        get_legal_action_mask,
+        play_selfplay_record,
+    )
+    from santorinai.tester import Tester
+    from santorinai.player_examples.basic_player import BasicPlayer
+    from santorinai.player_examples.random_player import RandomPlayer
+
+PLAYER_SPECS = [
+    "santorinai.player_examples.basic_player:BasicPlayer",
+    "santorinai.player_examples.random_player:RandomPlayer",
+]
+
+
+def decode_board(levels, pawns, player):
+    # Build the board of a sample
+    board = Board(len(pawns) // 2)
+    for square, level in enumerate(levels):
+        board.board[square // BOARD_SIZE][square % BOARD_SIZE] = int(level)
+    for pawn, square in zip(board.pawns, pawns):
+        pawn.pos = (int(square) // BOARD_SIZE, int(square) % BOARD_SIZE)
+    board.player_turn = int(player)
+    return board
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSelfplay(unittest.TestCase):
+    def test_get_legal_action_mask(self):
+        board = Board(2)
+        for position in [(0, 0), (2, 2), (4, 4), (1, 3)]:
+            board.place_pawn(position)
+        board.board[1][1] = 4
+
+        mask = get_legal_action_mask(board)
+        self.assertEqual(mask.shape, (ACTION_SIZE,))
+        nb_actions = sum(
+            len(board.get_possible_movement_and_building_positions(pawn))
+            for pawn in board.get_player_pawns(1)
+        )
+        self.assertEqual(mask.sum(), nb_actions)
+
+        # Pawn 2 moves up then builds up
+        self.assertTrue(mask[get_action_index(2, (4, 4), (4, 3), (4, 2))])
+        self.assertFalse(mask[get_action_index(1, (0, 0), (1, 1), (1, 2))])
+
+    def test_game_samples(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        record = tester.play_game([BasicPlayer(1), RandomPlayer(2)], seed=5)
+
+        samples = get_game_samples(record, 2)
+        self.assertEqual(len(samples["action"]), len(record.moves))
+        self.assertTrue(
+            samples["mask"][np.arange(len(record.moves)), samples["action"]].all()
+        )
+        self.assertEqual(
+            set(samples["outcome"][samples["player"] == 1]),
+            {1 if record.winner_name == "Extra BaThick!" else -1},
+        )
+
+        # The symmetric positions have the symmetric legal actions
+        augmented = augment_samples(samples)
+        self.assertEqual(len(augmented["action"]), 8 * len(record.moves))
+        rng = random.Random(0)
+        for index in rng.sample(range(len(augmented["action"])), 20):
+            board = decode_board(
+                augmented["levels"][index],
+                augmented["pawns"][index],
+                augmented["player"][index],
+            )
+            self.assertEqual(
+                get_legal_action_mask(board).tolist(), augmented["mask"][index].tolist()
+            )
+            self.assertTrue(augmented["mask"][index, augmented["action"][index]])
+
+        # The first symmetry is the identity
+        self.assertEqual(SQUARE_PERMUTATIONS[0].tolist(), list(range(25)))
+
+    def test_winning_move_build(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        seed = 0
+        while True:
+            record = tester.play_game([BasicPlayer(1), RandomPlayer(2)], seed=seed)
+            if record.reason == "The player pawn reached the top of a tower.":
+                break
+            seed += 1
+        samples = get_game_samples(record, 2)
+
+        # The build of a winning move is not checked, it can be anywhere
+        pawn_order, move, _ = record.moves[-1]
+        far_build = (4 - move[0], 4 - move[1])
+        for build in [far_build, None]:
+            record.moves[-1] = (pawn_order, move, build)
+            far_samples = get_game_samples(record, 2)
+            self.assertEqual(far_samples["action"].tolist(), samples["action"].tolist())
+            self.assertTrue(far_samples["mask"][-1, far_samples["action"][-1]])
+
+    def test_same_player_seats(self):
+        spec = "santorinai.player_examples.basic_player:BasicPlayer"
+        winner_numbers = set()
+        outcomes = set()
+        for game_nb in range(10):
+            record = play_selfplay_record([spec, spec], game_nb, seed=3)
+            # Each seat has its own player, no invalid action is played
+            self.assertIsNone(record.loser_name)
+            winner_numbers.add(record.winner_number)
+
+            samples = get_game_samples(record, 2)
+            for player_number in [1, 2]:
+                player_outcomes = set(
+                    samples["outcome"][samples["player"] == player_number]
+                )
+                self.assertEqual(len(player_outcomes), 1)
+                outcomes |= player_outcomes
+            self.assertEqual(
+                set(samples["outcome"][samples["player"] == 1]),
+                {1 if record.winner_number == 1 else -1},
+            )
+
+        self.assertEqual(winner_numbers, {1, 2})
+        self.assertEqual(outcomes, {-1, 1})
+
+    def test_generate_dataset(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            stats = generate_dataset(
+                PLAYER_SPECS, 4, out_dir, shard_size=50, seed=1, augment=True
+            )
+            self.assertEqual(
+                stats["shard_paths"],
+                [
+                    os.path.join(out_dir, f"shard_{i:05}.npz")
+                    for i in range(len(stats["shard_paths"]))
+                ],
+            )
+
+            positions = set()
+            nb_samples = 0
+            for shard_nb, path in enumerate(stats["shard_paths"]):
+                shard = np.load(path)
+                size = len(shard["action"])
+                if shard_nb < len(stats["shard_paths"]) - 1:
+                    self.assertEqual(size, 50)
+                nb_samples += size
+                self.assertTrue(shard["mask"][np.arange(size), shard["action"]].all())
+                for levels, pawns, player in zip(
+                    shard["levels"], shard["pawns"], shard["player"]
+                ):
+                    positions.add((levels.tobytes(), pawns.tobytes(), int(player)))
+
+            # Every position is written once
+            self.assertEqual(nb_samples, stats["nb_samples"])
+            self.assertEqual(len(positions), nb_samples)
+            self.assertGreater(stats["positions_per_second"], 0)
+
+            # The games are the same with several workers
+            parallel_stats = generate_dataset(
+                PLAYER_SPECS, 4, out_dir, workers=2, shard_size=50, seed=1
+            )
+            self.assertEqual(parallel_stats["nb_samples"], stats["nb_samples"])
@@ -0,0 +1,51 @@
+# Test file for sprt.py
+
+import unittest
+
+from santorinai.sprt import SPRT, elo_to_score
+
+
+class TestSPRT(unittest.TestCase):
+    def test_elo_to_score(self):
+        self.assertEqual(elo_to_score(0), 0.5)
+        self.assertAlmostEqual(elo_to_score(400), 10 / 11)
+        self.assertAlmostEqual(elo_to_score(100) + elo_to_score(-100), 1)
+
+    def test_invalid_parameters(self):
+        self.assertRaises(ValueError, SPRT, 50, 0)
+        self.assertRaises(ValueError, SPRT, 0, 50, 0, 0.05)
+        self.assertRaises(ValueError, SPRT, 0, 50, 0.05, 1)
+
+    def test_add_result(self):
+        sprt = SPRT()
+        sprt.add_result(1)
+        sprt.add_result(0.5)
+        sprt.add_result(0)
+        sprt.add_result(0)
+        self.assertEqual((sprt.wins, sprt.draws, sprt.losses), (1, 1, 2))
+        self.assertEqual(sprt.nb_games, 4)
+        self.assertRaises(ValueError, sprt.add_result, 2)
+
+    def test_status(self):
+        sprt = SPRT(elo0=0, elo1=100)
+        self.assertEqual(sprt.llr(), 0)
+        self.assertIsNone(sprt.status())
+
+        # A draw is evidence for the weaker hypothesis
+        sprt.add_result(0.5)
+        self.assertLess(sprt.llr(), 0)
+
+        # Winning every game proves the player is stronger
+        for _ in range(100):
+            if sprt.status() is not None:
+                break
+            sprt.add_result(1)
+        self.assertEqual(sprt.status(), "H1")
+        self.assertLess(sprt.nb_games, 30)
+
+        # Losing every game proves the player is not stronger
+        sprt = SPRT(elo0=0, elo1=100)
+        while sprt.status() is None:
+            sprt.add_result(0)
+        self.assertEqual(sprt.status(), "H0")
+        self.assertGreaterEqual(sprt.llr(), sprt.lower_bound - sprt.win_llr)
@@ -0,0 +1,127 @@
+# Test file for subprocess_player.py
+
+import io
+import sys
+import unittest
+
+from santorinai.board import Board
+from santorinai.subprocess_player import SubprocessPlayer, engine_pool, serve_player
+from santorinai.tester import Tester
+from santorinai.player_examples.first_choice_player import FirstChoicePlayer
+from santorinai.player_examples.random_player import RandomPlayer
+
+ENGINE_COMMAND = [
+    sys.executable,
+    "-m",
+    "santorinai.subprocess_player",
+    "santorinai.player_examples.first_choice_player:FirstChoicePlayer",
+]
+
+
+class TestSubprocessPlayer(unittest.TestCase):
+    def test_position_updates(self):
+        player = SubprocessPlayer(2, ENGINE_COMMAND)
+        board = Board(2)
+        board.place_pawn((0, 0))
+
+        self.assertEqual(
+            player.position_updates(board),
+            ["newgame 2 2", "pawn 1 0 0", "turn 2 2"],
+        )
+
+        # Only the changes are sent
+        board.place_pawn((1, 1))
+        board.place_pawn((2, 2))
+        board.board[3][3] = 2
+        self.assertEqual(
+            player.position_updates(board),
+            ["level 3 3 2", "pawn 2 1 1", "pawn 3 2 2", "turn 2 4"],
+        )
+
+        # The turn number goes back: a new game started
+        board = Board(2)
+        board.place_pawn((4, 4))
+        self.assertEqual(
+            player.position_updates(board),
+            ["newgame 2 2", "pawn 1 4 4", "turn 2 2"],
+        )
+
+    def test_new_game_detection(self):
+        player = SubprocessPlayer(2, ENGINE_COMMAND)
+        board = Board(2)
+        for position in [(0, 0), (1, 1), (2, 2), (3, 3)]:
+            board.place_pawn(position)
+        board.board[0][1] = 2
+        board.turn_number = 5
+        player.position_updates(board)
+
+        # A new game whose first request has a higher turn number
+        new_board = Board(2)
+        for position in [(4, 4), (3, 4)]:
+            new_board.place_pawn(position)
+        new_board.turn_number = 9
+        self.assertEqual(player.position_updates(new_board)[0], "newgame 2 2")
+
+        # A level goes down
+        player.position_updates(board)
+        board = board.copy()
+        board.board[0][1] = 1
+        board.turn_number += 1
+        self.assertEqual(player.position_updates(board)[0], "newgame 2 2")
+
+        # Another seat
+        board.turn_number += 1
+        player.player_number = 1
+        self.assertEqual(player.position_updates(board)[0], "newgame 2 1")
+
+        # The Tester starts a new game
+        board.turn_number += 1
+        self.assertEqual(player.position_updates(board), ["turn 1 8"])
+        player.new_game()
+        self.assertEqual(player.position_updates(board)[0], "newgame 2 1")
+
+    def test_serve_player(self):
+        commands = io.StringIO(
+            "name\n"
+            "newgame 2 1\n"
+            "place 1\n"
+            "pawn 1 0 0\n"
+            "pawn 2 0 1\n"
+            "pawn 3 1 0\n"
+            "pawn 4 1 1\n"
+            "level 0 2 4\n"
+            "turn 1 5\n"
+            "move\n"
+            "quit\n"
+            "name\n"
+        )
+        answers = io.StringIO()
+        serve_player(FirstChoicePlayer(1), commands, answers)
+
+        # Pawn 1 can't move on (0, 2) nor on other pawns
+        self.assertEqual(
+            answers.getvalue().splitlines(),
+            ["Firsty First", "0 0", "1 - - - -"],
+        )
+
+    def test_play_match(self):
+        tester = Tester()
+        tester.verbose_level = 0
+
+        engine_player = SubprocessPlayer(1, ENGINE_COMMAND)
+        self.assertEqual(engine_player.name(), "Firsty First")
+        engine = engine_player.engine
+
+        wins, _ = tester.play_match([engine_player, RandomPlayer(2)], nb_games=4)
+        self.assertEqual(sum(wins.values()), 4)
+
+        # The engine is kept between games, then reused by the next player
+        self.assertIs(engine_player.engine, engine)
+        engine_player.close()
+        other_engine_player = SubprocessPlayer(1, ENGINE_COMMAND, name="Other")
+        other_engine_player.connect()
+        self.assertIs(other_engine_player.engine, engine)
+
+        other_engine_player.close()
+        engine_pool.close()
+        self.assertFalse(engine.is_alive())
@@ -0,0 +1,116 @@
+# Test file for svg_renderer.py
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from santorinai.board import Board
+from santorinai.board_displayer.svg_renderer import (
+    get_game_boards,
+    get_position_hash,
+    render_games,
+    render_svg,
+)
+from santorinai.board_displayer.geometry import get_tiles
+from santorinai.player_examples.random_player import RandomPlayer
+from santorinai.tester import Tester
+
+
+class TestSvgRenderer(unittest.TestCase):
+    def play_records(self, nb_games):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.display_board = False
+        players = [RandomPlayer(1), RandomPlayer(2)]
+        return [tester.play_game(players, seed=seed) for seed in range(nb_games)]
+
+    def test_headless_import(self):
+        # Without Tk, PySimpleGUI can't be imported
+        code = (
+            "import sys\n"
+            "sys.modules['tkinter'] = sys.modules['_tkinter'] = None\n"
+            "from santorinai.board import Board\n"
+            "from santorinai.board_displayer.svg_renderer import render_svg\n"
+            "from santorinai.player_examples.random_player import RandomPlayer\n"
+            "from santorinai.tester import Tester\n"
+            "tester = Tester()\n"
+            "tester.verbose_level = 0\n"
+            "from santorinai.player_examples.basic_player import BasicPlayer\n"
+            "tester.play_1v1(RandomPlayer(1), BasicPlayer(2), nb_games=2)\n"
+            "print(render_svg(Board(2))[:4])\n"
+            "print('PySimpleGUI' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split()[-2:], ["<svg", "False"])
+
+    def test_render_svg(self):
+        board = Board(2)
+        board.place_pawn((2, 2))
+        board.board[1][1] = 4
+
+        root = ElementTree.fromstring(render_svg(board))
+        self.assertTrue(root.tag.endswith("svg"))
+        tags = [element.tag.split("}")[-1] for element in root]
+        # The plane, 3 faces per cube, the pawn shadow, the pawn and its number
+        self.assertEqual(tags.count("polygon"), 1 + 3 * 25 + 3 * 4)
+        self.assertEqual(tags.count("ellipse"), 2)
+        self.assertEqual(tags.count("text"), 1)
+        self.assertNotIn("light grey", render_svg(board))
+
+    def test_position_hash(self):
+        board = Board(2)
+        empty_hash = get_position_hash(get_tiles(board))
+        self.assertEqual(empty_hash, get_position_hash(get_tiles(Board(2))))
+
+        board.place_pawn((0, 0))
+        self.assertNotEqual(empty_hash, get_position_hash(get_tiles(board)))
+
+    def test_get_game_boards(self):
+        record = self.play_records(1)[0]
+        boards = [board.copy() for board in get_game_boards(record)]
+        self.assertEqual(len(boards), 1 + len(record.placements) + len(record.moves))
+        self.assertEqual(boards[0].board, Board(2).board)
+
+    def test_render_games(self):
+        records = self.play_records(3)
+        nb_frames = sum(
+            1 + len(record.placements) + len(record.moves) for record in records
+        )
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            workers = 1 if sys.platform == "win32" else 2
+            games_frames = render_games(records, out_dir, workers=workers)
+            self.assertEqual(sum(len(frames) for frames in games_frames), nb_frames)
+
+            # The empty board is rendered once for the 3 games
+            self.assertEqual(len({frames[0] for frames in games_frames}), 1)
+            for frames in games_frames:
+                for path in frames:
+                    self.assertTrue(os.path.exists(path))
+
+            with open(os.path.join(out_dir, "game_00001.json")) as f:
+                names = json.load(f)
+            self.assertEqual(
+                names, [os.path.basename(path) for path in games_frames[1]]
+            )
+
+            # The frames already rendered are not written again
+            modified_times = {
+                path: os.path.getmtime(path)
+                for frames in games_frames
+                for path in frames
+            }
+            render_games(records, out_dir)
+            for path, modified_time in modified_times.items():
+                self.assertEqual(os.path.getmtime(path), modified_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,31 @@
 # Test file for tester.py
 
+import os
+import tempfile
 import unittest
 
-from santorinai.tester import Tester
+from santorinai.game_record import load_records
+from santorinai.sprt import SPRT
+from santorinai.tester import Tester, get_checkpoint_path
 from santorinai.player_examples.random_player import RandomPlayer
 from santorinai.player_examples.first_choice_player import FirstChoicePlayer
+from santorinai.player_examples.basic_player import BasicPlayer
+
+
+class MatchInterrupted(Exception):
+    pass
+
+
+class InterruptedPlayer(RandomPlayer):
+    # A random player interrupting the match at its n-th pawn placement
+    interrupt_at = None
+    nb_placements = 0
+
+    def place_pawn(self, board, pawn):
+        self.nb_placements += 1
+        if self.nb_placements == self.interrupt_at:
+            raise MatchInterrupted()
+        return super().place_pawn(board, pawn)
 
 
 class TestTester(unittest.TestCase):
@@ -22,3 +43,179 @@ class TestTester(unittest.TestCase):
         player1 = RandomPlayer(2)
         player2 = FirstChoicePlayer(2)
         tester.play_1v1(player1, player2, nb_games=10)
+
+    def test_play_1v1_checkpoint(self):
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            tester = Tester()
+            tester.verbose_level = 0
+            tester.checkpoint_dir = checkpoint_dir
+            tester.checkpoint_every = 2
+            tester.records_path = os.path.join(checkpoint_dir, "records.jsonl")
+
+            player1 = InterruptedPlayer(1)
+            player2 = FirstChoicePlayer(2)
+            checkpoint_path = get_checkpoint_path(
+                checkpoint_dir, [player1.name(), player2.name()]
+            )
+
+            # The match is interrupted during the 3rd game
+            ended_games = []
+            player1.interrupt_at = 5
+            with self.assertRaises(MatchInterrupted):
+                tester.play_1v1(
+                    player1, player2, nb_games=4, on_game_end=ended_games.append
+                )
+            self.assertTrue(os.path.isfile(checkpoint_path))
+            self.assertEqual(len(ended_games), 2)
+
+            # The checkpoint can't be resumed with other settings
+            self.assertRaises(ValueError, tester.play_1v1, player1, player2, 6)
+            tester.seed = 1
+            self.assertRaises(ValueError, tester.play_1v1, player1, player2, 4)
+            tester.seed = None
+
+            # Only the 2 last games are played, each game is recorded once
+            player1.interrupt_at = None
+            wins, _ = tester.play_1v1(
+                player1, player2, nb_games=4, on_game_end=ended_games.append
+            )
+            self.assertEqual(sum(wins.values()), 4)
+            self.assertEqual(len(ended_games), 4)
+            self.assertEqual(len(list(load_records(tester.records_path))), 4)
+
+            # The match is over, playing it again plays new games
+            self.assertFalse(os.path.isfile(checkpoint_path))
+            wins, _ = tester.play_1v1(
+                player1, player2, nb_games=4, on_game_end=ended_games.append
+            )
+            self.assertEqual(sum(wins.values()), 4)
+            self.assertEqual(len(ended_games), 8)
+
+    def test_play_1v1_sprt(self):
+        tester = Tester()
+        tester.verbose_level = 0
+
+        sprt = SPRT(elo0=0, elo1=100)
+        player1 = BasicPlayer(1)
+        player2 = RandomPlayer(2)
+        wins, _ = tester.play_1v1(player1, player2, nb_games=1000, sprt=sprt)
+
+        # The basic player is much stronger, no need to play every game
+        self.assertEqual(sprt.status(), "H1")
+        self.assertLess(sum(wins.values()), 1000)
+        self.assertEqual(sum(wins.values()), sprt.nb_games)
+
+    def test_play_1v1_records(self):
+        with tempfile.TemporaryDirectory() as records_dir:
+            tester = Tester()
+            tester.verbose_level = 0
+            tester.records_path = os.path.join(records_dir, "records.jsonl")
+
+            ended_games = []
+            player1 = RandomPlayer(1)
+            player2 = FirstChoicePlayer(2)
+            wins, _ = tester.play_1v1(
+                player1, player2, nb_games=5, on_game_end=ended_games.append
+            )
+
+            records = list(load_records(tester.records_path))
+            self.assertEqual(len(records), 5)
+            self.assertEqual(
+                [record.to_dict() for record in records],
+                [record.to_dict() for record in ended_games],
+            )
+            for record in records:
+                self.assertEqual(record.player_names, [player1.name(), player2.name()])
+                self.assertEqual(len(record.placements), 4)
+            self.assertEqual(
+                sum(record.winner_name == player1.name() for record in records),
+                wins[player1.name()],
+            )
+
+    def test_play_match_bad_players(self):
+        tester = Tester()
+        self.assertRaises(ValueError, tester.play_match, [RandomPlayer(1)])
+        self.assertRaises(TypeError, tester.play_match, [RandomPlayer(1), "Test"])
+        self.assertRaises(
+            ValueError, tester.play_match, [RandomPlayer(1), RandomPlayer(2)]
+        )
+
+    def test_play_match(self):
+        tester = Tester()
+        tester.verbose_level = 0
+
+        records = []
+        players = [RandomPlayer(1), FirstChoicePlayer(1), BasicPlayer(1)]
+        wins, details = tester.play_match(
+            players, nb_games=6, on_game_end=records.append
+        )
+
+        self.assertEqual(len(records), 6)
+        self.assertEqual(sum(wins.values()), 6)
+        self.assertEqual(set(details), set(wins))
+
+        # Each player starts the same number of games
+        first_players = [record.player_names[0] for record in records]
+        for player in players:
+            self.assertEqual(first_players.count(player.name()), 2)
+            self.assertEqual(player.player_number, 1)
+
+        for record in records:
+            self.assertEqual(len(record.placements), 6)
+
+    def test_play_match_workers(self):
+        tester = Tester()
+        tester.verbose_level = 0
+
+        records = []
+        players = [RandomPlayer(1), FirstChoicePlayer(2)]
+        wins, _ = tester.play_match(
+            players, nb_games=10, workers=2, on_game_end=records.append
+        )
+
+        self.assertEqual(sum(wins.values()), 10)
+        self.assertEqual(
+            [record.player_names[0] for record in records],
+            [player.name() for player in players] * 5,
+        )
+
+    def test_unseeded_workers(self):
+        tester = Tester()
+        tester.verbose_level = 0
+
+        records = []
+        players = [RandomPlayer(1), BasicPlayer(2)]
+        tester.play_match(players, nb_games=16, workers=2, on_game_end=records.append)
+
+        # The workers do not replay the same games
+        games = {(tuple(record.placements), tuple(record.moves)) for record in records}
+        self.assertGreater(len(games), 8)
+
+    def test_seed(self):
+        tester = Tester()
+        tester.verbose_level = 0
+        tester.seed = 3
+
+        def play(**kwargs):
+            records = []
+            players = [RandomPlayer(1), BasicPlayer(2)]
+            tester.play_match(players, nb_games=8, on_game_end=records.append, **kwargs)
+            return [record.to_dict() for record in records]
+
+        # The games only depend on the seed, even when played in parallel
+        records = play()
+        self.assertEqual(play(), records)
+        self.assertEqual(play(workers=2), records)
+
+        tester.seed = 4
+        self.assertNotEqual(play(), records)
+
+        # Every game of a play_1v1 match is seeded too
+        def play_1v1():
+            records = []
+            tester.play_1v1(
+                RandomPlayer(1), BasicPlayer(2), nb_games=4, on_game_end=records.append
+            )
+            return [record.to_dict() for record in records]
+
+        self.assertEqual(play_1v1(), play_1v1())